@@ -0,0 +1,34 @@
+"""Move cold job content out of line
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Compress description_md/raw_data with lz4 and push them into TOAST.
+    
+    A low toast_tuple_target moves the large columns out of the heap, so
+    list and aggregate scans only read the small hot columns. Existing rows
+    pick up the new layout as they are rewritten by updates.
+    """
+    op.execute("ALTER TABLE jobs ALTER COLUMN description_md SET COMPRESSION lz4")
+    op.execute("ALTER TABLE jobs ALTER COLUMN raw_data SET COMPRESSION lz4")
+    op.execute("ALTER TABLE jobs SET (toast_tuple_target = 128)")
+
+
+def downgrade():
+    """Restore default compression and TOAST threshold."""
+    op.execute("ALTER TABLE jobs RESET (toast_tuple_target)")
+    op.execute("ALTER TABLE jobs ALTER COLUMN raw_data SET COMPRESSION default")
+    op.execute("ALTER TABLE jobs ALTER COLUMN description_md SET COMPRESSION default")
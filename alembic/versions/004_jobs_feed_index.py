@@ -0,0 +1,29 @@
+"""Add keyset feed index for /jobs
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Index (country, is_active, posted_at, id) for cursor pagination."""
+    op.create_index(
+        'idx_jobs_feed',
+        'jobs',
+        ['country', 'is_active', 'posted_at', 'id'],
+    )
+
+
+def downgrade():
+    """Drop keyset feed index."""
+    op.drop_index('idx_jobs_feed', table_name='jobs')
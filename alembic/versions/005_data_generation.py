@@ -0,0 +1,32 @@
+"""Add data generation counter
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the single-row data_generation table."""
+    op.create_table(
+        'data_generation',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('generation', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+    op.execute("INSERT INTO data_generation (id, generation) VALUES (1, 0)")
+
+
+def downgrade():
+    """Drop data_generation table."""
+    op.drop_table('data_generation')
@@ -0,0 +1,47 @@
+"""Add job stats rollup table
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create job_stats_rollup and backfill it from jobs."""
+    op.create_table(
+        'job_stats_rollup',
+        sa.Column('country', sa.String(50), primary_key=True),
+        sa.Column('company', sa.String(255), primary_key=True),
+        sa.Column('category', sa.String(100), primary_key=True),
+        sa.Column('day', sa.Date(), primary_key=True),
+        sa.Column('is_active', sa.Boolean(), primary_key=True),
+        sa.Column('job_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+    op.execute("""
+        INSERT INTO job_stats_rollup (country, company, category, day, is_active, job_count)
+        SELECT
+            COALESCE(country, ''),
+            company,
+            COALESCE(category, ''),
+            (first_seen_at AT TIME ZONE 'UTC')::date,
+            COALESCE(is_active, FALSE),
+            count(*)
+        FROM jobs
+        GROUP BY 1, 2, 3, 4, 5
+    """)
+
+
+def downgrade():
+    """Drop job_stats_rollup table."""
+    op.drop_table('job_stats_rollup')
@@ -0,0 +1,68 @@
+"""Add scrape run history tables
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create scrape_runs and scrape_run_targets."""
+    op.create_table(
+        'scrape_runs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('duration_seconds', sa.Float(), nullable=True),
+        sa.Column('status', sa.String(50), nullable=False, server_default='running'),
+        sa.Column('country', sa.String(50), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('companies_processed', sa.Integer(), server_default='0'),
+        sa.Column('jobs_fetched', sa.Integer(), server_default='0'),
+        sa.Column('jobs_filtered', sa.Integer(), server_default='0'),
+        sa.Column('jobs_new', sa.Integer(), server_default='0'),
+        sa.Column('jobs_updated', sa.Integer(), server_default='0'),
+        sa.Column('errors', sa.Integer(), server_default='0'),
+        sa.Column('bytes_fetched', sa.BigInteger(), server_default='0'),
+        sa.Column('notifications_sent', sa.Integer(), server_default='0'),
+    )
+    op.create_index('idx_scrape_runs_started_at', 'scrape_runs', ['started_at'])
+    op.create_index('idx_scrape_runs_finished_at', 'scrape_runs', ['finished_at'])
+    
+    op.create_table(
+        'scrape_run_targets',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('run_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('scrape_runs.id'), nullable=False),
+        sa.Column('company', sa.String(255), nullable=False),
+        sa.Column('ats_type', sa.String(50), nullable=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('fetch_seconds', sa.Float(), nullable=True),
+        sa.Column('normalize_seconds', sa.Float(), nullable=True),
+        sa.Column('persist_seconds', sa.Float(), nullable=True),
+        sa.Column('total_seconds', sa.Float(), nullable=True),
+        sa.Column('bytes_fetched', sa.BigInteger(), server_default='0'),
+        sa.Column('jobs_fetched', sa.Integer(), server_default='0'),
+        sa.Column('jobs_filtered', sa.Integer(), server_default='0'),
+        sa.Column('jobs_new', sa.Integer(), server_default='0'),
+        sa.Column('jobs_updated', sa.Integer(), server_default='0'),
+        sa.Column('error_message', sa.Text(), nullable=True),
+    )
+    op.create_index('idx_scrape_run_targets_run_id', 'scrape_run_targets', ['run_id'])
+    op.create_index('idx_scrape_run_targets_company_started', 'scrape_run_targets', ['company', 'started_at'])
+
+
+def downgrade():
+    """Drop scrape run history tables."""
+    op.drop_table('scrape_run_targets')
+    op.drop_table('scrape_runs')
@@ -0,0 +1,35 @@
+"""Add full-text search vector to jobs
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add a generated, weighted tsvector column with a GIN index."""
+    op.execute("""
+        ALTER TABLE jobs ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(company, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(location, '')), 'B') ||
+            setweight(to_tsvector('english', left(coalesce(description_md, ''), 2000)), 'D')
+        ) STORED
+    """)
+    op.create_index('idx_jobs_search_vector', 'jobs', ['search_vector'], postgresql_using='gin')
+
+
+def downgrade():
+    """Drop search vector and its index."""
+    op.drop_index('idx_jobs_search_vector', table_name='jobs')
+    op.drop_column('jobs', 'search_vector')
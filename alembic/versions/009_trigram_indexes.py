@@ -0,0 +1,40 @@
+"""Add trigram indexes for substring filters
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Enable pg_trgm and index company/title for ILIKE '%...%'."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'idx_jobs_company_trgm',
+        'jobs',
+        ['company'],
+        postgresql_using='gin',
+        postgresql_ops={'company': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'idx_jobs_title_trgm',
+        'jobs',
+        ['title'],
+        postgresql_using='gin',
+        postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+
+
+def downgrade():
+    """Drop trigram indexes (the extension is left installed)."""
+    op.drop_index('idx_jobs_title_trgm', table_name='jobs')
+    op.drop_index('idx_jobs_company_trgm', table_name='jobs')
@@ -0,0 +1,73 @@
+"""Add change sequence for delta sync
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add jobs.change_seq, its sequence and the trigger that marks changes.
+    
+    The trigger clears change_seq whenever a client-visible column changes;
+    writers then stamp pending rows from the sequence right before commit
+    (see src/core/changes.py), so sequence order matches commit order.
+    """
+    op.execute("CREATE SEQUENCE jobs_change_seq")
+    op.add_column('jobs', sa.Column('change_seq', sa.BigInteger(), nullable=True))
+    op.execute("""
+        UPDATE jobs SET change_seq = s.seq
+        FROM (
+            SELECT id, nextval('jobs_change_seq') AS seq
+            FROM (SELECT id FROM jobs ORDER BY updated_at, id) ordered
+        ) s
+        WHERE jobs.id = s.id
+    """)
+    op.create_index('idx_jobs_change_seq', 'jobs', ['country', 'change_seq'])
+    op.create_index(
+        'idx_jobs_change_pending',
+        'jobs',
+        ['id'],
+        postgresql_where=sa.text('change_seq IS NULL'),
+    )
+    op.execute("""
+        CREATE FUNCTION jobs_mark_changed() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' OR
+               (NEW.company, NEW.title, NEW.location, NEW.employment_type, NEW.posted_at,
+                NEW.url, NEW.category, NEW.tags, NEW.country, NEW.is_active, NEW.hash_full)
+               IS DISTINCT FROM
+               (OLD.company, OLD.title, OLD.location, OLD.employment_type, OLD.posted_at,
+                OLD.url, OLD.category, OLD.tags, OLD.country, OLD.is_active, OLD.hash_full)
+            THEN
+                NEW.change_seq := NULL;
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER jobs_mark_changed
+        BEFORE INSERT OR UPDATE ON jobs
+        FOR EACH ROW EXECUTE FUNCTION jobs_mark_changed()
+    """)
+
+
+def downgrade():
+    """Drop change tracking."""
+    op.execute("DROP TRIGGER jobs_mark_changed ON jobs")
+    op.execute("DROP FUNCTION jobs_mark_changed()")
+    op.drop_index('idx_jobs_change_pending', table_name='jobs')
+    op.drop_index('idx_jobs_change_seq', table_name='jobs')
+    op.drop_column('jobs', 'change_seq')
+    op.execute("DROP SEQUENCE jobs_change_seq")
@@ -0,0 +1,35 @@
+"""Track post-run export status on scrape runs
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add export_status and export_seconds to scrape_runs."""
+    op.add_column('scrape_runs', sa.Column('export_status', sa.String(50), nullable=True))
+    op.add_column('scrape_runs', sa.Column('export_seconds', sa.Float(), nullable=True))
+    op.create_index(
+        'idx_scrape_runs_export_pending',
+        'scrape_runs',
+        ['started_at'],
+        postgresql_where=sa.text("export_status = 'pending'"),
+    )
+
+
+def downgrade():
+    """Drop export tracking columns."""
+    op.drop_index('idx_scrape_runs_export_pending', table_name='scrape_runs')
+    op.drop_column('scrape_runs', 'export_seconds')
+    op.drop_column('scrape_runs', 'export_status')
@@ -0,0 +1,33 @@
+"""Add export watermarks for incremental exports
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create export_watermarks."""
+    op.create_table(
+        'export_watermarks',
+        sa.Column('name', sa.String(100), primary_key=True),
+        sa.Column('change_seq', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('snapshot_seq', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('exported_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('rows_exported', sa.Integer(), nullable=True),
+    )
+
+
+def downgrade():
+    """Drop export_watermarks."""
+    op.drop_table('export_watermarks')
@@ -0,0 +1,33 @@
+"""Deliver alerts through an outbox
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add next_attempt_at and an index over due pending alerts."""
+    op.add_column('alerts', sa.Column('next_attempt_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index(
+        'idx_alerts_outbox',
+        'alerts',
+        ['sent_via', 'next_attempt_at'],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade():
+    """Drop outbox scheduling."""
+    op.drop_index('idx_alerts_outbox', table_name='alerts')
+    op.drop_column('alerts', 'next_attempt_at')
@@ -0,0 +1,70 @@
+"""Maintain the search vector with a trigger
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Turn search_vector into a plain column kept current by a trigger.
+    
+    A STORED generated column is recomputed on every UPDATE of the row,
+    including the last_seen_at touch of every scrape, which de-TOASTs and
+    re-tokenizes the description each time. The trigger only fires when an
+    input column is assigned and only recomputes when one changed; like
+    jobs_mark_changed, hash_full stands in for the description so an
+    unchanged description is never read.
+    """
+    # Keeps the computed values, drops the generation expression
+    op.execute("ALTER TABLE jobs ALTER COLUMN search_vector DROP EXPRESSION")
+    op.execute("""
+        CREATE FUNCTION jobs_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' OR
+               (NEW.title, NEW.company, NEW.location, NEW.hash_full)
+               IS DISTINCT FROM
+               (OLD.title, OLD.company, OLD.location, OLD.hash_full)
+            THEN
+                NEW.search_vector :=
+                    setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+                    setweight(to_tsvector('english', coalesce(NEW.company, '')), 'A') ||
+                    setweight(to_tsvector('english', coalesce(NEW.location, '')), 'B') ||
+                    setweight(to_tsvector('english', left(coalesce(NEW.description_md, ''), 2000)), 'D');
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER jobs_search_vector
+        BEFORE INSERT OR UPDATE OF title, company, location, description_md, hash_full ON jobs
+        FOR EACH ROW EXECUTE FUNCTION jobs_search_vector_update()
+    """)
+
+
+def downgrade():
+    """Go back to the generated column."""
+    op.execute("DROP TRIGGER jobs_search_vector ON jobs")
+    op.execute("DROP FUNCTION jobs_search_vector_update()")
+    op.drop_index('idx_jobs_search_vector', table_name='jobs')
+    op.drop_column('jobs', 'search_vector')
+    op.execute("""
+        ALTER TABLE jobs ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(company, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(location, '')), 'B') ||
+            setweight(to_tsvector('english', left(coalesce(description_md, ''), 2000)), 'D')
+        ) STORED
+    """)
+    op.create_index('idx_jobs_search_vector', 'jobs', ['search_vector'], postgresql_using='gin')
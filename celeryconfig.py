@@ -42,6 +42,30 @@ beat_schedule = {
         },
     },
     
+    # Deliver queued alerts and their retries - every 5 minutes
+    'deliver-notifications-every-5-minutes': {
+        'task': 'tasks.deliver_notifications',
+        'schedule': crontab(minute='*/5'),
+    },
+    
+    # Shrink raw_data payloads to the retention policy - daily at 03:30
+    'compact-raw-data-daily': {
+        'task': 'tasks.compact_raw_data',
+        'schedule': crontab(minute=30, hour=3),
+    },
+    
+    # Repair stats rollup drift - daily at 04:00
+    'reconcile-stats-rollup-daily': {
+        'task': 'tasks.reconcile_stats_rollup',
+        'schedule': crontab(minute=0, hour=4),
+    },
+    
+    # Columnar snapshot of the previous day for analytics - daily at 00:30
+    'write-parquet-snapshot-daily': {
+        'task': 'tasks.write_parquet_snapshot',
+        'schedule': crontab(minute=30, hour=0),
+    },
+    
     # Example: Scrape high-priority companies more frequently
     # Uncomment to enable
     #
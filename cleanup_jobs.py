@@ -10,15 +10,19 @@ This script marks jobs as inactive based on various criteria:
 
 import argparse
 import sys
+from collections import Counter
 from datetime import datetime, timedelta
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.core.database import get_db_context
+from src.core.batch import batch_session
+from src.core.changes import stamp_changes
+from src.core.generation import bump_generation
 from src.core.models import Job, Watchlist
-from sqlalchemy import and_, func
+from src.core.rollup import apply_rollup_deltas, bucket_for, move_bucket, reconcile_rollup
+from sqlalchemy import func, select, update
 from src.utils.logging_config import get_logger, setup_logging
 
 setup_logging()
@@ -48,33 +52,27 @@ class JobCleanup:
             Number of jobs marked inactive
         """
         cutoff_date = datetime.utcnow() - timedelta(days=days)
+        stale = Job.last_seen_at < cutoff_date
         
-        with get_db_context() as db:
-            # Find jobs that haven't been seen since the cutoff date
-            stale_jobs = db.query(Job).filter(
-                and_(
-                    Job.is_active == True,
-                    Job.last_seen_at < cutoff_date
-                )
-            ).all()
-            
-            count = len(stale_jobs)
-            
+        with batch_session() as db:
             if self.dry_run:
+                count = self._count_active(db, stale)
                 logger.info(f"[DRY RUN] Would mark {count} stale jobs as inactive (not seen in {days} days)")
                 
                 # Show sample jobs
-                if stale_jobs:
+                sample = db.execute(
+                    select(Job.company, Job.title, Job.last_seen_at)
+                    .where(Job.is_active == True, stale)
+                    .order_by(Job.last_seen_at)
+                    .limit(10)
+                ).all()
+                if sample:
                     logger.info("Sample stale jobs:")
-                    for job in stale_jobs[:10]:
-                        days_since = (datetime.utcnow() - job.last_seen_at).days
+                    for job in sample:
+                        days_since = (datetime.utcnow() - job.last_seen_at.replace(tzinfo=None)).days
                         logger.info(f"  - {job.company}: {job.title} (last seen {days_since} days ago)")
             else:
-                # Actually mark them inactive
-                for job in stale_jobs:
-                    job.is_active = False
-                
-                db.commit()
+                count = self._deactivate(db, stale)
                 logger.info(f"Marked {count} stale jobs as inactive")
             
             return count
@@ -86,39 +84,98 @@ class JobCleanup:
         Returns:
             Number of jobs marked inactive
         """
-        with get_db_context() as db:
-            # Get all active companies from watchlist
-            active_companies = db.query(Watchlist.company).filter(
-                Watchlist.is_active == True
-            ).all()
-            active_company_names = [c[0] for c in active_companies]
-            
-            # Find jobs from companies not in the watchlist
-            orphaned_jobs = db.query(Job).filter(
-                and_(
-                    Job.is_active == True,
-                    ~Job.company.in_(active_company_names)
-                )
-            ).all()
-            
-            count = len(orphaned_jobs)
-            
+        # Jobs from companies not in the watchlist
+        orphaned = Job.company.not_in(
+            select(Watchlist.company).where(Watchlist.is_active == True)
+        )
+        
+        with batch_session() as db:
             if self.dry_run:
+                count = self._count_active(db, orphaned)
                 logger.info(f"[DRY RUN] Would mark {count} jobs from inactive companies as inactive")
                 
                 # Show companies
-                if orphaned_jobs:
-                    companies = set(job.company for job in orphaned_jobs)
-                    logger.info(f"Companies not in watchlist: {sorted(companies)[:20]}")
+                if count:
+                    companies = db.scalars(
+                        select(Job.company)
+                        .where(Job.is_active == True, orphaned)
+                        .distinct()
+                        .order_by(Job.company)
+                        .limit(20)
+                    ).all()
+                    logger.info(f"Companies not in watchlist: {companies}")
             else:
-                for job in orphaned_jobs:
-                    job.is_active = False
-                
-                db.commit()
+                count = self._deactivate(db, orphaned)
                 logger.info(f"Marked {count} jobs from inactive companies as inactive")
             
             return count
     
+    def _count_active(self, db, condition) -> int:
+        """Count active jobs matching a condition."""
+        return db.scalar(select(func.count(Job.id)).where(Job.is_active == True, condition))
+    
+    def _deactivate(self, db, condition) -> int:
+        """
+        Mark active jobs matching a condition inactive in a single UPDATE.
+        
+        Only the rollup key columns of the affected rows come back (RETURNING),
+        instead of loading every job into the session.
+        
+        Args:
+            db: Database session
+            condition: Filter on Job
+            
+        Returns:
+            Number of jobs marked inactive
+        """
+        deactivated = db.execute(
+            update(Job)
+            .where(Job.is_active == True, condition)
+            .values(is_active=False)
+            .returning(Job.country, Job.company, Job.category, Job.first_seen_at),
+            execution_options={"synchronize_session": False},
+        ).all()
+        
+        rollup_deltas = Counter()
+        for job in deactivated:
+            move_bucket(rollup_deltas, *self._deactivation_buckets(job))
+        
+        apply_rollup_deltas(db, rollup_deltas)
+        if deactivated:
+            # Stamp before bumping, in the same lock order as the runner
+            stamp_changes(db)
+            bump_generation(db)
+        db.commit()
+        return len(deactivated)
+    
+    def _deactivation_buckets(self, job) -> tuple[tuple, tuple]:
+        """
+        Get the rollup buckets a job moves between when deactivated.
+        
+        Args:
+            job: Job (or row with its rollup key columns) about to be marked inactive
+            
+        Returns:
+            Tuple of (active bucket, inactive bucket)
+        """
+        return (
+            bucket_for(job.country, job.company, job.category, job.first_seen_at, True),
+            bucket_for(job.country, job.company, job.category, job.first_seen_at, False),
+        )
+    
+    def reconcile_stats_rollup(self) -> int:
+        """
+        Repair drift between the stats rollup and the jobs table.
+        
+        Returns:
+            Number of drifted rollup buckets
+        """
+        with batch_session() as db:
+            drifted = reconcile_rollup(db, dry_run=self.dry_run)
+            if drifted and not self.dry_run:
+                bump_generation(db)
+            return drifted
+    
     def get_cleanup_stats(self) -> dict:
         """
         Get statistics about jobs that need cleanup.
@@ -126,46 +183,31 @@ class JobCleanup:
         Returns:
             Dictionary with cleanup statistics
         """
-        with get_db_context() as db:
-            total_jobs = db.query(Job).count()
-            active_jobs = db.query(Job).filter(Job.is_active == True).count()
-            inactive_jobs = db.query(Job).filter(Job.is_active == False).count()
-            
-            # Jobs not seen in last 30 days
-            cutoff_30 = datetime.utcnow() - timedelta(days=30)
-            stale_30_days = db.query(Job).filter(
-                and_(
-                    Job.is_active == True,
-                    Job.last_seen_at < cutoff_30
-                )
-            ).count()
-            
-            # Jobs not seen in last 60 days
-            cutoff_60 = datetime.utcnow() - timedelta(days=60)
-            stale_60_days = db.query(Job).filter(
-                and_(
-                    Job.is_active == True,
-                    Job.last_seen_at < cutoff_60
-                )
-            ).count()
-            
-            # Jobs not seen in last 90 days
-            cutoff_90 = datetime.utcnow() - timedelta(days=90)
-            stale_90_days = db.query(Job).filter(
-                and_(
-                    Job.is_active == True,
-                    Job.last_seen_at < cutoff_90
+        now = datetime.utcnow()
+        
+        def stale_since(days: int):
+            return func.count(Job.id).filter(
+                Job.is_active == True,
+                Job.last_seen_at < now - timedelta(days=days),
+            )
+        
+        # One scan of jobs for every counter
+        with batch_session() as db:
+            counts = db.execute(
+                select(
+                    func.count(Job.id),
+                    func.count(Job.id).filter(Job.is_active == True),
+                    func.count(Job.id).filter(Job.is_active == False),
+                    stale_since(30),
+                    stale_since(60),
+                    stale_since(90),
                 )
-            ).count()
-            
-            return {
-                "total_jobs": total_jobs,
-                "active_jobs": active_jobs,
-                "inactive_jobs": inactive_jobs,
-                "stale_30_days": stale_30_days,
-                "stale_60_days": stale_60_days,
-                "stale_90_days": stale_90_days,
-            }
+            ).one()
+        
+        return dict(zip(
+            ("total_jobs", "active_jobs", "inactive_jobs", "stale_30_days", "stale_60_days", "stale_90_days"),
+            counts,
+        ))
     
     def print_stats(self):
         """Print cleanup statistics."""
@@ -233,11 +275,37 @@ def main():
         action="store_true",
         help="Only mark stale jobs inactive, skip other cleanup",
     )
+    parser.add_argument(
+        "--reconcile-stats",
+        action="store_true",
+        help="Repair drift in the stats rollup table",
+    )
+    parser.add_argument(
+        "--compact-raw-data",
+        action="store_true",
+        help="Shrink stored raw_data to the configured retention policy",
+    )
     
     args = parser.parse_args()
     
+    if args.compact_raw_data:
+        from src.ingest.retention import RawDataCompactor
+        
+        count = RawDataCompactor().compact(dry_run=not args.execute)
+        print(f"raw_data compacted: {count} jobs")
+        if not args.execute:
+            print("\n💡 To actually compact raw_data, add --execute flag")
+        return 0
+    
     cleanup = JobCleanup(dry_run=not args.execute)
     
+    if args.reconcile_stats:
+        drifted = cleanup.reconcile_stats_rollup()
+        print(f"Stats rollup: {drifted} drifted buckets")
+        if not args.execute:
+            print("\n💡 To actually repair the rollup, add --execute flag")
+        return 0
+    
     if args.stats_only:
         cleanup.print_stats()
         return 0
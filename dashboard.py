@@ -9,10 +9,14 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from flask import Flask, render_template, request, jsonify, redirect, url_for
-from datetime import datetime, timedelta
-from sqlalchemy import func, desc
+from datetime import datetime
+from sqlalchemy import desc, select
+from sqlalchemy.orm import undefer
+from src.core.batch import stream_batches
 from src.core.database import get_db_context
 from src.core.models import Job, Alert
+from src.core.search import apply_search, substring_filter
+from src.core.stats import get_job_stats
 from src.ingest.health_monitor import HealthMonitor, URLHealth
 
 app = Flask(__name__, template_folder='templates', static_folder='static')
@@ -22,31 +26,21 @@ app = Flask(__name__, template_folder='templates', static_folder='static')
 def index():
     """Dashboard home page."""
     with get_db_context() as db:
-        # Get statistics
-        total_jobs = db.query(Job).filter(Job.is_active == True).count()
-        new_jobs_today = db.query(Job).filter(
-            Job.first_seen_at >= datetime.now() - timedelta(days=1)
-        ).count()
-        
-        companies = db.query(Job.company).distinct().count()
+        # Get statistics (one grouped scan)
+        stats = get_job_stats(db)
         
         # Get recent jobs
         recent_jobs = db.query(Job).filter(
             Job.is_active == True
         ).order_by(desc(Job.first_seen_at)).limit(10).all()
         
-        # Get jobs by category
-        jobs_by_category = db.query(
-            Job.category, func.count(Job.id)
-        ).filter(Job.is_active == True).group_by(Job.category).all()
-        
         return render_template(
             'dashboard.html',
-            total_jobs=total_jobs,
-            new_jobs_today=new_jobs_today,
-            companies=companies,
+            total_jobs=stats["active_jobs"],
+            new_jobs_today=stats["new_today"],
+            companies=stats["companies"],
             recent_jobs=recent_jobs,
-            jobs_by_category=jobs_by_category
+            jobs_by_category=list(stats["jobs_by_category"].items())
         )
 
 
@@ -56,28 +50,38 @@ def jobs():
     page = request.args.get('page', 1, type=int)
     per_page = 50
     
+    search_text = request.args.get('q', '').strip()
     company_filter = request.args.get('company', '')
+    title_filter = request.args.get('title', '')
     category_filter = request.args.get('category', '')
     status_filter = request.args.get('status', 'active')
     
     with get_db_context() as db:
         query = db.query(Job)
+        rank = None
         
         # Apply filters
         if status_filter == 'active':
             query = query.filter(Job.is_active == True)
         
         if company_filter:
-            query = query.filter(Job.company.ilike(f'%{company_filter}%'))
+            query = query.filter(substring_filter(Job.company, company_filter))
+        
+        if title_filter:
+            query = query.filter(substring_filter(Job.title, title_filter))
         
         if category_filter:
             query = query.filter(Job.category == category_filter)
         
+        if search_text:
+            query, rank = apply_search(query, search_text)
+        
         # Get total count
         total = query.count()
         
-        # Paginate
-        jobs = query.order_by(desc(Job.first_seen_at)).offset(
+        # Paginate (best matches first when searching)
+        ordering = [desc(rank), desc(Job.first_seen_at)] if rank is not None else [desc(Job.first_seen_at)]
+        jobs = query.order_by(*ordering).offset(
             (page - 1) * per_page
         ).limit(per_page).all()
         
@@ -95,7 +99,9 @@ def jobs():
             total=total,
             categories=categories,
             company_filter=company_filter,
-            category_filter=category_filter
+            title_filter=title_filter,
+            category_filter=category_filter,
+            search_text=search_text
         )
 
 
@@ -103,7 +109,7 @@ def jobs():
 def job_detail(job_id):
     """Job details page."""
     with get_db_context() as db:
-        job = db.query(Job).filter(Job.id == job_id).first()
+        job = db.query(Job).options(undefer(Job.description_md)).filter(Job.id == job_id).first()
         
         if not job:
             return "Job not found", 404
@@ -159,17 +165,14 @@ def update_job_status(job_id):
 def stats_api():
     """Get dashboard statistics as JSON."""
     with get_db_context() as db:
+        job_stats = get_job_stats(db)
         stats = {
-            "total_jobs": db.query(Job).filter(Job.is_active == True).count(),
-            "new_today": db.query(Job).filter(
-                Job.first_seen_at >= datetime.now() - timedelta(days=1)
-            ).count(),
-            "new_week": db.query(Job).filter(
-                Job.first_seen_at >= datetime.now() - timedelta(days=7)
-            ).count(),
-            "companies": db.query(Job.company).distinct().count(),
-            "applied": db.query(Job).filter(Job.application_status == 'applied').count(),
-            "interviewing": db.query(Job).filter(Job.application_status == 'interviewing').count(),
+            "total_jobs": job_stats["active_jobs"],
+            "new_today": job_stats["new_today"],
+            "new_week": job_stats["new_week"],
+            "companies": job_stats["companies"],
+            "applied": job_stats["applied"],
+            "interviewing": job_stats["interviewing"],
         }
         
         return jsonify(stats)
@@ -177,43 +180,49 @@ def stats_api():
 
 @app.route('/export')
 def export_jobs():
-    """Export jobs to CSV."""
+    """Export jobs to CSV (streamed from a server-side cursor)."""
     import csv
     from io import StringIO
     from flask import Response
     
-    with get_db_context() as db:
-        jobs = db.query(Job).filter(Job.is_active == True).all()
-        
+    stmt = select(
+        Job.company, Job.title, Job.location, Job.category,
+        Job.posted_at, Job.url, Job.application_status
+    ).where(Job.is_active == True).order_by(Job.company, Job.title)
+    
+    def generate():
         output = StringIO()
         writer = csv.writer(output)
         
         # Write header
         writer.writerow([
-            'Company', 'Title', 'Location', 'Remote', 'Category',
+            'Company', 'Title', 'Location', 'Category',
             'Posted At', 'URL', 'Application Status'
         ])
         
-        # Write data
-        for job in jobs:
-            writer.writerow([
-                job.company,
-                job.title,
-                job.location or '',
-                'Yes' if job.remote else 'No',
-                job.category or '',
-                job.posted_at.strftime('%Y-%m-%d') if job.posted_at else '',
-                job.url,
-                job.application_status or 'not_applied'
-            ])
-        
-        output.seek(0)
-        
-        return Response(
-            output,
-            mimetype='text/csv',
-            headers={'Content-Disposition': 'attachment; filename=jobs.csv'}
-        )
+        # Write data, one server-side batch at a time
+        for batch in stream_batches(stmt):
+            for job in batch:
+                writer.writerow([
+                    job.company,
+                    job.title,
+                    job.location or '',
+                    job.category or '',
+                    job.posted_at.strftime('%Y-%m-%d') if job.posted_at else '',
+                    job.url,
+                    job.application_status or 'not_applied'
+                ])
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
+        
+        yield output.getvalue()
+    
+    return Response(
+        generate(),
+        mimetype='text/csv',
+        headers={'Content-Disposition': 'attachment; filename=jobs.csv'}
+    )
 
 
 if __name__ == '__main__':
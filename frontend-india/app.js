@@ -16,8 +16,11 @@ document.addEventListener('DOMContentLoaded', async () => {
     await loadAllData();
     updateLastRefreshTime();
     
-    // Auto-refresh every minute
+    // Refresh when the server reports new data; poll only while the event
+    // stream is down
+    subscribeToEvents();
     setInterval(async () => {
+        if (eventStreamOpen) return;
         await loadAllData();
         updateLastRefreshTime();
     }, REFRESH_INTERVAL);
@@ -26,6 +29,28 @@ document.addEventListener('DOMContentLoaded', async () => {
     startCountdownTimer();
 });
 
+// Server-sent events: refresh once per burst of run_finished/jobs_new events
+let eventStreamOpen = false;
+let eventRefreshTimer = null;
+
+function subscribeToEvents() {
+    if (!window.EventSource) return;
+    
+    const source = new EventSource(`${API_BASE_URL}/events`);
+    source.onopen = () => { eventStreamOpen = true; };
+    source.onerror = () => { eventStreamOpen = false; };  // EventSource reconnects itself
+    
+    const scheduleRefresh = () => {
+        clearTimeout(eventRefreshTimer);
+        eventRefreshTimer = setTimeout(async () => {
+            await loadAllData();
+            updateLastRefreshTime();
+        }, 1000);
+    };
+    source.addEventListener('run_finished', scheduleRefresh);
+    source.addEventListener('jobs_new', scheduleRefresh);
+}
+
 // Load all data from API
 async function loadAllData() {
     try {
@@ -138,16 +163,39 @@ async function loadStats() {
 }
 
 // Load jobs from API
+// Jobs are synced incrementally: the first call pulls everything, later
+// calls only fetch jobs inserted, updated or closed since changeCursor
+const jobsById = new Map();
+let changeCursor = null;
+
 async function loadJobs() {
     try {
-        const response = await fetch(`${API_BASE_URL}/jobs?limit=500`);
-        const data = await response.json();
+        let hasMore = true;
+        while (hasMore) {
+            const params = new URLSearchParams({ limit: 1000 });
+            if (changeCursor) params.set('since', changeCursor);
+            const response = await fetch(`${API_BASE_URL}/jobs/changes?${params}`);
+            const data = await response.json();
+            
+            for (const row of data.upserts) {
+                const job = Object.fromEntries(data.fields.map((field, i) => [field, row[i]]));
+                jobsById.set(job.id, job);
+            }
+            for (const id of data.closed) {
+                jobsById.delete(id);
+            }
+            
+            changeCursor = data.cursor;
+            hasMore = data.has_more;
+        }
         
-        // Store all jobs (filtering happens in renderJobs)
-        allJobs = data.jobs.map(job => ({
-            ...job,
-            isNew: isToday(job.first_seen_at)
-        }));
+        // Newest postings first, like /jobs (filtering happens in renderJobs)
+        allJobs = Array.from(jobsById.values())
+            .sort((a, b) => (b.posted_at || '\uffff').localeCompare(a.posted_at || '\uffff') || b.id.localeCompare(a.id))
+            .map(job => ({
+                ...job,
+                isNew: isToday(job.first_seen_at)
+            }));
         
         console.log('Loaded jobs:', allJobs.length);
         renderJobs();
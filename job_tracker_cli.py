@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """Interactive CLI for Job Tracker - Run scrapes, view results, and manage job data."""
 
-import csv
 import os
 import sys
 from datetime import datetime, timedelta
@@ -12,6 +11,9 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from src.core.database import get_db_context
 from src.core.models import Job
+from src.core.rollup import get_rollup_stats
+from src.core.search import search_jobs, substring_filter
+from src.utils.delta_export import CsvDeltaLog, format_timestamp
 from sqlalchemy import func, and_
 
 
@@ -22,7 +24,7 @@ class JobTrackerCLI:
         self.project_root = Path(__file__).parent
         self.exports_dir = self.project_root / "exports"
         self.master_log = self.project_root / "MASTER_JOB_LOG.csv"
-        
+    
     def clear_screen(self):
         """Clear terminal screen."""
         os.system('clear' if os.name != 'nt' else 'cls')
@@ -285,43 +287,26 @@ class JobTrackerCLI:
         
         try:
             with get_db_context() as db:
-                # Total jobs
-                total_jobs = db.query(Job).count()
-                active_jobs = db.query(Job).filter(Job.is_active == True).count()
-                inactive_jobs = total_jobs - active_jobs
-                
-                # Companies tracked
-                total_companies = db.query(Job.company).distinct().count()
-                
-                # Jobs by category
-                categories = db.query(
-                    Job.category,
-                    func.count(Job.id).label('count')
-                ).filter(
-                    Job.is_active == True
-                ).group_by(
-                    Job.category
-                ).order_by(
-                    func.count(Job.id).desc()
-                ).all()
-                
-                # Oldest and newest
-                oldest = db.query(Job).order_by(Job.first_seen_at.asc()).first()
-                newest = db.query(Job).order_by(Job.first_seen_at.desc()).first()
+                # Counts come from the stats rollup (no scan of jobs)
+                stats = get_rollup_stats(db)
+                total_jobs = stats["total_jobs"]
+                active_jobs = stats["active_jobs"]
+                inactive_jobs = stats["inactive_jobs"]
+                total_companies = stats["companies"]
                 
                 print(f"📊 Total Jobs Ever Tracked:   {total_jobs}")
                 print(f"✅ Currently Active:          {active_jobs}")
                 print(f"❌ Inactive/Closed:           {inactive_jobs}")
                 print(f"🏢 Companies Tracked:         {total_companies}")
                 
-                if oldest:
-                    print(f"\n📅 First Job Tracked:         {oldest.first_seen_at.strftime('%Y-%m-%d')}")
-                if newest:
-                    print(f"📅 Most Recent Job:           {newest.first_seen_at.strftime('%Y-%m-%d')}")
+                if stats["first_day"]:
+                    print(f"\n📅 First Job Tracked:         {stats['first_day'].strftime('%Y-%m-%d')}")
+                if stats["last_day"]:
+                    print(f"📅 Most Recent Job:           {stats['last_day'].strftime('%Y-%m-%d')}")
                 
                 print(f"\n🏷️  Jobs by Category:")
                 print("-" * 80)
-                for category, count in categories[:10]:
+                for category, count in list(stats["jobs_by_category"].items())[:10]:
                     cat_name = category or "Uncategorized"
                     print(f"  • {cat_name}: {count} jobs")
                 
@@ -329,18 +314,7 @@ class JobTrackerCLI:
                 print(f"\n🏆 Top Companies (Active Jobs):")
                 print("-" * 80)
                 
-                top_companies = db.query(
-                    Job.company,
-                    func.count(Job.id).label('count')
-                ).filter(
-                    Job.is_active == True
-                ).group_by(
-                    Job.company
-                ).order_by(
-                    func.count(Job.id).desc()
-                ).limit(15).all()
-                
-                for company, count in top_companies:
+                for company, count in list(stats["jobs_by_company"].items())[:15]:
                     print(f"  • {company}: {count} jobs")
         
         except Exception as e:
@@ -380,79 +354,93 @@ class JobTrackerCLI:
         
         input("\nPress Enter to continue...")
     
-    def update_master_log(self):
-        """Update master CSV log with all jobs."""
+    def update_master_log(self, compact: bool = True):
+        """Update master CSV log with the jobs changed since the last update.
+        
+        Args:
+            compact: Merge the changes into MASTER_JOB_LOG.csv right away
+        
+        Returns:
+            Path of the delta file written, or None
+        """
         try:
-            with get_db_context() as db:
-                # Get all jobs
-                jobs = db.query(Job).order_by(Job.first_seen_at.desc()).all()
-                
-                # Write to CSV
-                with open(self.master_log, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    
-                    # Header
-                    writer.writerow([
-                        'ID', 'Company', 'Title', 'Location', 'Remote',
-                        'Category', 'Employment Type', 'Posted Date',
-                        'First Seen', 'Last Seen', 'Is Active', 'URL', 'Tags'
-                    ])
-                    
-                    # Data
-                    for job in jobs:
-                        writer.writerow([
-                            job.id,
-                            job.company,
-                            job.title,
-                            job.location or '',
-                            'Yes' if job.remote else 'No',
-                            job.category or '',
-                            job.employment_type or '',
-                            job.posted_at.strftime('%Y-%m-%d') if job.posted_at else '',
-                            job.first_seen_at.strftime('%Y-%m-%d %H:%M') if job.first_seen_at else '',
-                            job.last_seen_at.strftime('%Y-%m-%d %H:%M') if job.last_seen_at else '',
-                            'Yes' if job.is_active else 'No',
-                            job.url,
-                            ','.join(job.tags) if job.tags else ''
-                        ])
-                
+            log = self._master_log_deltas()
+            delta_path, rows = log.export_delta()
+            
+            if compact:
+                log.compact()
                 print(f"\n  \033[1;32m✅ Master log updated: {self.master_log}\033[0m")
-                print(f"  \033[1;36m   Total jobs: {len(jobs)}\033[0m")
+            print(f"  \033[1;36m   Changed jobs: {rows}\033[0m")
+            return delta_path
         
         except Exception as e:
             print(f"\n  \033[1;33m⚠️  Could not update master log: Database connection unavailable\033[0m")
             print(f"  \033[0;90m   (The scrape completed successfully, but CSV export requires database access)\033[0m")
             print(f"  \033[1;36m   💡 Tip: Export the master log using Option 7 when database is running\033[0m")
+            return None
+    
+    def _master_log_deltas(self) -> CsvDeltaLog:
+        """Delta log backing MASTER_JOB_LOG.csv (closed jobs are kept).
+        
+        There is no Last Seen column: rows are re-exported only on tracked
+        changes, so it would go stale (see CsvDeltaLog).
+        """
+        return CsvDeltaLog(
+            "master_log",
+            self.exports_dir,
+            header=[
+                'ID', 'Company', 'Title', 'Location',
+                'Category', 'Employment Type', 'Posted Date',
+                'First Seen', 'Is Active', 'URL', 'Tags'
+            ],
+            columns=(
+                Job.id, Job.company, Job.title, Job.location,
+                Job.category, Job.employment_type, Job.posted_at,
+                Job.first_seen_at, Job.is_active, Job.url, Job.tags,
+            ),
+            format_row=lambda job: [
+                job.id,
+                job.company,
+                job.title,
+                job.location or '',
+                job.category or '',
+                job.employment_type or '',
+                format_timestamp(job.posted_at, '%Y-%m-%d'),
+                format_timestamp(job.first_seen_at),
+                'Yes' if job.is_active else 'No',
+                job.url,
+                ','.join(job.tags) if job.tags else ''
+            ],
+            snapshot_path=self.master_log,
+            keep_closed=True,
+        )
     
     def export_master_log(self):
-        """Export master job log with timestamp."""
+        """Export the jobs changed since the last export, optionally merging them."""
         print("\n\033[1;34m")  # Blue
         print("╔════════════════════════════════════════════════════════════════════════════════╗")
         print("║                      💾  EXPORT MASTER JOB LOG (CSV)                          ║")
         print("╚════════════════════════════════════════════════════════════════════════════════╝")
         print("\033[0m")
         
-        print("\n  \033[1;33m⏳ Connecting to database and generating CSV...\033[0m\n")
+        print("\n  \033[1;33m⏳ Connecting to database and exporting changes...\033[0m\n")
         
-        self.update_master_log()
+        delta_path = self.update_master_log(compact=False)
         
-        # Create timestamped copy
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        export_file = self.exports_dir / f"master_log_{timestamp}.csv"
+        if delta_path:
+            print(f"\n  \033[1;32m✅ Changes saved:\033[0m")
+            print(f"     \033[1;36m{delta_path}\033[0m")
         
-        # Only create timestamped copy if master log was successfully created
-        if self.master_log.exists():
+        merge = input("\n  Merge changes into MASTER_JOB_LOG.csv now? (y/n): ").strip().lower()
+        if merge == 'y':
             try:
-                import shutil
-                shutil.copy(self.master_log, export_file)
-                print(f"\n  \033[1;32m✅ Timestamped copy saved:\033[0m")
-                print(f"     \033[1;36m{export_file}\033[0m")
+                self._master_log_deltas().compact()
                 print(f"\n  \033[1;32m📍 Main log location:\033[0m")
                 print(f"     \033[1;36m{self.master_log}\033[0m")
                 print(f"\n  \033[1;33m💡 Open in Excel/Sheets for best experience\033[0m")
             
             except Exception as e:
-                print(f"\n  \033[1;31m❌ Error creating copy: {e}\033[0m")
+                print(f"\n  \033[1;31m❌ Error merging changes: {e}\033[0m")
         
         input("\n  \033[1;32m✓\033[0m Press Enter to continue...")
     
@@ -469,17 +457,8 @@ class JobTrackerCLI:
         
         try:
             with get_db_context() as db:
-                # Search in title, company, location
-                jobs = db.query(Job).filter(
-                    and_(
-                        Job.is_active == True,
-                        (
-                            Job.title.ilike(f'%{keyword}%') |
-                            Job.company.ilike(f'%{keyword}%') |
-                            Job.location.ilike(f'%{keyword}%')
-                        )
-                    )
-                ).order_by(Job.first_seen_at.desc()).limit(50).all()
+                # Ranked full-text search (same backend as the API /search)
+                jobs = search_jobs(db, keyword, limit=50, facets=False)["results"]
                 
                 if not jobs:
                     print(f"\nNo jobs found matching '{keyword}'")
@@ -516,7 +495,7 @@ class JobTrackerCLI:
                 jobs = db.query(Job).filter(
                     and_(
                         Job.is_active == True,
-                        Job.company.ilike(f'%{company}%')
+                        substring_filter(Job.company, company)
                     )
                 ).order_by(Job.first_seen_at.desc()).all()
                 
@@ -641,7 +620,7 @@ class JobTrackerCLI:
             print(f"\n  \033[1;36m📊 Updated Statistics:\033[0m")
             print(f"     Active Jobs: {new_stats['active_jobs']:,}")
             print(f"     Inactive Jobs: {new_stats['inactive_jobs']:,}")
-            
+        
         except ImportError as e:
             print(f"\n  \033[1;31m❌ Error: Cleanup script not found\033[0m")
             print(f"     {e}")
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark ILIKE substring filters with and without pg_trgm GIN indexes.
+
+Builds a synthetic jobs-like table (1M rows by default), times the company
+and title substring filters used by the API/dashboard/CLI, then adds the
+trigram indexes and times them again.
+
+Usage:
+    python scripts/benchmark_trigram.py --rows 1000000 --repeat 5
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from src.core.database import engine
+from src.core.search import escape_like
+
+TABLE = "bench_trgm_jobs"
+
+# (column, substring) pairs resembling real UI filters
+PATTERNS = [
+    ("company", "stripe"),
+    ("company", "capital"),
+    ("title", "machine learning"),
+    ("title", "intern"),
+    ("title", "quant"),
+]
+
+CREATE_SQL = f"""
+CREATE UNLOGGED TABLE {TABLE} AS
+SELECT
+    g AS id,
+    (ARRAY['Stripe', 'Citadel Securities', 'Two Sigma', 'Jane Street', 'Datadog',
+           'Point72', 'Capital One', 'Snowflake', 'Robinhood', 'Databricks'])[1 + g % 10]
+        || ' ' || md5(g::text) AS company,
+    (ARRAY['Software Engineer Intern', 'Machine Learning Intern', 'Data Science Intern',
+           'Quant Research Intern', 'Backend Engineer', 'Security Engineer Co-op',
+           'Infrastructure Intern', 'Product Analyst'])[1 + (g / 10) % 8]
+        || ' - ' || substr(md5((g * 7)::text), 1, 12) AS title
+FROM generate_series(1, :rows) AS g
+"""
+
+
+def time_queries(conn, repeat: int) -> dict[tuple[str, str], float]:
+    """Time each pattern and return the median latency in milliseconds."""
+    results = {}
+    for column, pattern in PATTERNS:
+        sql = text(f"SELECT count(*) FROM {TABLE} WHERE {column} ILIKE :pattern ESCAPE '\\'")
+        params = {"pattern": f"%{escape_like(pattern)}%"}
+        
+        conn.execute(sql, params)  # warm cache
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            conn.execute(sql, params).scalar()
+            samples.append((time.perf_counter() - start) * 1000)
+        results[(column, pattern)] = statistics.median(samples)
+    return results
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark pg_trgm substring filters")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Synthetic rows to generate")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per query")
+    parser.add_argument("--keep", action="store_true", help="Keep the benchmark table afterwards")
+    args = parser.parse_args()
+    
+    with engine.connect() as conn:
+        conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+        
+        print(f"Generating {args.rows:,} rows...")
+        start = time.perf_counter()
+        conn.execute(text(CREATE_SQL), {"rows": args.rows})
+        conn.execute(text(f"ANALYZE {TABLE}"))
+        print(f"  done in {time.perf_counter() - start:.1f}s")
+        
+        print("Timing without trigram indexes...")
+        before = time_queries(conn, args.repeat)
+        
+        print("Building trigram indexes...")
+        start = time.perf_counter()
+        conn.execute(text(f"CREATE INDEX ON {TABLE} USING gin (company gin_trgm_ops)"))
+        conn.execute(text(f"CREATE INDEX ON {TABLE} USING gin (title gin_trgm_ops)"))
+        conn.execute(text(f"ANALYZE {TABLE}"))
+        print(f"  done in {time.perf_counter() - start:.1f}s")
+        
+        print("Timing with trigram indexes...")
+        after = time_queries(conn, args.repeat)
+        
+        print()
+        print(f"{'filter':<32} {'before (ms)':>12} {'after (ms)':>12} {'speedup':>9}")
+        print("-" * 68)
+        for column, pattern in PATTERNS:
+            b = before[(column, pattern)]
+            a = after[(column, pattern)]
+            label = f"{column} ILIKE '%{pattern}%'"
+            print(f"{label:<32} {b:>12.1f} {a:>12.1f} {b / a if a else 0:>8.1f}x")
+        
+        if not args.keep:
+            conn.execute(text(f"DROP TABLE {TABLE}"))
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Load test the read API and compare p50/p99 latency and throughput.
+
+Each target is a running API server. To compare the async database layer
+with the previous sync implementation, serve both side by side, e.g.:
+
+    git worktree add /tmp/api-sync <commit before the async change>
+    (cd /tmp/api-sync && uvicorn src.app.main:app --port 8010 --workers 1) &
+    uvicorn src.app.main:app --port 8000 --workers 1 &
+
+    python scripts/load_test_api.py \\
+        --target sync=http://localhost:8010 --target async=http://localhost:8000 \\
+        --concurrency 64 --duration 30
+
+Set API_CACHE_BACKEND=off on both servers to measure the database path
+rather than the response cache.
+"""
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+# Read endpoints exercised round-robin by every worker
+DEFAULT_PATHS = [
+    "/jobs?limit=50&count=none",
+    "/jobs?limit=50&count=estimate&company=a",
+    "/stats",
+    "/companies",
+    "/scraper-status",
+    "/search?q=software+intern&limit=20",
+]
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def run_target(base_url: str, paths: list[str], concurrency: int, duration: float) -> dict:
+    """Hammer one server with concurrent clients for a fixed duration.
+    
+    Args:
+        base_url: Server base URL
+        paths: Endpoint paths to cycle through
+        concurrency: Number of concurrent clients
+        duration: Seconds to run
+    
+    Returns:
+        Dictionary with latencies (ms), request/error counts and elapsed time
+    """
+    latencies: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+    
+    def client(worker: int):
+        """Issue requests until the deadline, then merge results."""
+        nonlocal errors
+        session = requests.Session()
+        local = []
+        local_errors = 0
+        i = worker
+        while time.perf_counter() < deadline:
+            url = base_url + paths[i % len(paths)]
+            i += 1
+            start = time.perf_counter()
+            try:
+                response = session.get(url, timeout=30)
+                if response.status_code >= 500:
+                    local_errors += 1
+            except requests.RequestException:
+                local_errors += 1
+            local.append((time.perf_counter() - start) * 1000)
+        with lock:
+            latencies.extend(local)
+            errors += local_errors
+    
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(client, range(concurrency)))
+    elapsed = time.perf_counter() - started
+    
+    return {"latencies": latencies, "errors": errors, "elapsed": elapsed}
+
+
+def main():
+    """Run the load test."""
+    parser = argparse.ArgumentParser(description="Load test the read API")
+    parser.add_argument(
+        "--target", action="append", required=True,
+        help="label=base_url of a running server (repeat to compare)",
+    )
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=20, help="Seconds per target")
+    parser.add_argument("--warmup", type=float, default=3, help="Warm-up seconds per target")
+    parser.add_argument("--path", action="append", help="Endpoint path (repeatable; default: mixed reads)")
+    args = parser.parse_args()
+    
+    paths = args.path or DEFAULT_PATHS
+    results = []
+    
+    for target in args.target:
+        label, _, base_url = target.partition("=")
+        if not base_url:
+            parser.error(f"--target must be label=url, got {target!r}")
+        base_url = base_url.rstrip("/")
+        
+        print(f"{label}: warming up {base_url} ...")
+        run_target(base_url, paths, args.concurrency, args.warmup)
+        print(f"{label}: {args.concurrency} clients for {args.duration:.0f}s ...")
+        result = run_target(base_url, paths, args.concurrency, args.duration)
+        results.append((label, result))
+    
+    print()
+    print(f"{'target':<12} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 (ms)':>10} {'p99 (ms)':>10} {'mean (ms)':>10}")
+    print("-" * 73)
+    for label, result in results:
+        latencies = result["latencies"]
+        print(
+            f"{label:<12} {len(latencies):>9} {result['errors']:>7} "
+            f"{len(latencies) / result['elapsed']:>9.1f} "
+            f"{percentile(latencies, 50):>10.1f} {percentile(latencies, 99):>10.1f} "
+            f"{statistics.fmean(latencies) if latencies else 0:>10.1f}"
+        )
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""Response cache for read endpoints, invalidated by the data generation."""
+
+import functools
+import hashlib
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from fastapi import Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+
+from src.core.config import get_settings
+from src.core.generation import get_generation
+from src.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Entries in a shared backend expire on their own once their generation is old
+SHARED_ENTRY_TTL = 24 * 3600
+
+# Region of this API instance. Instances for different regions share the
+# database (so the generation) and Redis, so keys must tell them apart
+CACHE_REGION = get_settings().region
+
+
+class MemoryCacheBackend:
+    """Thread-safe in-process LRU cache."""
+    
+    # Calls return immediately, so async endpoints make them on the event loop
+    blocking = False
+    
+    def __init__(self, max_entries: int = 512):
+        """Initialize LRU cache.
+        
+        Args:
+            max_entries: Maximum number of cached responses
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> tuple[str, bytes] | None:
+        """Get a cached (etag, body) pair."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+    
+    def set(self, key: str, entry: tuple[str, bytes]):
+        """Store an (etag, body) pair, evicting the least recently used."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisCacheBackend:
+    """Cache shared between API workers, stored in Redis."""
+    
+    # Every call is a network round trip; async endpoints run them in the threadpool
+    blocking = True
+    
+    def __init__(self, redis_url: str, prefix: str = "api-cache:"):
+        """Initialize Redis cache.
+        
+        Args:
+            redis_url: Redis connection URL
+            prefix: Key prefix
+        """
+        import redis
+        
+        self.client = redis.Redis.from_url(redis_url)
+        self.prefix = prefix
+    
+    def get(self, key: str) -> tuple[str, bytes] | None:
+        """Get a cached (etag, body) pair."""
+        try:
+            values = self.client.hmget(self.prefix + key, "etag", "body")
+        except Exception as e:
+            logger.warning(f"Redis cache read failed: {e}")
+            return None
+        if not values[0]:
+            return None
+        return values[0].decode(), values[1]
+    
+    def set(self, key: str, entry: tuple[str, bytes]):
+        """Store an (etag, body) pair."""
+        etag, body = entry
+        try:
+            pipe = self.client.pipeline()
+            pipe.hset(self.prefix + key, mapping={"etag": etag, "body": body})
+            pipe.expire(self.prefix + key, SHARED_ENTRY_TTL)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Redis cache write failed: {e}")
+
+
+def _create_backend() -> MemoryCacheBackend | RedisCacheBackend | None:
+    """Create the configured cache backend (None disables caching)."""
+    settings = get_settings()
+    backend = settings.api_cache_backend.lower()
+    
+    if backend == "off":
+        return None
+    
+    if backend == "redis":
+        try:
+            return RedisCacheBackend(settings.redis_url)
+        except ImportError:
+            logger.warning("redis not installed, falling back to in-process API cache")
+    
+    return MemoryCacheBackend(settings.api_cache_max_entries)
+
+
+response_cache = _create_backend()
+
+
+def make_etag(body: bytes) -> str:
+    """Build a strong ETag for a response body."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag.
+    
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Current ETag
+    
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def cache_key(request: Request, generation: int, ttl: int | None = None, region: str | None = None) -> str:
+    """Build a cache key from region, endpoint, query params and generation.
+    
+    Args:
+        request: Incoming request
+        generation: Current data generation
+        ttl: Optional lifetime in seconds for time-dependent responses
+        region: Region served (defaults to CACHE_REGION)
+    
+    Returns:
+        Cache key
+    """
+    params = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    key = f"{region or CACHE_REGION}:{request.url.path}?{params}#g{generation}"
+    if ttl:
+        key += f"#t{int(time.time() // ttl)}"
+    return key
+
+
+async def _call_backend(method: Callable, *args) -> Any:
+    """Call a cache backend method without blocking the event loop."""
+    if response_cache.blocking:
+        return await run_in_threadpool(method, *args)
+    return method(*args)
+
+
+def _cached_response(request: Request, entry: tuple[str, bytes]) -> Response:
+    """Answer from a cache entry (304 if the client's copy is current)."""
+    etag, body = entry
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _make_entry(result: Any) -> tuple[str, bytes]:
+    """Serialize an endpoint result into an (etag, body) cache entry."""
+    body = json.dumps(jsonable_encoder(result), separators=(",", ":")).encode()
+    return make_etag(body), body
+
+
+def cached_endpoint(ttl: int | None = None) -> Callable:
+    """Cache a JSON endpoint until the data generation changes.
+    
+    The endpoint must take `request: Request` and `db` (a Session, or an
+    AsyncSession for async endpoints) keyword parameters. Responses carry a
+    strong ETag; a matching If-None-Match is answered with 304 without
+    running the endpoint.
+    
+    Args:
+        ttl: Also expire entries after this many seconds (for responses that
+            depend on the clock, like countdowns)
+    
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Response:
+                if response_cache is None:
+                    return await func(*args, **kwargs)
+                
+                request: Request = kwargs["request"]
+                key = cache_key(request, await kwargs["db"].run_sync(get_generation), ttl)
+                
+                entry = await _call_backend(response_cache.get, key)
+                if entry is None:
+                    entry = _make_entry(await func(*args, **kwargs))
+                    await _call_backend(response_cache.set, key, entry)
+                
+                return _cached_response(request, entry)
+            
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Response:
+            if response_cache is None:
+                return func(*args, **kwargs)
+            
+            request: Request = kwargs["request"]
+            key = cache_key(request, get_generation(kwargs["db"]), ttl)
+            
+            entry = response_cache.get(key)
+            if entry is None:
+                entry = _make_entry(func(*args, **kwargs))
+                response_cache.set(key, entry)
+            
+            return _cached_response(request, entry)
+        
+        return wrapper
+    
+    return decorator
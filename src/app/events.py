@@ -0,0 +1,143 @@
+"""Fan-out of Postgres NOTIFY events to server-sent event streams."""
+
+import asyncio
+import json
+import threading
+import time
+from typing import Any, AsyncIterator
+
+import psycopg
+from fastapi import Request
+
+from src.core.database import engine
+from src.core.events import EVENT_CHANNEL
+from src.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Comment line sent on idle streams so proxies keep the connection open
+KEEPALIVE_SECONDS = 15
+
+# Events buffered per client before the slowest clients start losing events
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class EventBroker:
+    """Listen on the event channel with one connection and fan out to clients.
+    
+    The listener thread starts with the first subscriber, so API processes
+    that never serve /events hold no extra database connection.
+    """
+    
+    def __init__(self, dsn: str, channel: str = EVENT_CHANNEL):
+        """Initialize broker.
+        
+        Args:
+            dsn: libpq connection string for the listener connection
+            channel: NOTIFY channel to listen on
+        """
+        self.dsn = dsn
+        self.channel = channel
+        self._subscribers: set[tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = set()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+    
+    def subscribe(self) -> asyncio.Queue:
+        """Register the calling event loop for events.
+        
+        Returns:
+            Queue receiving (event, data) tuples
+        """
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.add((asyncio.get_running_loop(), queue))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._listen, name="event-listener", daemon=True)
+                self._thread.start()
+        return queue
+    
+    def unsubscribe(self, queue: asyncio.Queue):
+        """Stop delivering events to a queue."""
+        with self._lock:
+            self._subscribers = {entry for entry in self._subscribers if entry[1] is not queue}
+    
+    def publish_local(self, event: str, data: dict[str, Any]):
+        """Deliver an event to this process's subscribers."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            loop.call_soon_threadsafe(_offer, queue, (event, data))
+    
+    def _listen(self):
+        """Listener thread: LISTEN, forward notifications, reconnect on errors."""
+        backoff = 1
+        while True:
+            with self._lock:
+                if not self._subscribers:
+                    self._thread = None
+                    return
+            try:
+                with psycopg.connect(self.dsn, autocommit=True) as conn:
+                    conn.execute(f"LISTEN {self.channel}")
+                    logger.info(f"Listening for events on {self.channel}")
+                    backoff = 1
+                    while True:
+                        # notifies(timeout=...) needs psycopg 3.2 (the declared minimum)
+                        for notify in conn.notifies(timeout=KEEPALIVE_SECONDS):
+                            self._dispatch(notify.payload)
+                        with self._lock:
+                            if not self._subscribers:
+                                break
+            except Exception as e:
+                logger.warning(f"Event listener error: {e}; reconnecting in {backoff}s")
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 60)
+    
+    def _dispatch(self, payload: str):
+        """Decode a notification payload and deliver it."""
+        try:
+            message = json.loads(payload)
+            self.publish_local(message["event"], message.get("data", {}))
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Ignoring malformed event payload: {e}")
+
+
+def _offer(queue: asyncio.Queue, item: tuple[str, dict[str, Any]]):
+    """Put an event on a client queue, dropping it if the client is too slow."""
+    try:
+        queue.put_nowait(item)
+    except asyncio.QueueFull:
+        pass
+
+
+def format_sse(event: str, data: dict[str, Any]) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def event_stream(request: Request, broker: "EventBroker") -> AsyncIterator[str]:
+    """Yield server-sent events for one client until it disconnects.
+    
+    Args:
+        request: Client request (checked for disconnects)
+        broker: Broker to subscribe to
+    
+    Yields:
+        SSE-formatted chunks
+    """
+    queue = broker.subscribe()
+    try:
+        # Tell the client how long to wait before reconnecting
+        yield "retry: 5000\n\n"
+        while not await request.is_disconnected():
+            try:
+                event, data = await asyncio.wait_for(queue.get(), timeout=KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield format_sse(event, data)
+    finally:
+        broker.unsubscribe(queue)
+
+
+event_broker = EventBroker(engine.url.set(drivername="postgresql").render_as_string(hide_password=False))
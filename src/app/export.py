@@ -0,0 +1,272 @@
+"""Streaming job exports (CSV, NDJSON, Parquet) in constant memory."""
+
+import csv
+import importlib.util
+import io
+import json
+import threading
+from typing import Any, Iterator
+
+from sqlalchemy import select
+
+from src.core.batch import stream_batches
+from src.core.database import API_SYNC_CONNECTIONS
+from src.core.models import Job
+from src.core.search import substring_filter
+
+# Rows fetched per round trip from the server-side cursor (and per Parquet row group)
+EXPORT_BATCH_SIZE = 2000
+
+# Seconds a client is told to wait (Retry-After) when every export slot is busy
+EXPORT_RETRY_AFTER = 30
+
+# Each stream holds a sync pool connection; these are the only sync
+# connections the API opens, so the async pool is sized to the rest
+_export_slots = threading.BoundedSemaphore(API_SYNC_CONNECTIONS)
+
+EXPORT_COLUMNS = (
+    Job.id,
+    Job.company,
+    Job.title,
+    Job.location,
+    Job.category,
+    Job.country,
+    Job.employment_type,
+    Job.tags,
+    Job.url,
+    Job.source,
+    Job.posted_at,
+    Job.first_seen_at,
+    Job.last_seen_at,
+    Job.is_active,
+)
+
+EXPORT_FIELDS = tuple(column.key for column in EXPORT_COLUMNS)
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def parquet_available() -> bool:
+    """Check whether the optional pyarrow dependency is installed."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def export_statement(
+    country: str | None = None,
+    company: str | None = None,
+    category: str | None = None,
+    is_active: bool | None = True,
+):
+    """Build the export SELECT (ordered by id so the output is stable).
+    
+    Args:
+        country: Only jobs for this country
+        company: Company name substring
+        category: Exact category
+        is_active: Filter by active status (None for all)
+    
+    Returns:
+        SQLAlchemy select statement
+    """
+    stmt = select(*EXPORT_COLUMNS)
+    if country:
+        stmt = stmt.where(Job.country == country)
+    if company:
+        stmt = stmt.where(substring_filter(Job.company, company))
+    if category:
+        stmt = stmt.where(Job.category == category)
+    if is_active is not None:
+        stmt = stmt.where(Job.is_active == is_active)
+    return stmt.order_by(Job.id)
+
+
+class ExportSlot:
+    """One of the API_SYNC_CONNECTIONS concurrent export streams."""
+    
+    def __init__(self):
+        self._released = False
+        self._lock = threading.Lock()
+    
+    def release(self):
+        """Give the slot back (safe to call more than once)."""
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        _export_slots.release()
+
+
+def acquire_export_slot() -> ExportSlot | None:
+    """Take a free export slot without waiting.
+    
+    Called before the response starts, so a busy server can still answer
+    with an error status instead of a truncated download.
+    
+    Returns:
+        The slot, or None if every slot is busy
+    """
+    if not _export_slots.acquire(blocking=False):
+        return None
+    return ExportSlot()
+
+
+def iter_export_batches(stmt, slot: ExportSlot, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[list[Any]]:
+    """Stream rows from a server-side cursor in batches.
+    
+    The session lives inside the generator so it stays open for as long as
+    the response is streaming, independent of the request's own session.
+    The slot is released when the generator finishes or is closed.
+    
+    Args:
+        stmt: Statement from export_statement
+        slot: Slot from acquire_export_slot
+        batch_size: Rows per batch
+    
+    Yields:
+        Lists of result rows
+    """
+    try:
+        yield from stream_batches(stmt, batch_size)
+    finally:
+        slot.release()
+
+
+def close_export(batches: Iterator[list[Any]], slot: ExportSlot):
+    """Close an export stream and release its slot once the response ends.
+    
+    Runs after the response, including when the client disconnected
+    before or during the download, when the generator may never have
+    started (and so would not release the slot itself).
+    
+    Args:
+        batches: Generator from iter_export_batches
+        slot: Its slot
+    """
+    try:
+        batches.close()
+    except ValueError:
+        pass  # still running in the threadpool; its finally releases the session
+    slot.release()
+
+
+def _plain(value: Any) -> Any:
+    """Convert a column value to a JSON/CSV friendly value."""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def stream_csv(batches: Iterator[list[Any]]) -> Iterator[bytes]:
+    """Encode batches as CSV (header first; tags joined with ", ")."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    yield buffer.getvalue().encode()
+    
+    for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        for row in batch:
+            writer.writerow(
+                ", ".join(value) if isinstance(value, list) else _plain(value)
+                for value in row
+            )
+        yield buffer.getvalue().encode()
+
+
+def stream_ndjson(batches: Iterator[list[Any]]) -> Iterator[bytes]:
+    """Encode batches as newline-delimited JSON objects."""
+    for batch in batches:
+        lines = [
+            json.dumps(dict(zip(EXPORT_FIELDS, map(_plain, row))))
+            for row in batch
+        ]
+        yield ("\n".join(lines) + "\n").encode()
+
+
+class _ChunkSink:
+    """Write-only file object that hands out what was written since the last drain."""
+    
+    def __init__(self):
+        """Initialize empty sink."""
+        self._chunks: list[bytes] = []
+        self._position = 0
+        self.closed = False
+    
+    def write(self, data) -> int:
+        """Buffer written bytes."""
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+    
+    def tell(self) -> int:
+        """Total bytes written so far."""
+        return self._position
+    
+    def flush(self):
+        """Nothing to flush; chunks are handed out by drain()."""
+        pass
+    
+    def close(self):
+        """Mark the sink closed."""
+        self.closed = True
+    
+    def drain(self) -> bytes:
+        """Return and forget everything written since the last drain."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_parquet(batches: Iterator[list[Any]]) -> Iterator[bytes]:
+    """Encode batches as Parquet, one row group per batch (requires pyarrow)."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    schema = pa.schema([
+        ("id", pa.string()),
+        ("company", pa.string()),
+        ("title", pa.string()),
+        ("location", pa.string()),
+        ("category", pa.string()),
+        ("country", pa.string()),
+        ("employment_type", pa.string()),
+        ("tags", pa.list_(pa.string())),
+        ("url", pa.string()),
+        ("source", pa.string()),
+        ("posted_at", pa.timestamp("us")),
+        ("first_seen_at", pa.timestamp("us")),
+        ("last_seen_at", pa.timestamp("us")),
+        ("is_active", pa.bool_()),
+    ])
+    
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    try:
+        for batch in batches:
+            columns = list(zip(*batch))
+            columns[0] = [str(value) for value in columns[0]]
+            writer.write_table(pa.Table.from_arrays(
+                [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+                schema=schema,
+            ))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+STREAM_ENCODERS = {
+    "csv": stream_csv,
+    "ndjson": stream_ndjson,
+    "parquet": stream_parquet,
+}
@@ -3,22 +3,48 @@
 from datetime import datetime
 from typing import Any
 
-from fastapi import Depends, FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from sqlalchemy import desc, func
-from sqlalchemy.orm import Session
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy import func, select
+from starlette.background import BackgroundTask
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, undefer
 import os
 
-from src.core.database import get_db
+from src.app.cache import cached_endpoint
+from src.app.events import event_broker, event_stream
+from src.app.export import (
+    EXPORT_FORMATS,
+    EXPORT_RETRY_AFTER,
+    STREAM_ENCODERS,
+    acquire_export_slot,
+    close_export,
+    export_statement,
+    iter_export_batches,
+    parquet_available,
+)
+from src.app.pagination import COUNT_ESTIMATE, COUNT_EXACT, apply_job_keyset, count_rows, page_response
+from src.core.changes import decode_change_cursor, encode_change_cursor, get_changes
+from src.core.async_database import get_async_db
+from src.core.config import get_settings
 from src.core.models import Alert, Job
+from src.core.rollup import get_rollup_stats
+from src.core.search import search_jobs, substring_filter
+from src.ingest.health_monitor import failing_sources, load_health_rows, summarize_health
+from src.ingest.run_history import get_latest_run, get_target_history
 from src.utils.logging_config import setup_logging
 
 setup_logging()
 
+settings = get_settings()
+
 # Get region from environment variable (us or india)
-REGION = os.getenv('REGION', 'us')
+REGION = settings.region
+
+# /search country value that searches every region
+ALL_COUNTRIES = "all"
 
 app = FastAPI(
     title="Job Tracker API",
@@ -83,72 +109,295 @@ def health_check() -> dict[str, str]:
     return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
 
 
+# Columns returned by /jobs (list views never need the cold content columns)
+JOB_LIST_COLUMNS = (
+    Job.id,
+    Job.company,
+    Job.title,
+    Job.location,
+    Job.category,
+    Job.tags,
+    Job.url,
+    Job.posted_at,
+    Job.first_seen_at,
+)
+
+
+# Field order of /jobs/changes upsert rows
+CHANGE_FIELDS = (
+    "id",
+    "company",
+    "title",
+    "location",
+    "category",
+    "tags",
+    "url",
+    "posted_at",
+    "first_seen_at",
+)
+
+
 @app.get("/jobs")
-def list_jobs(
+@cached_endpoint()
+async def list_jobs(
+    request: Request,
+    cursor: str | None = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     company: str | None = None,
+    title: str | None = None,
     category: str | None = None,
     is_active: bool = True,
-    db: Session = Depends(get_db),
+    count: str = Query(COUNT_EXACT, pattern="^(exact|estimate|none)$"),
+    db: AsyncSession = Depends(get_async_db),
 ) -> dict[str, Any]:
-    """List jobs with filtering and pagination.
+    """List jobs with filtering and keyset pagination.
+    
+    Pass the returned next_cursor back as cursor to fetch the following page;
+    each page is an index seek, so deep pages cost the same as the first.
     
     Args:
-        skip: Number of records to skip
+        request: Incoming request (cache key)
+        cursor: Cursor from the previous page's next_cursor
+        skip: Number of records to skip (legacy offset paging, ignored with cursor)
         limit: Maximum number of records to return
-        company: Filter by company name
+        company: Filter by company name substring
+        title: Filter by title substring
         category: Filter by category
         is_active: Filter by active status
+        count: Total count mode: exact (default), estimate (planner estimate,
+            opt-in for large unfiltered listings) or none
         db: Database session
         
     Returns:
         Dictionary with jobs and metadata
     """
-    query = db.query(Job)
+    def fetch_page(session: Session) -> tuple[int | None, list[Any], str | None]:
+        query = session.query(*JOB_LIST_COLUMNS)
+        
+        # Filter by region
+        query = query.filter(Job.country == REGION)
+        
+        # Apply filters
+        if company:
+            query = query.filter(substring_filter(Job.company, company))
+        
+        if title:
+            query = query.filter(substring_filter(Job.title, title))
+        
+        if category:
+            query = query.filter(Job.category == category)
+        
+        query = query.filter(Job.is_active == is_active)
+        
+        # Total is optional: only compute it on the first page
+        total = count_rows(session, query, count) if not cursor else None
+        
+        try:
+            page_query = apply_job_keyset(query, cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        if skip and not cursor:
+            page_query = page_query.offset(skip)
+        
+        jobs, next_cursor = page_response(page_query.limit(limit + 1).all(), limit)
+        return total, jobs, next_cursor
     
-    # Filter by region
-    query = query.filter(Job.country == REGION)
+    total, jobs, next_cursor = await db.run_sync(fetch_page)
     
-    # Apply filters
-    if company:
-        query = query.filter(Job.company.ilike(f"%{company}%"))
+    return {
+        "total": total,
+        "total_is_estimate": count == COUNT_ESTIMATE and total is not None,
+        "skip": skip,
+        "limit": limit,
+        "next_cursor": next_cursor,
+        "jobs": [
+            {
+                "id": str(job.id),
+                "company": job.company,
+                "title": job.title,
+                "location": job.location,
+                "category": job.category,
+                "tags": job.tags,
+                "url": job.url,
+                "posted_at": job.posted_at.isoformat() if job.posted_at else None,
+                "first_seen_at": job.first_seen_at.isoformat(),
+            }
+            for job in jobs
+        ],
+    }
+
+
+@app.get("/jobs/changes")
+@cached_endpoint()
+async def job_changes(
+    request: Request,
+    since: str | None = None,
+    limit: int = Query(1000, ge=1, le=5000),
+    db: AsyncSession = Depends(get_async_db),
+) -> dict[str, Any]:
+    """List jobs inserted, updated or closed since a change cursor.
     
-    if category:
-        query = query.filter(Job.category == category)
+    Start without since for a full sync, then keep passing back the returned
+    cursor; while has_more is true, request again straight away.
     
-    query = query.filter(Job.is_active == is_active)
+    Args:
+        request: Incoming request (cache key)
+        since: Cursor from the previous response
+        limit: Maximum number of changed jobs to return
+        db: Database session
+        
+    Returns:
+        Dictionary with cursor, has_more, upserts (compact rows in the order
+        of fields) and closed (IDs of jobs that are no longer active)
+    """
+    try:
+        since_seq = decode_change_cursor(since)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    # Get total count
-    total = query.count()
+    changes = await db.run_sync(get_changes, since=since_seq, country=REGION, limit=limit)
     
-    # Apply pagination and ordering
-    jobs = query.order_by(desc(Job.posted_at)).offset(skip).limit(limit).all()
+    return {
+        "cursor": encode_change_cursor(changes["cursor"]),
+        "has_more": changes["has_more"],
+        "fields": list(CHANGE_FIELDS),
+        "upserts": [
+            [
+                str(job.id),
+                job.company,
+                job.title,
+                job.location,
+                job.category,
+                job.tags,
+                job.url,
+                job.posted_at.isoformat() if job.posted_at else None,
+                job.first_seen_at.isoformat(),
+            ]
+            for job in changes["upserts"]
+        ],
+        "closed": [str(job_id) for job_id in changes["closed"]],
+    }
+
+
+@app.get("/search")
+@cached_endpoint()
+async def search(
+    request: Request,
+    q: str = Query(..., min_length=1),
+    category: str | None = None,
+    country: str = REGION,
+    company: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    facets: bool = True,
+    db: AsyncSession = Depends(get_async_db),
+) -> dict[str, Any]:
+    """Ranked full-text search over active jobs.
+    
+    Words are ANDed and prefix-matched against title, company, location and
+    a description excerpt.
+    
+    Args:
+        request: Incoming request (cache key)
+        q: Search text
+        category: Filter by category
+        country: Filter by country (this API's region if omitted, "all"
+            for every country)
+        company: Filter by exact company name
+        limit: Maximum number of results
+        offset: Number of results to skip
+        facets: Include counts by category, country and company
+        db: Database session
+        
+    Returns:
+        Dictionary with total, ranked results and facets
+    """
+    found = await db.run_sync(
+        search_jobs,
+        q,
+        category=category,
+        country=None if country == ALL_COUNTRIES else country,
+        company=company,
+        limit=limit,
+        offset=offset,
+        facets=facets,
+    )
     
     return {
-        "total": total,
-        "skip": skip,
+        "query": q,
+        "total": found["total"],
         "limit": limit,
-        "jobs": [
+        "offset": offset,
+        "facets": found["facets"],
+        "results": [
             {
                 "id": str(job.id),
                 "company": job.company,
                 "title": job.title,
                 "location": job.location,
-                "remote": job.remote,
                 "category": job.category,
+                "country": job.country,
                 "tags": job.tags,
                 "url": job.url,
                 "posted_at": job.posted_at.isoformat() if job.posted_at else None,
                 "first_seen_at": job.first_seen_at.isoformat(),
+                "rank": round(job.rank, 4),
             }
-            for job in jobs
+            for job in found["results"]
         ],
     }
 
 
+@app.get("/export")
+def export_jobs(
+    fmt: str = Query("csv", alias="format", pattern="^(csv|ndjson|parquet)$"),
+    company: str | None = None,
+    category: str | None = None,
+    is_active: bool | None = True,
+) -> StreamingResponse:
+    """Stream jobs as CSV, NDJSON or Parquet.
+    
+    Rows come from a server-side cursor and are encoded batch by batch, so
+    the first bytes go out immediately and memory stays flat for any size.
+    When every export slot is busy the request is answered with 503 and
+    Retry-After instead.
+    
+    Args:
+        fmt: Output format (query parameter "format")
+        company: Filter by company name substring
+        category: Filter by category
+        is_active: Filter by active status (omit for active jobs only)
+        
+    Returns:
+        Chunked file download
+    """
+    if fmt == "parquet" and not parquet_available():
+        raise HTTPException(status_code=501, detail="Parquet export requires pyarrow")
+    
+    slot = acquire_export_slot()
+    if slot is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many exports in progress",
+            headers={"Retry-After": str(EXPORT_RETRY_AFTER)},
+        )
+    
+    stmt = export_statement(country=REGION, company=company, category=category, is_active=is_active)
+    filename = f"jobs_{REGION}_{datetime.utcnow():%Y%m%d_%H%M%S}.{fmt}"
+    batches = iter_export_batches(stmt, slot)
+    
+    return StreamingResponse(
+        STREAM_ENCODERS[fmt](batches),
+        media_type=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        background=BackgroundTask(close_export, batches, slot),
+    )
+
+
 @app.get("/jobs/{job_id}")
-def get_job(job_id: str, db: Session = Depends(get_db)) -> dict[str, Any]:
+async def get_job(job_id: str, db: AsyncSession = Depends(get_async_db)) -> dict[str, Any]:
     """Get a specific job by ID.
     
     Args:
@@ -158,7 +407,7 @@ def get_job(job_id: str, db: Session = Depends(get_db)) -> dict[str, Any]:
     Returns:
         Job details
     """
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = await db.scalar(select(Job).options(undefer(Job.description_md)).where(Job.id == job_id))
     
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -170,7 +419,6 @@ def get_job(job_id: str, db: Session = Depends(get_db)) -> dict[str, Any]:
         "company": job.company,
         "title": job.title,
         "location": job.location,
-        "remote": job.remote,
         "employment_type": job.employment_type,
         "category": job.category,
         "tags": job.tags,
@@ -184,80 +432,66 @@ def get_job(job_id: str, db: Session = Depends(get_db)) -> dict[str, Any]:
 
 
 @app.get("/stats")
-def get_stats(db: Session = Depends(get_db)) -> dict[str, Any]:
+@cached_endpoint(ttl=60)  # alert delivery does not bump the generation
+async def get_stats(request: Request, db: AsyncSession = Depends(get_async_db)) -> dict[str, Any]:
     """Get tracker statistics.
     
     Args:
+        request: Incoming request (cache key)
         db: Database session
         
     Returns:
         Statistics dictionary
     """
-    total_jobs = db.query(func.count(Job.id)).filter(Job.country == REGION).scalar()
-    active_jobs = db.query(func.count(Job.id)).filter(Job.is_active == True, Job.country == REGION).scalar()
-    
-    # Jobs by company
-    jobs_by_company = (
-        db.query(Job.company, func.count(Job.id))
-        .filter(Job.is_active == True, Job.country == REGION)
-        .group_by(Job.company)
-        .all()
-    )
-    
-    # Jobs by category
-    jobs_by_category = (
-        db.query(Job.category, func.count(Job.id))
-        .filter(Job.is_active == True, Job.country == REGION)
-        .group_by(Job.category)
-        .all()
-    )
+    stats = await db.run_sync(get_rollup_stats, country=REGION)
     
     # Recent alerts
-    recent_alerts = db.query(func.count(Alert.id)).filter(
-        Alert.sent_at >= datetime.utcnow().replace(hour=0, minute=0, second=0)
-    ).scalar()
+    recent_alerts = await db.scalar(
+        select(func.count(Alert.id)).where(
+            Alert.status == "sent",
+            Alert.sent_at >= datetime.utcnow().replace(hour=0, minute=0, second=0),
+        )
+    )
     
     return {
-        "total_jobs": total_jobs,
-        "active_jobs": active_jobs,
-        "jobs_by_company": {company: count for company, count in jobs_by_company},
+        "total_jobs": stats["total_jobs"],
+        "active_jobs": stats["active_jobs"],
+        "jobs_by_company": stats["jobs_by_company"],
         "jobs_by_category": {
-            category or "uncategorized": count for category, count in jobs_by_category
+            category or "uncategorized": count for category, count in stats["jobs_by_category"].items()
         },
         "alerts_sent_today": recent_alerts,
     }
 
 
 @app.get("/companies")
-def list_companies(db: Session = Depends(get_db)) -> dict[str, Any]:
+@cached_endpoint()
+async def list_companies(request: Request, db: AsyncSession = Depends(get_async_db)) -> dict[str, Any]:
     """List all companies with active jobs.
     
     Args:
+        request: Incoming request (cache key)
         db: Database session
         
     Returns:
         List of companies
     """
-    companies = (
-        db.query(Job.company, func.count(Job.id).label("job_count"))
-        .filter(Job.is_active == True, Job.country == REGION)
-        .group_by(Job.company)
-        .order_by(desc("job_count"))
-        .all()
-    )
+    jobs_by_company = (await db.run_sync(get_rollup_stats, country=REGION))["jobs_by_company"]
     
     return {
         "companies": [
-            {"name": company, "job_count": count} for company, count in companies
+            {"name": company, "job_count": count} for company, count in jobs_by_company.items()
         ]
     }
 
 
 @app.get("/scraper-status")
-def scraper_status(db: Session = Depends(get_db)) -> dict[str, Any]:
+@cached_endpoint(ttl=60)
+async def scraper_status(request: Request, db: AsyncSession = Depends(get_async_db)) -> dict[str, Any]:
     """Get scraper status - last run and next scheduled run.
     
     Args:
+        request: Incoming request (cache key)
         db: Database session
         
     Returns:
@@ -265,31 +499,25 @@ def scraper_status(db: Session = Depends(get_db)) -> dict[str, Any]:
     """
     from datetime import timedelta, timezone
     
-    # Get the most recently created job to determine last scrape
-    last_job = db.query(Job).order_by(desc(Job.created_at)).first()
+    # Indexed point lookups on scrape_runs
+    last_run = await db.run_sync(get_latest_run)
+    current_run = await db.run_sync(get_latest_run, finished=False)
     
-    # Get the most recent alert to see when scraper last ran
-    last_alert = db.query(Alert).order_by(desc(Alert.sent_at)).first()
-    
-    # Calculate last scrape time (use the most recent between job creation and alert)
     last_scrape = None
-    if last_job and last_alert:
-        # Make sure both are timezone-aware
-        job_time = last_job.created_at.replace(tzinfo=timezone.utc) if last_job.created_at.tzinfo is None else last_job.created_at
-        alert_time = last_alert.sent_at.replace(tzinfo=timezone.utc) if last_alert.sent_at.tzinfo is None else last_alert.sent_at
-        last_scrape = max(job_time, alert_time)
-    elif last_job:
-        last_scrape = last_job.created_at.replace(tzinfo=timezone.utc) if last_job.created_at.tzinfo is None else last_job.created_at
-    elif last_alert:
-        last_scrape = last_alert.sent_at.replace(tzinfo=timezone.utc) if last_alert.sent_at.tzinfo is None else last_alert.sent_at
-    
-    # Calculate next scrape (every 4 hours)
+    if last_run:
+        last_scrape = last_run.finished_at
+        if last_scrape.tzinfo is None:
+            last_scrape = last_scrape.replace(tzinfo=timezone.utc)
+    
+    interval_hours = settings.scrape_interval_hours
+    
+    # Calculate next scrape
     next_scrape = None
     hours_until_next = None
     minutes_until_next = None
     
     if last_scrape:
-        next_scrape = last_scrape + timedelta(hours=4)
+        next_scrape = last_scrape + timedelta(hours=interval_hours)
         now = datetime.now(timezone.utc)
         time_until_next = next_scrape - now
         
@@ -307,5 +535,108 @@ def scraper_status(db: Session = Depends(get_db)) -> dict[str, Any]:
         "next_scrape_at": next_scrape.isoformat() if next_scrape else None,
         "hours_until_next": hours_until_next,
         "minutes_until_next": minutes_until_next,
-        "scrape_interval_hours": 4,
+        "scrape_interval_hours": interval_hours,
+        "is_running": bool(current_run and current_run.finished_at is None),
+        "last_run": {
+            "id": str(last_run.id),
+            "status": last_run.status,
+            "started_at": last_run.started_at.isoformat(),
+            "duration_seconds": last_run.duration_seconds,
+            "companies_processed": last_run.companies_processed,
+            "jobs_new": last_run.jobs_new,
+            "jobs_updated": last_run.jobs_updated,
+            "errors": last_run.errors,
+            "export_status": last_run.export_status,
+            "export_seconds": last_run.export_seconds,
+        } if last_run else None,
+    }
+
+
+@app.get("/sources/health")
+@cached_endpoint(ttl=60)
+async def source_health(
+    request: Request,
+    min_failures: int = Query(3, ge=1, description="Failures before a source is listed as failing"),
+    db: AsyncSession = Depends(get_async_db),
+) -> dict[str, Any]:
+    """Get job source health - status counts and failing sources.
+    
+    Health is written once per run, so one url_health scan serves a minute
+    of requests.
+    
+    Args:
+        request: Incoming request (cache key)
+        min_failures: Failures before a source is listed as failing
+        db: Database session
+        
+    Returns:
+        Health summary and failing sources
+    """
+    rows = await db.run_sync(load_health_rows)
+    return {
+        "summary": summarize_health(rows),
+        "failing": failing_sources(rows, min_failures),
+    }
+
+
+@app.get("/events")
+async def events(request: Request) -> StreamingResponse:
+    """Stream data change events (server-sent events).
+    
+    Emits run_finished when a scrape run completes and jobs_new when a
+    company's new jobs are committed, so clients refresh only when data
+    actually changes instead of polling.
+    
+    Args:
+        request: Incoming request
+        
+    Returns:
+        text/event-stream response
+    """
+    return StreamingResponse(
+        event_stream(request, event_broker),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/scraper-status/history")
+@cached_endpoint()
+async def scrape_history(
+    request: Request,
+    company: str,
+    limit: int = Query(20, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db),
+) -> dict[str, Any]:
+    """Get per-run scrape timings for a company.
+    
+    Args:
+        request: Incoming request (cache key)
+        company: Company name
+        limit: Maximum number of runs
+        db: Database session
+        
+    Returns:
+        Recent fetch/normalize/persist timings, newest first
+    """
+    history = await db.run_sync(get_target_history, company, limit)
+    
+    return {
+        "company": company,
+        "runs": [
+            {
+                "run_id": str(target.run_id),
+                "started_at": target.started_at.isoformat(),
+                "fetch_seconds": target.fetch_seconds,
+                "normalize_seconds": target.normalize_seconds,
+                "persist_seconds": target.persist_seconds,
+                "total_seconds": target.total_seconds,
+                "bytes_fetched": target.bytes_fetched,
+                "jobs_fetched": target.jobs_fetched,
+                "jobs_new": target.jobs_new,
+                "jobs_updated": target.jobs_updated,
+                "error": target.error_message,
+            }
+            for target in history
+        ],
     }
@@ -0,0 +1,136 @@
+"""Keyset (cursor) pagination helpers for list endpoints."""
+
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import and_, or_, tuple_
+from sqlalchemy.orm import Query, Session
+
+from src.core.models import Job
+
+COUNT_EXACT = "exact"
+COUNT_ESTIMATE = "estimate"
+COUNT_NONE = "none"
+
+
+def encode_cursor(posted_at: datetime | None, job_id: uuid.UUID) -> str:
+    """Encode the sort key of the last row on a page into an opaque cursor.
+    
+    Args:
+        posted_at: posted_at of the last row
+        job_id: ID of the last row
+    
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([posted_at.isoformat() if posted_at else None, str(job_id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime | None, uuid.UUID]:
+    """Decode a cursor produced by encode_cursor.
+    
+    Args:
+        cursor: Cursor string
+    
+    Returns:
+        Tuple of (posted_at, job_id)
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        posted_at, job_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return (
+            datetime.fromisoformat(posted_at) if posted_at else None,
+            uuid.UUID(job_id),
+        )
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def apply_job_keyset(query: Query, cursor: str | None) -> Query:
+    """Order a jobs query newest-first and seek past a cursor.
+    
+    Sort order is (posted_at DESC NULLS FIRST, id DESC), Postgres' default
+    for DESC, so the seek condition can be served by the feed index.
+    
+    Args:
+        query: Query selecting from jobs
+        cursor: Cursor of the last row of the previous page (None for first page)
+    
+    Returns:
+        Ordered (and filtered) query
+    """
+    if cursor:
+        posted_at, job_id = decode_cursor(cursor)
+        if posted_at is None:
+            # Still inside the leading NULL block
+            query = query.filter(
+                or_(
+                    and_(Job.posted_at.is_(None), Job.id < job_id),
+                    Job.posted_at.isnot(None),
+                )
+            )
+        else:
+            query = query.filter(tuple_(Job.posted_at, Job.id) < (posted_at, job_id))
+    
+    return query.order_by(Job.posted_at.desc(), Job.id.desc())
+
+
+def estimate_count(db: Session, query: Query) -> int:
+    """Estimate the row count of a query from the planner instead of scanning.
+    
+    Args:
+        db: Database session
+        query: Query to estimate
+    
+    Returns:
+        Planner row estimate
+    """
+    connection = db.connection()
+    compiled = query.statement.compile(dialect=connection.dialect)
+    result = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params)
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_rows(db: Session, query: Query, mode: str) -> int | None:
+    """Count rows for a list response according to the requested mode.
+    
+    Args:
+        db: Database session
+        query: Filtered query (without ordering/limit)
+        mode: One of 'exact', 'estimate' or 'none'
+    
+    Returns:
+        Row count, or None when counting is disabled
+    """
+    if mode == COUNT_EXACT:
+        return query.order_by(None).count()
+    if mode == COUNT_ESTIMATE:
+        return estimate_count(db, query.order_by(None))
+    return None
+
+
+def page_response(rows: list[Any], limit: int) -> tuple[list[Any], str | None]:
+    """Trim a limit+1 result to a page and build the next cursor.
+    
+    Args:
+        rows: Rows fetched with limit + 1
+        limit: Page size
+    
+    Returns:
+        Tuple of (page rows, next cursor or None on the last page)
+    """
+    page = rows[:limit]
+    if len(rows) <= limit:
+        return page, None
+    last = page[-1]
+    return page, encode_cursor(last.posted_at, last.id)
@@ -0,0 +1,45 @@
+"""Async database engine and sessions for the API (psycopg async driver)."""
+
+from typing import AsyncGenerator
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core.config import get_settings
+from src.core.database import API_SYNC_CONNECTIONS, MAX_OVERFLOW, POOL_SIZE
+
+settings = get_settings()
+
+# Connections an API process holds outside this pool: export streams on the
+# sync engine (capped at API_SYNC_CONNECTIONS) and the event listener
+API_RESERVED_CONNECTIONS = API_SYNC_CONNECTIONS + 1
+
+# Same URL as the sync engine; postgresql+psycopg picks the async psycopg
+# dialect here, so waiting on the database never blocks a thread. Sized so
+# both engines together stay within one process budget (POOL_SIZE +
+# MAX_OVERFLOW) instead of doubling it
+async_engine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    pool_pre_ping=True,
+    pool_size=POOL_SIZE - API_RESERVED_CONNECTIONS,
+    max_overflow=MAX_OVERFLOW,
+    pool_recycle=3600,
+    pool_timeout=30,
+    connect_args={
+        'connect_timeout': 10,
+        'options': '-c statement_timeout=60000'
+    }
+)
+
+# Objects stay readable after the session ends (responses are built from them)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for async FastAPI endpoints to get a database session.
+    
+    Query helpers written for sync sessions (stats, search, pagination) run
+    unchanged through `await db.run_sync(helper, ...)`.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,71 @@
+"""Data access for batch entry points (CLI, exports, cleanup, maintenance scripts).
+
+Scripts share the process-wide engine and session factory from
+src.core.database (one pool per process, the same pool settings as the
+API) instead of creating their own engines, and read large result sets
+through server-side cursors instead of loading whole tables.
+"""
+
+from contextlib import contextmanager
+from typing import Any, Generator, Iterator
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.core.database import get_db_context
+
+# Rows fetched per round trip from a server-side cursor
+BATCH_SIZE = 2000
+
+# Long scans may outlive the engine's default 60 second statement timeout
+BATCH_STATEMENT_TIMEOUT_MS = 600_000
+
+
+@contextmanager
+def batch_session(statement_timeout_ms: int | None = BATCH_STATEMENT_TIMEOUT_MS) -> Generator[Session, None, None]:
+    """Session for batch work (committed on success, rolled back on error).
+    
+    Args:
+        statement_timeout_ms: Statement timeout for this transaction (None keeps the default)
+    
+    Yields:
+        Database session
+    """
+    with get_db_context() as db:
+        if statement_timeout_ms:
+            db.execute(
+                text("SELECT set_config('statement_timeout', :timeout, true)"),
+                {"timeout": str(statement_timeout_ms)},
+            )
+        yield db
+
+
+def stream_rows(stmt, batch_size: int = BATCH_SIZE) -> Iterator[Any]:
+    """Stream result rows from a server-side cursor.
+    
+    The session lives inside the generator, so it stays open only while
+    the caller is iterating.
+    
+    Args:
+        stmt: Select statement (select columns, not entities, for wide tables)
+        batch_size: Rows per fetch
+    
+    Yields:
+        Result rows
+    """
+    with batch_session() as db:
+        yield from db.execute(stmt.execution_options(yield_per=batch_size))
+
+
+def stream_batches(stmt, batch_size: int = BATCH_SIZE) -> Iterator[list[Any]]:
+    """Stream result rows from a server-side cursor, a batch at a time.
+    
+    Args:
+        stmt: Select statement
+        batch_size: Rows per batch
+    
+    Yields:
+        Lists of result rows
+    """
+    with batch_session() as db:
+        yield from db.execute(stmt.execution_options(yield_per=batch_size)).partitions()
@@ -0,0 +1,142 @@
+"""Change sequence for delta sync (jobs changed since a client cursor).
+
+A trigger on jobs clears change_seq whenever a client-visible column
+changes. Writers call stamp_changes() right before commit, which assigns
+sequence values under an exclusive advisory lock held until commit; readers
+take the same lock shared. Together this means every sequence value a
+reader can see is already committed, so a client cursor never skips a row
+that was written by a transaction that committed late.
+
+Writers that also bump the data generation (src.core.generation) must
+stamp first: the advisory lock is always taken before the data_generation
+row lock, so a scrape and a cleanup cannot deadlock on the pair.
+"""
+
+from typing import Any
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from src.core.models import Job
+
+# pg_advisory_xact_lock key guarding change_seq assignment
+CHANGE_LOCK_KEY = 0x4A4F4253  # "JOBS"
+
+# Columns returned for changed jobs (same shape as /jobs list entries)
+CHANGE_COLUMNS = (
+    Job.id,
+    Job.company,
+    Job.title,
+    Job.location,
+    Job.category,
+    Job.tags,
+    Job.url,
+    Job.posted_at,
+    Job.first_seen_at,
+    Job.is_active,
+    Job.change_seq,
+)
+
+# Rows another writer holds are skipped: that writer stamps them itself, and
+# waiting on them while holding the advisory lock could deadlock
+STAMP_SQL = text("""
+    UPDATE jobs SET change_seq = nextval('jobs_change_seq')
+    WHERE id IN (
+        SELECT id FROM jobs WHERE change_seq IS NULL
+        ORDER BY id
+        FOR UPDATE SKIP LOCKED
+    )
+""")
+
+
+def stamp_changes(db: Any) -> int:
+    """Assign change sequence values to rows changed in this transaction.
+    
+    Call right before commit in every transaction that writes jobs, and
+    before bump_generation(). The exclusive lock is held until the commit,
+    which keeps sequence order equal to commit order.
+    
+    Args:
+        db: Database session or connection (joins its transaction)
+    
+    Returns:
+        Number of rows stamped
+    """
+    db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": CHANGE_LOCK_KEY})
+    return db.execute(STAMP_SQL).rowcount
+
+
+def encode_change_cursor(change_seq: int) -> str:
+    """Encode a change sequence value as an opaque cursor."""
+    return str(change_seq)
+
+
+def decode_change_cursor(cursor: str | None) -> int:
+    """Decode a change cursor (empty means "from the beginning").
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return 0
+    try:
+        value = int(cursor)
+    except ValueError:
+        raise ValueError("Invalid change cursor") from None
+    if value < 0:
+        raise ValueError("Invalid change cursor")
+    return value
+
+
+def get_changes(
+    db: Session,
+    since: int = 0,
+    country: str | None = None,
+    limit: int = 1000,
+) -> dict[str, Any]:
+    """Get jobs inserted, updated or closed after a change cursor.
+    
+    Args:
+        db: Database session
+        since: Change sequence value from the previous response
+        country: Only jobs for this country
+        limit: Maximum number of changed rows
+    
+    Returns:
+        Dictionary with cursor (pass back as since), has_more, upserts
+        (active jobs, new or changed) and closed (IDs of deactivated jobs)
+    """
+    # Waits for writers that are between stamping and commit
+    db.execute(text("SELECT pg_advisory_xact_lock_shared(:key)"), {"key": CHANGE_LOCK_KEY})
+    
+    query = db.query(*CHANGE_COLUMNS).filter(Job.change_seq > since)
+    if country:
+        query = query.filter(Job.country == country)
+    rows = query.order_by(Job.change_seq).limit(limit + 1).all()
+    
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    
+    return {
+        "cursor": rows[-1].change_seq if rows else since,
+        "has_more": has_more,
+        "upserts": [row for row in rows if row.is_active],
+        "closed": [row.id for row in rows if not row.is_active],
+    }
+
+
+def get_change_head(db: Session) -> int:
+    """Get the highest committed change sequence value.
+    
+    Every row at or below the returned value is committed, so a reader may
+    stream the range (since, head] later in its own transaction without
+    holding the lock.
+    
+    Args:
+        db: Database session
+    
+    Returns:
+        Highest change_seq (0 if none)
+    """
+    db.execute(text("SELECT pg_advisory_xact_lock_shared(:key)"), {"key": CHANGE_LOCK_KEY})
+    return db.query(func.max(Job.change_seq)).scalar() or 0
@@ -35,6 +35,7 @@ class Settings(BaseSettings):
     smtp_pass: str | None = None
     smtp_from: str | None = None
     smtp_to: str | None = None
+    smtp_starttls: bool = True  # off for local sinks without TLS (see src/utils/smtp_sink.py)
     pushover_token: str | None = None
     pushover_user: str | None = None
 
@@ -42,12 +43,29 @@ class Settings(BaseSettings):
     playwright_headless: bool = True
     requests_timeout: int = 25
     http_max_rps: float = 2.0
+    scrape_interval_hours: float = 4.0
+
+    # Post-run Excel export: thread (background thread), celery, inline or off
+    post_run_export: str = "thread"
+    post_run_export_delta: bool = False  # only jobs changed since the last export
+
+    # Notification outbox delivery: thread, celery, inline or off (queue only)
+    notification_delivery: str = "thread"
+    notification_max_attempts: int = 5
+
+    # Parquet snapshots for offline analysis (requires pyarrow)
+    snapshot_dir: str = "data/snapshots"
+
+    # API response cache (memory, redis or off)
+    api_cache_backend: str = "memory"
+    api_cache_max_entries: int = 512
 
     # Sentry
     sentry_dsn: str | None = None
 
     # General
     environment: str = "development"
+    region: str = "us"  # country served by this API instance (us or india)
     log_level: str = "INFO"
 
     @field_validator("database_url")
@@ -92,6 +110,13 @@ class ConfigLoader:
         """Load filters.yaml configuration."""
         return self.load_yaml("filters.yaml")
 
+    def load_raw_data_retention(self) -> dict[str, Any]:
+        """Load raw_data_retention.yaml configuration (empty if missing)."""
+        try:
+            return self.load_yaml("raw_data_retention.yaml")
+        except FileNotFoundError:
+            return {}
+
 
 @lru_cache()
 def get_config_loader() -> ConfigLoader:
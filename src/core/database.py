@@ -18,13 +18,21 @@ logging.getLogger('sqlalchemy.pool').setLevel(logging.CRITICAL)
 logging.getLogger('sqlalchemy.dialects').setLevel(logging.CRITICAL)
 logging.getLogger('sqlalchemy.orm').setLevel(logging.CRITICAL)
 
+# Connections one process may hold (pool_size + max_overflow). The API
+# splits this budget: API_SYNC_CONNECTIONS go to export streams on this
+# engine, one to the event listener and the rest to the async engine
+# (src/core/async_database.py)
+POOL_SIZE = 20
+MAX_OVERFLOW = 40
+API_SYNC_CONNECTIONS = 4
+
 # Create engine with optimized pool settings for parallel scraping
 engine = create_engine(
     settings.database_url,
     echo=False,  # Disable SQL logging for cleaner output
     pool_pre_ping=True,  # Verify connections before using
-    pool_size=20,  # Larger pool for parallel operations (was 10)
-    max_overflow=40,  # More overflow connections (was 20)
+    pool_size=POOL_SIZE,  # Larger pool for parallel operations (was 10)
+    max_overflow=MAX_OVERFLOW,  # More overflow connections (was 20)
     pool_recycle=3600,  # Recycle connections after 1 hour
     pool_timeout=30,  # Wait up to 30 seconds for a connection
     connect_args={
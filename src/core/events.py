@@ -0,0 +1,30 @@
+"""Data change events published over Postgres LISTEN/NOTIFY."""
+
+import json
+from typing import Any
+
+from sqlalchemy import text
+
+# NOTIFY channel the API listens on
+EVENT_CHANNEL = "job_tracker_events"
+
+RUN_FINISHED = "run_finished"
+JOBS_NEW = "jobs_new"
+
+
+def publish_event(db: Any, event: str, data: dict[str, Any]):
+    """Queue an event in the caller's transaction.
+    
+    Postgres delivers the notification when the transaction commits (and
+    drops it on rollback), so listeners never hear about uncommitted data.
+    
+    Args:
+        db: Database session or connection
+        event: Event name (RUN_FINISHED, JOBS_NEW)
+        data: JSON-serializable payload (keep it small; NOTIFY caps at 8000 bytes)
+    """
+    payload = json.dumps({"event": event, "data": data}, default=str)
+    db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": EVENT_CHANNEL, "payload": payload},
+    )
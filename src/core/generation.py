@@ -0,0 +1,53 @@
+"""Data generation counter used to invalidate cached API responses."""
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.core.models import DataGeneration
+
+GENERATION_ROW_ID = 1
+
+
+def get_generation(db: Session) -> int:
+    """Get the current data generation.
+    
+    Args:
+        db: Database session
+    
+    Returns:
+        Current generation (0 if never bumped)
+    """
+    generation = (
+        db.query(DataGeneration.generation)
+        .filter(DataGeneration.id == GENERATION_ROW_ID)
+        .scalar()
+    )
+    return generation or 0
+
+
+def bump_generation(db: Session) -> int:
+    """Increment the data generation inside the caller's transaction.
+    
+    Call this in the same transaction that changes job data, so readers see
+    the new generation exactly when the new data becomes visible.
+    
+    Args:
+        db: Database session
+    
+    Returns:
+        New generation
+    """
+    stmt = (
+        insert(DataGeneration)
+        .values(id=GENERATION_ROW_ID, generation=1)
+        .on_conflict_do_update(
+            index_elements=[DataGeneration.id],
+            set_={
+                "generation": DataGeneration.generation + 1,
+                "updated_at": func.now(),
+            },
+        )
+        .returning(DataGeneration.generation)
+    )
+    return db.execute(stmt).scalar()
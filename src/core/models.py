@@ -5,19 +5,24 @@ from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
+    Date,
     DateTime,
     Enum,
+    FetchedValue,
+    Float,
     ForeignKey,
     Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 
 from src.core.database import Base
@@ -66,9 +71,9 @@ class Job(Base):
     first_seen_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     last_seen_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     
-    # Content
+    # Content (description is cold: deferred so list/aggregate queries skip it)
     url = Column(Text, nullable=False)
-    description_md = Column(Text, nullable=True)
+    description_md = deferred(Column(Text, nullable=True), group="content")
     
     # Deduplication and versioning
     hash_stable = Column(String(64), nullable=False, index=True)
@@ -97,8 +102,8 @@ class Job(Base):
     applied_at = Column(DateTime(timezone=True), nullable=True)
     notes = Column(Text, nullable=True)
     
-    # Metadata
-    raw_data = Column(JSONB, nullable=True)
+    # Metadata (raw_data is cold: deferred, lz4-compressed and stored out of line)
+    raw_data = deferred(Column(JSONB(none_as_null=True), nullable=True), group="content")
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True),
@@ -107,6 +112,18 @@ class Job(Base):
         onupdate=func.now(),
     )
     
+    # Delta-sync position: cleared by a trigger on client-visible changes and
+    # stamped from jobs_change_seq at commit (see src/core/changes.py)
+    change_seq = Column(BigInteger, nullable=True)
+    
+    # Weighted full-text document (title/company rank above location, only a
+    # bounded excerpt of the description). Maintained by the jobs_search_vector
+    # trigger when its inputs change (migration 014), never written by us
+    search_vector = deferred(
+        Column(TSVECTOR, server_default=FetchedValue(), server_onupdate=FetchedValue()),
+        group="search",
+    )
+    
     # Relationships
     versions = relationship("JobVersion", back_populates="job", cascade="all, delete-orphan")
     alerts = relationship("Alert", back_populates="job", cascade="all, delete-orphan")
@@ -118,6 +135,14 @@ class Job(Base):
         Index("idx_jobs_location", "location"),
         Index("idx_jobs_posted_at", "posted_at"),
         Index("idx_jobs_tags", "tags", postgresql_using="gin"),
+        # Keyset feed for /jobs; scanned backwards for posted_at DESC, id DESC
+        Index("idx_jobs_feed", "country", "is_active", "posted_at", "id"),
+        Index("idx_jobs_search_vector", "search_vector", postgresql_using="gin"),
+        Index("idx_jobs_change_seq", "country", "change_seq"),
+        Index("idx_jobs_change_pending", "id", postgresql_where=text("change_seq IS NULL")),
+        # pg_trgm indexes for ILIKE '%...%' company/title filters
+        Index("idx_jobs_company_trgm", "company", postgresql_using="gin", postgresql_ops={"company": "gin_trgm_ops"}),
+        Index("idx_jobs_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
     )
 
     def __repr__(self) -> str:
@@ -204,6 +229,9 @@ class Alert(Base):
     error_message = Column(Text, nullable=True)
     retry_count = Column(Integer, default=0)
     
+    # Outbox: when a pending alert is next due (see src/ingest/notification_outbox.py)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=True)
+    
     # Additional data
     alert_metadata = Column(JSONB, nullable=True)
     
@@ -213,7 +241,153 @@ class Alert(Base):
     __table_args__ = (
         Index("idx_alerts_job_id", "job_id"),
         Index("idx_alerts_sent_at", "sent_at"),
+        Index(
+            "idx_alerts_outbox",
+            "sent_via",
+            "next_attempt_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
     )
 
     def __repr__(self) -> str:
         return f"<Alert(id={self.id}, job_id={self.job_id}, type={self.alert_type}, via={self.sent_via})>"
+
+
+class ExportWatermark(Base):
+    """Position of an incremental export in the jobs change sequence."""
+
+    __tablename__ = "export_watermarks"
+
+    name = Column(String(100), primary_key=True)  # e.g. 'master_log', 'excel'
+    change_seq = Column(BigInteger, nullable=False, default=0)  # exported up to here
+    snapshot_seq = Column(BigInteger, nullable=False, default=0)  # compacted up to here
+    exported_at = Column(DateTime(timezone=True), nullable=True)
+    rows_exported = Column(Integer, nullable=True)  # rows in the last delta
+
+    def __repr__(self) -> str:
+        return f"<ExportWatermark(name={self.name}, change_seq={self.change_seq})>"
+
+
+class DataGeneration(Base):
+    """Single-row counter bumped whenever job data visible to readers changes."""
+
+    __tablename__ = "data_generation"
+
+    id = Column(Integer, primary_key=True, default=1)
+    generation = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<DataGeneration(generation={self.generation})>"
+
+
+class JobStatsRollup(Base):
+    """Incrementally maintained job counts per (country, company, category, day, status).
+    
+    NULL country/category are stored as '' so they can be part of the key.
+    """
+
+    __tablename__ = "job_stats_rollup"
+
+    country = Column(String(50), primary_key=True)
+    company = Column(String(255), primary_key=True)
+    category = Column(String(100), primary_key=True)
+    day = Column(Date, primary_key=True)  # UTC date of first_seen_at
+    is_active = Column(Boolean, primary_key=True)
+    job_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return f"<JobStatsRollup(company={self.company}, category={self.category}, day={self.day}, count={self.job_count})>"
+
+
+class ScrapeRun(Base):
+    """One execution of the scraping pipeline."""
+
+    __tablename__ = "scrape_runs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    
+    # Timing
+    started_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    duration_seconds = Column(Float, nullable=True)
+    
+    # Outcome
+    status = Column(String(50), nullable=False, default="running")  # 'running', 'success', 'failed'
+    country = Column(String(50), nullable=True)
+    error_message = Column(Text, nullable=True)
+    
+    # Totals
+    companies_processed = Column(Integer, default=0)
+    jobs_fetched = Column(Integer, default=0)
+    jobs_filtered = Column(Integer, default=0)
+    jobs_new = Column(Integer, default=0)
+    jobs_updated = Column(Integer, default=0)
+    errors = Column(Integer, default=0)
+    bytes_fetched = Column(BigInteger, default=0)
+    notifications_sent = Column(Integer, default=0)
+    
+    # Post-run export (runs after the scrape, see src/ingest/post_run_export.py)
+    export_status = Column(String(50), nullable=True)  # 'pending', 'success', 'failed'
+    export_seconds = Column(Float, nullable=True)
+    
+    # Relationship
+    targets = relationship("ScrapeRunTarget", back_populates="run", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        Index("idx_scrape_runs_started_at", "started_at"),
+        Index("idx_scrape_runs_finished_at", "finished_at"),
+        Index(
+            "idx_scrape_runs_export_pending",
+            "started_at",
+            postgresql_where=text("export_status = 'pending'"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ScrapeRun(id={self.id}, started_at={self.started_at}, status={self.status})>"
+
+
+class ScrapeRunTarget(Base):
+    """Per-company timing and results within a scrape run."""
+
+    __tablename__ = "scrape_run_targets"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    run_id = Column(UUID(as_uuid=True), ForeignKey("scrape_runs.id"), nullable=False)
+    
+    # Target
+    company = Column(String(255), nullable=False)
+    ats_type = Column(String(50), nullable=True)
+    started_at = Column(DateTime(timezone=True), nullable=False)
+    
+    # Phase durations
+    fetch_seconds = Column(Float, nullable=True)
+    normalize_seconds = Column(Float, nullable=True)
+    persist_seconds = Column(Float, nullable=True)
+    total_seconds = Column(Float, nullable=True)
+    
+    # Results
+    bytes_fetched = Column(BigInteger, default=0)
+    jobs_fetched = Column(Integer, default=0)
+    jobs_filtered = Column(Integer, default=0)
+    jobs_new = Column(Integer, default=0)
+    jobs_updated = Column(Integer, default=0)
+    error_message = Column(Text, nullable=True)
+    
+    # Relationship
+    run = relationship("ScrapeRun", back_populates="targets")
+    
+    __table_args__ = (
+        Index("idx_scrape_run_targets_run_id", "run_id"),
+        Index("idx_scrape_run_targets_company_started", "company", "started_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ScrapeRunTarget(company={self.company}, total_seconds={self.total_seconds})>"
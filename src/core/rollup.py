@@ -0,0 +1,195 @@
+"""Incrementally maintained job count rollup."""
+
+from collections import Counter
+from datetime import date, datetime, timezone
+from typing import Any
+
+from sqlalchemy import Date, cast, func, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.core.models import Job, JobStatsRollup
+from src.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Stored in place of NULL country/category (they are part of the primary key)
+NO_VALUE = ""
+
+BUCKET_COLUMNS = ("country", "company", "category", "day", "is_active")
+
+
+def utc_day(value: datetime) -> date:
+    """Get the UTC calendar day of a timestamp (naive values are taken as UTC)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.date()
+
+
+def bucket_for(
+    country: str | None,
+    company: str,
+    category: str | None,
+    first_seen_at: datetime,
+    is_active: bool | None,
+) -> tuple:
+    """Build the rollup bucket key for a job.
+    
+    Args:
+        country: Job country
+        company: Company name
+        category: Job category
+        first_seen_at: When the job was first seen
+        is_active: Active status
+    
+    Returns:
+        Tuple ordered like BUCKET_COLUMNS
+    """
+    return (
+        country or NO_VALUE,
+        company,
+        category or NO_VALUE,
+        utc_day(first_seen_at),
+        bool(is_active),
+    )
+
+
+def move_bucket(deltas: Counter, old: tuple | None, new: tuple | None):
+    """Record a job moving from one bucket to another.
+    
+    Args:
+        deltas: Pending bucket deltas (updated in place)
+        old: Previous bucket (None for inserts)
+        new: New bucket (None for deletes)
+    """
+    if old == new:
+        return
+    if old is not None:
+        deltas[old] -= 1
+    if new is not None:
+        deltas[new] += 1
+
+
+def apply_rollup_deltas(db: Any, deltas: Counter) -> int:
+    """Add bucket deltas to the rollup in one multi-row upsert.
+    
+    Args:
+        db: Database session or connection (joins its transaction)
+        deltas: Bucket deltas from move_bucket
+    
+    Returns:
+        Number of buckets touched
+    """
+    # Sorted so concurrent writers lock buckets in the same order
+    rows = [
+        dict(zip(BUCKET_COLUMNS, bucket), job_count=delta)
+        for bucket, delta in sorted(deltas.items())
+        if delta
+    ]
+    if not rows:
+        return 0
+    
+    stmt = insert(JobStatsRollup).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(BUCKET_COLUMNS),
+        set_={
+            "job_count": JobStatsRollup.job_count + stmt.excluded.job_count,
+            "updated_at": func.now(),
+        },
+    )
+    db.execute(stmt)
+    return len(rows)
+
+
+def reconcile_rollup(db: Session, dry_run: bool = False) -> int:
+    """Repair rollup drift by comparing it against a full count of jobs.
+    
+    The rollup is locked against writers (SHARE ROW EXCLUSIVE conflicts
+    with the ROW EXCLUSIVE lock of apply_rollup_deltas) until the caller
+    commits. Scrapes and cleanups change jobs and apply their rollup
+    deltas in one transaction, so none can commit between the jobs count
+    and the rollup read. Otherwise its delta would be counted twice or
+    cancelled out by the correction.
+    
+    Args:
+        db: Database session
+        dry_run: If True, only report the number of drifted buckets
+    
+    Returns:
+        Number of buckets that were wrong
+    """
+    db.execute(text(f"LOCK TABLE {JobStatsRollup.__tablename__} IN SHARE ROW EXCLUSIVE MODE"))
+    
+    bucket_exprs = (
+        func.coalesce(Job.country, NO_VALUE),
+        Job.company,
+        func.coalesce(Job.category, NO_VALUE),
+        cast(func.timezone("UTC", Job.first_seen_at), Date),
+        func.coalesce(Job.is_active, False),
+    )
+    actual_rows = db.query(*bucket_exprs, func.count()).group_by(*bucket_exprs).all()
+    actual = {tuple(row[:5]): row[5] for row in actual_rows}
+    
+    stored = {
+        tuple(getattr(row, col) for col in BUCKET_COLUMNS): row.job_count
+        for row in db.query(JobStatsRollup).all()
+    }
+    
+    deltas = Counter()
+    for bucket in actual.keys() | stored.keys():
+        drift = actual.get(bucket, 0) - stored.get(bucket, 0)
+        if drift:
+            deltas[bucket] = drift
+    
+    if deltas and not dry_run:
+        apply_rollup_deltas(db, deltas)
+        db.query(JobStatsRollup).filter(JobStatsRollup.job_count == 0).delete()
+    
+    logger.info(f"Rollup reconciliation: {len(deltas)} drifted buckets{' (dry run)' if dry_run else ''}")
+    return len(deltas)
+
+
+def get_rollup_stats(db: Session, country: str | None = None) -> dict[str, Any]:
+    """Read job counts from the rollup (O(buckets), not O(jobs)).
+    
+    Args:
+        db: Database session
+        country: Only count jobs for this country (None for all)
+    
+    Returns:
+        Dictionary with total/active/inactive counts, companies tracked,
+        first/last day, and active counts by company, category and country
+    """
+    query = db.query(JobStatsRollup).filter(JobStatsRollup.job_count > 0)
+    if country:
+        query = query.filter(JobStatsRollup.country == country)
+    
+    total = 0
+    active = 0
+    companies = set()
+    days = []
+    by_company = Counter()
+    by_category = Counter()
+    by_country = Counter()
+    
+    for row in query.all():
+        total += row.job_count
+        companies.add(row.company)
+        days.append(row.day)
+        if row.is_active:
+            active += row.job_count
+            by_company[row.company] += row.job_count
+            by_category[row.category or None] += row.job_count
+            by_country[row.country or None] += row.job_count
+    
+    return {
+        "total_jobs": total,
+        "active_jobs": active,
+        "inactive_jobs": total - active,
+        "companies": len(companies),
+        "first_day": min(days) if days else None,
+        "last_day": max(days) if days else None,
+        "jobs_by_company": dict(by_company.most_common()),
+        "jobs_by_category": dict(by_category.most_common()),
+        "jobs_by_country": dict(by_country.most_common()),
+    }
@@ -0,0 +1,181 @@
+"""Full-text job search over the trigger-maintained jobs.search_vector column."""
+
+import re
+from typing import Any
+
+from sqlalchemy import desc, func, tuple_
+from sqlalchemy.orm import Query, Session
+
+from src.core.models import Job
+
+SEARCH_CONFIG = "english"
+
+# Columns returned for search hits (cold content columns are never loaded)
+SEARCH_RESULT_COLUMNS = (
+    Job.id,
+    Job.company,
+    Job.title,
+    Job.location,
+    Job.category,
+    Job.country,
+    Job.tags,
+    Job.url,
+    Job.posted_at,
+    Job.first_seen_at,
+)
+
+_TOKEN_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+def build_tsquery(text: str, prefix: bool = True) -> str | None:
+    """Turn free text into a safe to_tsquery expression.
+    
+    Every word must match (AND); with prefix matching the words also match
+    longer terms, so "mach learn" finds "machine learning".
+    
+    Args:
+        text: User search text
+        prefix: Match word prefixes
+    
+    Returns:
+        tsquery string, or None if the text has no searchable words
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+    if not tokens:
+        return None
+    suffix = ":*" if prefix else ""
+    return " & ".join(f"{token}{suffix}" for token in tokens)
+
+
+def escape_like(text: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def substring_filter(column: Any, text: str) -> Any:
+    """Case-insensitive substring match served by a pg_trgm GIN index.
+    
+    Patterns of three or more characters use the trigram indexes on
+    jobs.company and jobs.title; shorter ones still work but scan.
+    
+    Args:
+        column: Column to match (e.g. Job.company, Job.title)
+        text: Substring to look for
+    
+    Returns:
+        Filter expression
+    """
+    return column.ilike(f"%{escape_like(text)}%", escape="\\")
+
+
+def apply_search(query: Query, text: str, prefix: bool = True) -> tuple[Query, Any]:
+    """Filter a jobs query by full-text match.
+    
+    Args:
+        query: Query selecting from jobs
+        text: User search text
+        prefix: Match word prefixes
+    
+    Returns:
+        Tuple of (filtered query, rank expression for ordering); the rank is
+        None when the text has no searchable words and no filter was applied
+    """
+    expression = build_tsquery(text, prefix=prefix)
+    if expression is None:
+        return query, None
+    
+    tsquery = func.to_tsquery(SEARCH_CONFIG, expression)
+    rank = func.ts_rank_cd(Job.search_vector, tsquery)
+    return query.filter(Job.search_vector.op("@@")(tsquery)), rank
+
+
+def search_jobs(
+    db: Session,
+    text: str,
+    category: str | None = None,
+    country: str | None = None,
+    company: str | None = None,
+    is_active: bool | None = True,
+    limit: int = 50,
+    offset: int = 0,
+    facets: bool = True,
+) -> dict[str, Any]:
+    """Run a ranked full-text search with optional facet counts.
+    
+    Args:
+        db: Database session
+        text: User search text
+        category: Only jobs in this category
+        country: Only jobs in this country
+        company: Only jobs at this company (exact name, e.g. from a facet)
+        is_active: Filter by active status (None for all)
+        limit: Maximum number of results
+        offset: Number of results to skip
+        facets: Also count matches by category, country and company
+    
+    Returns:
+        Dictionary with total, results (ranked, best first) and facets
+    """
+    base = db.query(Job)
+    if is_active is not None:
+        base = base.filter(Job.is_active == is_active)
+    
+    base, rank = apply_search(base, text)
+    if rank is None:
+        return {"total": 0, "results": [], "facets": {}}
+    
+    filtered = base
+    if category:
+        filtered = filtered.filter(Job.category == category)
+    if country:
+        filtered = filtered.filter(Job.country == country)
+    if company:
+        filtered = filtered.filter(Job.company == company)
+    
+    results = (
+        filtered.with_entities(*SEARCH_RESULT_COLUMNS, rank.label("rank"))
+        .order_by(desc("rank"), Job.posted_at.desc().nulls_last(), Job.id)
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+    
+    response = {
+        "total": filtered.order_by(None).count(),
+        "results": results,
+        "facets": {},
+    }
+    
+    if facets:
+        # Facets describe the whole match set, so selected facets don't hide
+        # their alternatives; one grouped pass covers all three
+        rows = (
+            base.with_entities(
+                func.grouping(Job.category).label("by_category"),
+                func.grouping(Job.country).label("by_country"),
+                Job.category,
+                Job.country,
+                Job.company,
+                func.count().label("count"),
+            )
+            .group_by(
+                func.grouping_sets(tuple_(Job.category), tuple_(Job.country), tuple_(Job.company))
+            )
+            .all()
+        )
+        
+        facet_counts = {"category": {}, "country": {}, "company": {}}
+        for row in rows:
+            if not row.by_category:
+                facet_counts["category"][row.category or "uncategorized"] = row.count
+            elif not row.by_country:
+                facet_counts["country"][row.country or "unknown"] = row.count
+            else:
+                facet_counts["company"][row.company] = row.count
+        
+        response["facets"] = {
+            name: dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+            for name, counts in facet_counts.items()
+        }
+    
+    return response
@@ -0,0 +1,94 @@
+"""Shared job statistics computed in a single grouped scan."""
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import func, tuple_
+from sqlalchemy.orm import Session
+
+from src.core.models import Job
+
+
+def get_job_stats(db: Session, country: str | None = None, now: datetime | None = None) -> dict[str, Any]:
+    """Compute job statistics for the API, dashboard and CLI.
+    
+    Totals, per-company and per-category counts come from one pass over jobs
+    using GROUPING SETS, with FILTER clauses for the conditional counts.
+    
+    Args:
+        db: Database session
+        country: Only count jobs for this country (None for all)
+        now: Reference time for the "new" windows (defaults to now)
+    
+    Returns:
+        Dictionary with totals, windows, status counts and breakdowns.
+        jobs_by_company/jobs_by_category count active jobs only; companies
+        counts every company ever tracked.
+    """
+    now = now or datetime.utcnow()
+    day_ago = now - timedelta(days=1)
+    week_ago = now - timedelta(days=7)
+    
+    query = db.query(
+        func.grouping(Job.company).label("by_company"),
+        func.grouping(Job.category).label("by_category"),
+        Job.company,
+        Job.category,
+        func.count().label("total"),
+        func.count().filter(Job.is_active == True).label("active"),
+        func.count().filter(Job.first_seen_at >= day_ago).label("new_day"),
+        func.count().filter(Job.first_seen_at >= week_ago).label("new_week"),
+        func.count().filter(Job.application_status == "applied").label("applied"),
+        func.count().filter(Job.application_status == "interviewing").label("interviewing"),
+        func.min(Job.first_seen_at).label("first_seen"),
+        func.max(Job.first_seen_at).label("last_seen"),
+    )
+    
+    if country:
+        query = query.filter(Job.country == country)
+    
+    rows = query.group_by(
+        func.grouping_sets(tuple_(), tuple_(Job.company), tuple_(Job.category))
+    ).all()
+    
+    stats = {
+        "total_jobs": 0,
+        "active_jobs": 0,
+        "inactive_jobs": 0,
+        "new_today": 0,
+        "new_week": 0,
+        "applied": 0,
+        "interviewing": 0,
+        "companies": 0,
+        "first_seen_at": None,
+        "last_seen_at": None,
+        "jobs_by_company": {},
+        "jobs_by_category": {},
+    }
+    
+    for row in rows:
+        if row.by_company and row.by_category:
+            # Grand total row
+            stats.update(
+                total_jobs=row.total,
+                active_jobs=row.active,
+                inactive_jobs=row.total - row.active,
+                new_today=row.new_day,
+                new_week=row.new_week,
+                applied=row.applied,
+                interviewing=row.interviewing,
+                first_seen_at=row.first_seen,
+                last_seen_at=row.last_seen,
+            )
+        elif not row.by_company:
+            stats["companies"] += 1
+            if row.active:
+                stats["jobs_by_company"][row.company] = row.active
+        elif row.active:
+            stats["jobs_by_category"][row.category] = row.active
+    
+    # Largest first, like the group-by queries this replaces
+    for key in ("jobs_by_company", "jobs_by_category"):
+        stats[key] = dict(sorted(stats[key].items(), key=lambda item: item[1], reverse=True))
+    
+    return stats
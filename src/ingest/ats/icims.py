@@ -6,6 +6,7 @@ from typing import List
 from src.ingest.base import BaseScraper
 from src.ingest.schemas import RawJob, WatchlistTarget
 from src.utils.logging_config import get_logger
+from src.utils.http import record_response_bytes
 
 logger = get_logger(__name__)
 
@@ -54,6 +55,7 @@ class iCIMSScraper(BaseScraper):
                 headers=headers,
                 timeout=30
             )
+            record_response_bytes(response)
             
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
@@ -16,6 +16,7 @@ from bs4 import BeautifulSoup
 
 from src.ingest.schemas import RawJob, WatchlistTarget
 from src.ingest.base import BaseScraper
+from src.utils.http import record_response_bytes
 
 
 class IndeedScraper(BaseScraper):
@@ -73,6 +74,7 @@ class IndeedScraper(BaseScraper):
                 self.logger.info(f"Fetching Indeed jobs from {url}")
                 
                 response = requests.get(url, headers=self.headers, timeout=30)
+                record_response_bytes(response)
                 response.raise_for_status()
                 
                 # Parse HTML
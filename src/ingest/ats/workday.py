@@ -5,6 +5,7 @@ from typing import List
 from src.ingest.base import BaseScraper
 from src.ingest.schemas import RawJob, WatchlistTarget
 from src.utils.logging_config import get_logger
+from src.utils.http import record_response_bytes
 
 logger = get_logger(__name__)
 
@@ -59,6 +60,7 @@ class WorkdayScraper(BaseScraper):
                 headers=headers,
                 timeout=30
             )
+            record_response_bytes(response)
             
             if response.status_code == 200:
                 data = response.json()
@@ -1,13 +1,16 @@
 """Batch processor for efficient database operations."""
 
+from collections import Counter
 from typing import List
 from datetime import datetime
 
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects.postgresql import insert
 
-from src.core.models import Job
+from src.core.models import Job, JobVersion
+from src.core.rollup import apply_rollup_deltas, bucket_for, move_bucket
 from src.ingest.schemas import NormalizedJob
+from src.ingest.versioning import DESCRIPTION_FIELD, VERSIONED_FIELDS, build_version_row
 from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -71,9 +74,26 @@ class BatchJobProcessor:
             for job in existing:
                 existing_jobs[(job.source, job.source_id)] = job
         
+        # Descriptions are deferred; load them only for jobs whose content changed
+        incoming_hashes = {
+            (item['job'].source, item['job'].source_id): item['job'].hash_full
+            for item in self.job_buffer
+        }
+        changed_ids = [
+            job.id for key, job in existing_jobs.items()
+            if job.hash_full != incoming_hashes[key]
+        ]
+        previous_descriptions = {}
+        if changed_ids:
+            previous_descriptions = dict(
+                self.db.query(Job.id, Job.description_md).filter(Job.id.in_(changed_ids)).all()
+            )
+        
         # Process each job
         now = datetime.utcnow()
         new_jobs = []
+        version_rows = []
+        rollup_deltas = Counter()
         
         for item in self.job_buffer:
             job_data = item['job']
@@ -84,12 +104,24 @@ class BatchJobProcessor:
             existing = existing_jobs.get(key)
             
             if existing:
+                old_bucket = bucket_for(
+                    existing.country, existing.company, existing.category,
+                    existing.first_seen_at, existing.is_active,
+                )
+                
                 # Update existing job
                 existing.last_seen_at = now
                 existing.is_active = True
                 
                 # Check if content changed
                 if existing.hash_full != job_data.hash_full:
+                    # Capture the previous values before overwriting them
+                    previous = {field: getattr(existing, field) for field in VERSIONED_FIELDS}
+                    previous[DESCRIPTION_FIELD] = previous_descriptions.get(existing.id)
+                    version_rows.append(
+                        build_version_row(existing.id, previous, job_data, category, captured_at=now)
+                    )
+                    
                     existing.title = job_data.title
                     existing.location = job_data.location
                     existing.employment_type = job_data.employment_type
@@ -102,6 +134,12 @@ class BatchJobProcessor:
                     
                     self.db.flush()
                     self.updated_job_ids.append(existing.id)
+                
+                # Reactivation or a new category moves the job between buckets
+                move_bucket(rollup_deltas, old_bucket, bucket_for(
+                    existing.country, existing.company, existing.category,
+                    existing.first_seen_at, existing.is_active,
+                ))
             else:
                 # Create new job
                 new_job = Job(
@@ -125,6 +163,9 @@ class BatchJobProcessor:
                     country=job_data.country,
                 )
                 new_jobs.append(new_job)
+                move_bucket(rollup_deltas, None, bucket_for(
+                    job_data.country, job_data.company, category, now, True,
+                ))
         
         # Bulk insert new jobs
         if new_jobs:
@@ -135,6 +176,13 @@ class BatchJobProcessor:
             for job in new_jobs:
                 self.new_job_ids.append(job.id)
         
+        # Record version history for changed jobs in one multi-row insert
+        if version_rows:
+            self.db.execute(insert(JobVersion), version_rows)
+        
+        # Keep the stats rollup in step with this batch
+        apply_rollup_deltas(self.db, rollup_deltas)
+        
         logger.debug(f"Batch processed: {len(new_jobs)} new, {len(self.updated_job_ids) - len(self.new_job_ids)} updated")
         
         # Clear buffer
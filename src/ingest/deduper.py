@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 
 from src.core.models import Job, JobVersion
 from src.ingest.schemas import NormalizedJob
+from src.ingest.versioning import DESCRIPTION_FIELD, VERSIONED_FIELDS, build_version_row
 from src.utils.hashing import jaccard_similarity, tokenize_title
 from src.utils.logging_config import get_logger
 
@@ -125,35 +126,13 @@ class JobDeduper:
             existing: Existing Job model
             new_job: New normalized job data
         """
-        # Compute diff (simple field comparison)
-        diff = {}
-        
-        if existing.title != new_job.title:
-            diff["title"] = {"old": existing.title, "new": new_job.title}
-        
-        if existing.location != new_job.location:
-            diff["location"] = {"old": existing.location, "new": new_job.location}
-        
-        if existing.employment_type != new_job.employment_type:
-            diff["employment_type"] = {"old": existing.employment_type, "new": new_job.employment_type}
-        
-        # Create version record
-        version = JobVersion(
-            job_id=existing.id,
-            hash_full=new_job.hash_full,
-            captured_at=datetime.utcnow(),
-            diff_json=diff,
-            snapshot={
-                "title": new_job.title,
-                "location": new_job.location,
-                "employment_type": new_job.employment_type,
-                "posted_at": new_job.posted_at.isoformat() if new_job.posted_at else None,
-                "url": new_job.url,
-            },
-        )
+        previous = {field: getattr(existing, field) for field in VERSIONED_FIELDS}
+        previous[DESCRIPTION_FIELD] = existing.description_md
+        
+        version = JobVersion(**build_version_row(existing.id, previous, new_job, new_job.category))
         
         self.db.add(version)
-        logger.debug(f"Created version for job {existing.id}: {diff}")
+        logger.debug(f"Created version for job {existing.id}: {sorted(version.diff_json)}")
     
     def find_cross_source_duplicates(
         self,
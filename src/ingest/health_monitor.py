@@ -1,13 +1,37 @@
-"""URL health monitoring system to track failing job sources."""
+"""URL health monitoring system to track failing job sources.
 
-from datetime import datetime, timedelta
-from typing import Dict, Optional
-from sqlalchemy import Column, String, DateTime, Integer, Text
+Observations are buffered in memory and written with one multi-row upsert
+on (company, ats_type) per flush - at the end of a run, or every
+flush_interval seconds - so threaded scrapers don't each take a pool
+connection to record health. Reads are served from a snapshot of the
+table that is reloaded every HEALTH_CACHE_TTL seconds.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+from sqlalchemy import Column, String, DateTime, Integer, Text, case, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
 from src.core.database import Base, get_db_context
 from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Consecutive failures before a source counts as degraded / failed
+DEGRADED_AFTER = 3
+FAILED_AFTER = 10
+
+# Statuses after which a fallback source is worth trying
+FAILING_STATUSES = ("degraded", "failed", "unstable")
+
+# Seconds between automatic flushes of buffered observations
+HEALTH_FLUSH_INTERVAL = 30.0
+
+# Seconds a snapshot of url_health serves reads
+HEALTH_CACHE_TTL = 60.0
+
 
 class URLHealth(Base):
     """Track health status of job source URLs."""
@@ -27,11 +51,47 @@ class URLHealth(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
+# Columns of a health row returned by reads
+HEALTH_COLUMNS = (
+    URLHealth.company,
+    URLHealth.ats_type,
+    URLHealth.url,
+    URLHealth.status,
+    URLHealth.last_success,
+    URLHealth.last_failure,
+    URLHealth.failure_count,
+    URLHealth.success_count,
+    URLHealth.last_error,
+)
+
+
 class HealthMonitor:
-    """Monitor and track health of job source URLs."""
+    """Monitor and track health of job source URLs.
+    
+    Safe to share between scraper threads. Call flush() when a run ends;
+    buffered observations are also flushed every flush_interval seconds
+    and before this monitor reads.
+    """
     
-    def __init__(self):
+    def __init__(self, flush_interval: float | None = HEALTH_FLUSH_INTERVAL):
+        """
+        Initialize monitor.
+        
+        Args:
+            flush_interval: Flush automatically once this many seconds have
+                passed since the last flush (None flushes only on flush())
+        """
         self.logger = logger
+        self.flush_interval = flush_interval
+        self._pending: dict[tuple[str, str], dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+    
+    def __enter__(self) -> "HealthMonitor":
+        return self
+    
+    def __exit__(self, *exc):
+        self.flush()
     
     def record_success(self, company: str, ats_type: str, url: str, jobs_found: int = 0) -> None:
         """
@@ -43,35 +103,17 @@ class HealthMonitor:
             url: URL that was fetched
             jobs_found: Number of jobs found
         """
-        with get_db_context() as db:
-            health = db.query(URLHealth).filter_by(
-                company=company,
-                ats_type=ats_type
-            ).first()
-            
-            if not health:
-                health = URLHealth(
-                    company=company,
-                    ats_type=ats_type,
-                    url=url
-                )
-                db.add(health)
-            
-            health.last_success = datetime.utcnow()
-            health.success_count += 1
-            health.failure_count = 0  # Reset failure count on success
-            health.last_error = None
-            
-            # Update status
-            if jobs_found > 0:
-                health.status = "healthy"
-            else:
-                # Successful fetch but no jobs - might be temporary
-                health.status = "healthy_no_jobs"
-            
-            db.commit()
-            
-            self.logger.debug(f"✅ {company} ({ats_type}): Health recorded as {health.status}")
+        with self._lock:
+            health = self._observation(company, ats_type, url)
+            health["last_success"] = datetime.utcnow()
+            health["success_count"] += 1
+            health["failure_count"] = 0  # Reset failure count on success
+            health["last_error"] = None
+            # Successful fetch but no jobs might be temporary
+            health["status"] = "healthy" if jobs_found > 0 else "healthy_no_jobs"
+        
+        self.logger.debug(f"✅ {company} ({ats_type}): Health recorded as {health['status']}")
+        self._maybe_flush()
     
     def record_failure(self, company: str, ats_type: str, url: str, error: str) -> None:
         """
@@ -83,35 +125,50 @@ class HealthMonitor:
             url: URL that failed
             error: Error message
         """
-        with get_db_context() as db:
-            health = db.query(URLHealth).filter_by(
-                company=company,
-                ats_type=ats_type
-            ).first()
-            
-            if not health:
-                health = URLHealth(
-                    company=company,
-                    ats_type=ats_type,
-                    url=url
-                )
-                db.add(health)
-            
-            health.last_failure = datetime.utcnow()
-            health.failure_count += 1
-            health.last_error = error[:500]  # Truncate long errors
-            
-            # Update status based on failure patterns
-            if health.failure_count >= 10:
-                health.status = "failed"
-            elif health.failure_count >= 3:
-                health.status = "degraded"
-            else:
-                health.status = "unstable"
-            
-            db.commit()
-            
-            self.logger.warning(f"❌ {company} ({ats_type}): Health status {health.status} (failures: {health.failure_count})")
+        with self._lock:
+            health = self._observation(company, ats_type, url)
+            health["last_failure"] = datetime.utcnow()
+            health["failure_count"] += 1
+            health["last_error"] = error[:500]  # Truncate long errors
+            health["status"] = failure_status(health["failure_count"])
+        
+        self.logger.warning(f"❌ {company} ({ats_type}): Fetch failed: {error[:100]}")
+        self._maybe_flush()
+    
+    def flush(self) -> int:
+        """
+        Write buffered observations with one upsert.
+        
+        Failure counts continue from the stored row unless a success was
+        buffered since the last flush, so the stored status is the same as
+        if every observation had been written on its own.
+        
+        Returns:
+            Number of sources written
+        """
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+        
+        if not batch:
+            return 0
+        
+        # Sorted so concurrent flushers lock rows in the same order
+        rows = [batch[key] for key in sorted(batch)]
+        try:
+            with get_db_context() as db:
+                db.execute(health_upsert(), rows)
+        except Exception as e:
+            self.logger.error(f"Failed to record health for {len(rows)} sources: {e}")
+            with self._lock:
+                # Keep them for the next flush; newer observations win
+                for key, row in batch.items():
+                    self._pending.setdefault(key, row)
+            return 0
+        
+        invalidate_health_cache()
+        self.logger.debug(f"Recorded health for {len(rows)} sources")
+        return len(rows)
     
     def get_health_status(self, company: str, ats_type: str) -> Optional[Dict]:
         """
@@ -120,58 +177,26 @@ class HealthMonitor:
         Args:
             company: Company name
             ats_type: ATS type
-            
+        
         Returns:
             Dictionary with health information or None
         """
-        with get_db_context() as db:
-            health = db.query(URLHealth).filter_by(
-                company=company,
-                ats_type=ats_type
-            ).first()
-            
-            if not health:
-                return None
-            
-            return {
-                "company": health.company,
-                "ats_type": health.ats_type,
-                "url": health.url,
-                "status": health.status,
-                "last_success": health.last_success,
-                "last_failure": health.last_failure,
-                "failure_count": health.failure_count,
-                "success_count": health.success_count,
-                "last_error": health.last_error
-            }
+        for health in self._rows():
+            if health["company"] == company and health["ats_type"] == ats_type:
+                return dict(health)
+        return None
     
-    def get_failing_urls(self, min_failures: int = 3) -> list[Dict]:
+    def get_failing_urls(self, min_failures: int = DEGRADED_AFTER) -> list[Dict]:
         """
         Get all URLs that are failing.
         
         Args:
             min_failures: Minimum number of failures to consider
-            
+        
         Returns:
             List of dictionaries with failing URL information
         """
-        with get_db_context() as db:
-            failing = db.query(URLHealth).filter(
-                URLHealth.failure_count >= min_failures
-            ).order_by(URLHealth.failure_count.desc()).all()
-            
-            return [
-                {
-                    "company": h.company,
-                    "ats_type": h.ats_type,
-                    "url": h.url,
-                    "status": h.status,
-                    "failure_count": h.failure_count,
-                    "last_error": h.last_error,
-                    "last_failure": h.last_failure
-                }
-                for h in failing
-            ]
+        return failing_sources(self._rows(), min_failures)
     
     def get_health_summary(self) -> Dict:
         """
@@ -180,28 +205,7 @@ class HealthMonitor:
         Returns:
             Dictionary with health statistics
         """
-        with get_db_context() as db:
-            all_health = db.query(URLHealth).all()
-            
-            summary = {
-                "total": len(all_health),
-                "healthy": 0,
-                "degraded": 0,
-                "failed": 0,
-                "unknown": 0
-            }
-            
-            for h in all_health:
-                if h.status in ["healthy", "healthy_no_jobs"]:
-                    summary["healthy"] += 1
-                elif h.status == "degraded" or h.status == "unstable":
-                    summary["degraded"] += 1
-                elif h.status == "failed":
-                    summary["failed"] += 1
-                else:
-                    summary["unknown"] += 1
-            
-            return summary
+        return summarize_health(self._rows())
     
     def should_try_fallback(self, company: str, ats_type: str) -> bool:
         """
@@ -210,7 +214,7 @@ class HealthMonitor:
         Args:
             company: Company name
             ats_type: ATS type
-            
+        
         Returns:
             True if fallback should be tried
         """
@@ -220,4 +224,178 @@ class HealthMonitor:
             return False
         
         # Try fallback if status is degraded or failed
-        return status["status"] in ["degraded", "failed", "unstable"]
+        return status["status"] in FAILING_STATUSES
+    
+    def _observation(self, company: str, ats_type: str, url: str) -> dict[str, Any]:
+        """Buffered row of a source (caller holds the lock)."""
+        health = self._pending.get((company, ats_type))
+        if health is None:
+            health = self._pending[(company, ats_type)] = {
+                "company": company,
+                "ats_type": ats_type,
+                "url": url,
+                "last_success": None,
+                "last_failure": None,
+                "failure_count": 0,
+                "success_count": 0,
+                "last_error": None,
+                "status": "unknown",
+            }
+        health["url"] = url or health["url"]
+        health["updated_at"] = datetime.utcnow()
+        return health
+    
+    def _maybe_flush(self):
+        """Flush if the flush interval has passed."""
+        if self.flush_interval is not None and time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+    
+    def _rows(self) -> list[dict[str, Any]]:
+        """Cached health rows, including this monitor's buffered observations."""
+        if self._pending:
+            self.flush()
+        return cached_health_rows()
+
+
+def failure_status(failure_count: int) -> str:
+    """Status of a source after consecutive failures."""
+    if failure_count >= FAILED_AFTER:
+        return "failed"
+    if failure_count >= DEGRADED_AFTER:
+        return "degraded"
+    return "unstable"
+
+
+def health_upsert():
+    """Multi-row INSERT ... ON CONFLICT (company, ats_type) merging buffered rows.
+    
+    Each buffered row holds the counts since the last flush. A row without
+    last_success saw only failures, so its failures add to the stored
+    streak and the status is recomputed from the total.
+    """
+    stmt = insert(URLHealth)
+    new = stmt.excluded
+    only_failures = new.last_success.is_(None)
+    failure_count = case(
+        (only_failures, func.coalesce(URLHealth.failure_count, 0) + new.failure_count),
+        else_=new.failure_count,
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[URLHealth.company, URLHealth.ats_type],
+        set_={
+            "url": func.coalesce(new.url, URLHealth.url),
+            "last_success": func.coalesce(new.last_success, URLHealth.last_success),
+            "last_failure": func.coalesce(new.last_failure, URLHealth.last_failure),
+            "success_count": func.coalesce(URLHealth.success_count, 0) + new.success_count,
+            "failure_count": failure_count,
+            "last_error": new.last_error,
+            "status": case(
+                (only_failures, case(
+                    (failure_count >= FAILED_AFTER, "failed"),
+                    (failure_count >= DEGRADED_AFTER, "degraded"),
+                    else_="unstable",
+                )),
+                else_=new.status,
+            ),
+            "updated_at": new.updated_at,
+        },
+    )
+
+
+def load_health_rows(db: Session) -> list[dict[str, Any]]:
+    """
+    Load every health row.
+    
+    Args:
+        db: Database session
+    
+    Returns:
+        Health rows as dictionaries (HEALTH_COLUMNS)
+    """
+    return [dict(row._mapping) for row in db.execute(select(*HEALTH_COLUMNS))]
+
+
+_cache: dict[str, Any] = {"rows": None, "loaded_at": 0.0}
+_cache_lock = threading.Lock()
+
+
+def cached_health_rows(ttl: float = HEALTH_CACHE_TTL) -> list[dict[str, Any]]:
+    """
+    Health rows from a process-wide snapshot, reloaded once it is ttl seconds old.
+    
+    Args:
+        ttl: Maximum snapshot age in seconds
+    
+    Returns:
+        Health rows as dictionaries
+    """
+    with _cache_lock:
+        if _cache["rows"] is None or time.monotonic() - _cache["loaded_at"] >= ttl:
+            with get_db_context() as db:
+                _cache["rows"] = load_health_rows(db)
+            _cache["loaded_at"] = time.monotonic()
+        return _cache["rows"]
+
+
+def invalidate_health_cache():
+    """Drop the snapshot so the next read reloads it."""
+    with _cache_lock:
+        _cache["rows"] = None
+
+
+def failing_sources(rows: list[dict[str, Any]], min_failures: int = DEGRADED_AFTER) -> list[Dict]:
+    """
+    Rows with at least min_failures consecutive failures, worst first.
+    
+    Args:
+        rows: Health rows
+        min_failures: Minimum number of failures to consider
+    
+    Returns:
+        List of dictionaries with failing URL information
+    """
+    failing = [h for h in rows if (h["failure_count"] or 0) >= min_failures]
+    failing.sort(key=lambda h: h["failure_count"], reverse=True)
+    return [
+        {
+            "company": h["company"],
+            "ats_type": h["ats_type"],
+            "url": h["url"],
+            "status": h["status"],
+            "failure_count": h["failure_count"],
+            "last_error": h["last_error"],
+            "last_failure": h["last_failure"]
+        }
+        for h in failing
+    ]
+
+
+def summarize_health(rows: list[dict[str, Any]]) -> Dict:
+    """
+    Count health rows by status group.
+    
+    Args:
+        rows: Health rows
+    
+    Returns:
+        Dictionary with health statistics
+    """
+    summary = {
+        "total": len(rows),
+        "healthy": 0,
+        "degraded": 0,
+        "failed": 0,
+        "unknown": 0
+    }
+    
+    for h in rows:
+        if h["status"] in ["healthy", "healthy_no_jobs"]:
+            summary["healthy"] += 1
+        elif h["status"] == "degraded" or h["status"] == "unstable":
+            summary["degraded"] += 1
+        elif h["status"] == "failed":
+            summary["failed"] += 1
+        else:
+            summary["unknown"] += 1
+    
+    return summary
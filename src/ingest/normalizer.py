@@ -2,6 +2,7 @@
 
 from datetime import datetime
 
+from src.ingest.retention import RawDataRetention
 from src.ingest.schemas import RawJob, NormalizedJob
 from src.utils.hashing import (
     compute_hash_stable,
@@ -17,6 +18,14 @@ logger = get_logger(__name__)
 class JobNormalizer:
     """Normalize raw jobs to standardized schema."""
     
+    def __init__(self, retention: RawDataRetention | None = None):
+        """Initialize normalizer.
+        
+        Args:
+            retention: raw_data retention policies (defaults to configured policies)
+        """
+        self.retention = retention or RawDataRetention()
+    
     def normalize(self, raw_job: RawJob) -> NormalizedJob:
         """Normalize a raw job to the standard format.
         
@@ -62,5 +71,5 @@ class JobNormalizer:
             description_md=description_md,
             hash_stable=hash_stable,
             hash_full=hash_full,
-            raw_data=raw_job.raw_data,
+            raw_data=self.retention.project(raw_job.source, raw_job.raw_data),
         )
@@ -0,0 +1,324 @@
+"""Notification outbox: runs queue alerts, a worker delivers them.
+
+A finished run bulk-inserts one pending alerts row per job and channel and
+dispatches a delivery worker, so a slow or failing notification channel
+never holds up the scrape. The worker claims due rows with
+FOR UPDATE SKIP LOCKED (setting a lease on next_attempt_at), sends them
+without holding a database session, then marks them sent or schedules a
+retry with exponential backoff. Each channel is delivered by its own
+threads, up to the channel's concurrency limit.
+
+Alert status changes do not bump the data generation: delivery marks a
+batch every second or so, which would keep invalidating every cached API
+response. /stats, the only reader, expires its alert count by TTL instead.
+"""
+
+import threading
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Callable
+
+from sqlalchemy import case, func, insert, select, update
+
+from src.core.config import get_settings
+from src.core.database import get_db_context
+from src.core.models import Alert, Job, ScrapeRunTarget
+from src.utils.logging_config import get_logger
+from src.utils.notifiers import (
+    SLACK_JOBS_PER_MESSAGE,
+    EmailNotifier,
+    SlackNotifier,
+    recently_alerted,
+)
+
+logger = get_logger(__name__)
+
+ALERT_PENDING = "pending"
+ALERT_SENT = "sent"
+ALERT_FAILED = "failed"
+
+DELIVERY_MODES = ("thread", "celery", "inline", "off")
+
+# A claimed alert is retried after this long if its worker dies mid-send
+CLAIM_LEASE = timedelta(minutes=10)
+
+# Retry delay: BACKOFF_BASE_SECONDS * 2^retries, capped at BACKOFF_MAX_SECONDS
+BACKOFF_BASE_SECONDS = 60
+BACKOFF_MAX_SECONDS = 3600
+
+# Job columns the notifiers read
+JOB_COLUMNS = (
+    Job.id,
+    Job.company,
+    Job.title,
+    Job.location,
+    Job.category,
+    Job.url,
+    Job.source,
+    Job.posted_at,
+    Job.tags,
+)
+
+
+def _send_email(jobs: list[Any], alerts: list[Any], companies_scanned: list[str]) -> bool:
+    """Deliver a batch of alerts as one digest email."""
+    counts = Counter(alert.alert_type for alert in alerts)
+    return EmailNotifier().send_batch(
+        jobs,
+        companies_scanned=companies_scanned,
+        new_count=counts["new"],
+        updated_count=counts["updated"],
+    )
+
+
+def _send_slack(jobs: list[Any], alerts: list[Any], companies_scanned: list[str]) -> bool:
+    """Deliver a batch of alerts as a block-kit digest (one message per claim)."""
+    counts = Counter(alert.alert_type for alert in alerts)
+    return SlackNotifier().send_batch(
+        jobs,
+        companies_scanned=companies_scanned,
+        new_count=counts["new"],
+        updated_count=counts["updated"],
+    )
+
+
+# channel -> (sender, alerts per claim, concurrent senders). Slack claims fit
+# one digest message, so a failed post retries only that message's alerts;
+# its senders share one paced queue, the second prepares the next message.
+CHANNELS: dict[str, tuple[Callable[..., bool], int, int]] = {
+    "email": (_send_email, 500, 1),
+    "slack": (_send_slack, SLACK_JOBS_PER_MESSAGE, 2),
+}
+
+
+def configured_channels() -> list[str]:
+    """Channels with a sender whose settings are present."""
+    settings = get_settings()
+    enabled = {"email": bool(settings.smtp_server), "slack": bool(settings.slack_webhook_url)}
+    return [channel for channel in CHANNELS if enabled.get(channel)]
+
+
+def enqueue_alerts(
+    db,
+    new_ids: list[uuid.UUID],
+    updated_ids: list[uuid.UUID],
+    run_id: uuid.UUID | None = None,
+    channels: list[str] | None = None,
+) -> int:
+    """Queue pending alerts for new and updated jobs.
+    
+    Cooldowns are resolved with one query and all rows are written with one
+    INSERT, however many jobs there are. Jobs alerted on a channel within the
+    cooldown (or still queued there) are skipped. The caller commits.
+    
+    Args:
+        db: Database session
+        new_ids: IDs of new jobs
+        updated_ids: IDs of updated jobs
+        run_id: Run that found the jobs (its targets list the companies scanned)
+        channels: Channels to notify (defaults to every configured channel)
+    
+    Returns:
+        Number of alerts queued
+    """
+    channels = configured_channels() if channels is None else channels
+    blocked = recently_alerted(db, [*new_ids, *updated_ids], channels)
+    metadata = {"run_id": str(run_id)} if run_id else None
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "job_id": job_id,
+            "alert_type": alert_type,
+            "sent_via": channel,
+            "status": ALERT_PENDING,
+            "retry_count": 0,
+            "alert_metadata": metadata,
+        }
+        for channel in channels
+        for alert_type, job_ids in (("new", new_ids), ("updated", updated_ids))
+        for job_id in job_ids
+        if (job_id, channel) not in blocked
+    ]
+    if rows:
+        db.execute(insert(Alert).values(next_attempt_at=func.now()), rows)
+    return len(rows)
+
+
+def request_delivery(mode: str | None = None) -> str:
+    """Dispatch a delivery worker for the queued alerts.
+    
+    Args:
+        mode: thread, celery, inline or off (defaults to settings.notification_delivery)
+    
+    Returns:
+        Mode used
+    """
+    mode = (mode or get_settings().notification_delivery).lower()
+    if mode not in DELIVERY_MODES:
+        logger.warning(f"Unknown notification_delivery mode {mode!r}, using thread")
+        mode = "thread"
+    
+    if mode == "celery":
+        # Imported here: the tasks module imports the runner
+        from src.scheduler.tasks import deliver_notifications
+        deliver_notifications.delay()
+    elif mode == "thread":
+        # Not a daemon: a CLI run exits only after its alerts are delivered
+        threading.Thread(target=deliver_pending, name="notification-delivery").start()
+    elif mode == "inline":
+        deliver_pending()
+    
+    return mode
+
+
+def deliver_pending(channels: list[str] | None = None) -> dict[str, dict[str, int]]:
+    """Deliver every due pending alert, each channel on its own threads.
+    
+    Safe to run from several processes at once: claimed rows are skipped by
+    other workers until their lease runs out.
+    
+    Args:
+        channels: Channels to deliver (defaults to every channel with a sender)
+    
+    Returns:
+        Per-channel counts of sent, retried and failed alerts
+    """
+    channels = [channel for channel in (channels or CHANNELS) if channel in CHANNELS]
+    workers = sum(CHANNELS[channel][2] for channel in channels)
+    results = {channel: Counter() for channel in channels}
+    if not workers:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="deliver") as pool:
+        futures = [
+            (channel, pool.submit(_deliver_channel, channel))
+            for channel in channels
+            for _ in range(CHANNELS[channel][2])
+        ]
+        for channel, future in futures:
+            try:
+                results[channel].update(future.result())
+            except Exception as e:
+                logger.error(f"Notification delivery for {channel} crashed: {e}")
+    
+    return {channel: dict(counts) for channel, counts in results.items()}
+
+
+def _deliver_channel(channel: str) -> Counter:
+    """Claim and send batches for one channel until none are due."""
+    sender, batch_size, _ = CHANNELS[channel]
+    counts = Counter()
+    
+    while True:
+        alerts = _claim(channel, batch_size)
+        if not alerts:
+            return counts
+        
+        jobs, companies_scanned = _load_context(alerts)
+        error = None
+        try:
+            delivered = sender(jobs, alerts, companies_scanned)
+        except Exception as e:
+            delivered = False
+            error = str(e)
+        
+        if delivered:
+            _mark_sent(alerts)
+            counts["sent"] += len(alerts)
+        else:
+            failed = _schedule_retry(alerts, error or f"{channel} delivery failed")
+            counts["failed"] += failed
+            counts["retried"] += len(alerts) - failed
+            # Leave the rest for the retry instead of hammering a failing channel
+            return counts
+
+
+def _claim(channel: str, limit: int) -> list[Any]:
+    """Lease up to `limit` due alerts of a channel."""
+    due = (
+        select(Alert.id)
+        .where(
+            Alert.status == ALERT_PENDING,
+            Alert.sent_via == channel,
+            Alert.next_attempt_at <= func.now(),
+        )
+        .order_by(Alert.next_attempt_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    with get_db_context() as db:
+        return db.execute(
+            update(Alert)
+            .where(Alert.id.in_(due.scalar_subquery()))
+            .values(next_attempt_at=func.now() + CLAIM_LEASE)
+            .returning(Alert.id, Alert.job_id, Alert.alert_type, Alert.retry_count, Alert.alert_metadata),
+            execution_options={"synchronize_session": False},
+        ).all()
+
+
+def _load_context(alerts: list[Any]) -> tuple[list[Any], list[str]]:
+    """Load the jobs of claimed alerts and the companies their runs scanned."""
+    job_ids = {alert.job_id for alert in alerts}
+    run_ids = {
+        uuid.UUID(alert.alert_metadata["run_id"])
+        for alert in alerts
+        if alert.alert_metadata and alert.alert_metadata.get("run_id")
+    }
+    with get_db_context() as db:
+        jobs = db.execute(
+            select(*JOB_COLUMNS).where(Job.id.in_(job_ids)).order_by(Job.company, Job.title)
+        ).all()
+        companies = []
+        if run_ids:
+            companies = db.scalars(
+                select(ScrapeRunTarget.company).where(ScrapeRunTarget.run_id.in_(run_ids)).distinct()
+            ).all()
+    return jobs, list(companies)
+
+
+def _mark_sent(alerts: list[Any]):
+    """Mark delivered alerts sent."""
+    with get_db_context() as db:
+        db.execute(
+            update(Alert)
+            .where(Alert.id.in_([alert.id for alert in alerts]))
+            .values(
+                status=ALERT_SENT,
+                sent_at=func.now(),
+                next_attempt_at=None,
+                error_message=None,
+            ),
+            execution_options={"synchronize_session": False},
+        )
+
+
+def _schedule_retry(alerts: list[Any], error: str) -> int:
+    """Back off failed alerts, failing those out of attempts.
+    
+    Returns:
+        Number of alerts marked failed for good
+    """
+    max_attempts = get_settings().notification_max_attempts
+    attempts = Alert.retry_count + 1
+    delay = func.least(BACKOFF_BASE_SECONDS * func.power(2, Alert.retry_count), BACKOFF_MAX_SECONDS)
+    exhausted = attempts >= max_attempts
+    
+    with get_db_context() as db:
+        rows = db.execute(
+            update(Alert)
+            .where(Alert.id.in_([alert.id for alert in alerts]))
+            .values(
+                retry_count=attempts,
+                error_message=error[:1000],
+                status=case((exhausted, ALERT_FAILED), else_=ALERT_PENDING),
+                next_attempt_at=case((exhausted, None), else_=func.now() + func.make_interval(0, 0, 0, 0, 0, 0, delay)),
+            )
+            .returning(Alert.status),
+            execution_options={"synchronize_session": False},
+        ).all()
+    
+    failed = sum(1 for row in rows if row.status == ALERT_FAILED)
+    logger.warning(f"Notification delivery failed for {len(alerts)} alerts ({failed} out of attempts): {error}")
+    return failed
@@ -0,0 +1,143 @@
+"""Post-run Excel export, kept off the scrape path and coalesced across runs.
+
+A finished run only marks its scrape_runs row export_status='pending' and
+dispatches a worker. The worker holds a Postgres advisory lock, exports once
+for every pending run and records the outcome on those rows. Runs that finish
+while an export is in progress are picked up by the next pass instead of
+starting exports of their own.
+"""
+
+import threading
+import time
+import uuid
+from typing import Any
+
+from sqlalchemy import func, select
+
+from src.core.config import get_settings
+from src.core.database import engine, get_db_context
+from src.core.models import ScrapeRun
+from src.utils.excel_exporter import ExcelExporter
+from src.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# pg_try_advisory_lock key: at most one export at a time across processes
+EXPORT_LOCK_KEY = 0x4558504F  # "EXPO"
+
+EXPORT_PENDING = "pending"
+EXPORT_SUCCESS = "success"
+EXPORT_FAILED = "failed"
+
+EXPORT_MODES = ("thread", "celery", "inline", "off")
+
+
+def request_export(run_id: uuid.UUID, mode: str | None = None) -> str:
+    """Queue the post-run export for a run.
+    
+    Args:
+        run_id: Run that changed data
+        mode: thread, celery, inline or off (defaults to settings.post_run_export)
+    
+    Returns:
+        Mode used
+    """
+    mode = (mode or get_settings().post_run_export).lower()
+    if mode not in EXPORT_MODES:
+        logger.warning(f"Unknown post_run_export mode {mode!r}, using thread")
+        mode = "thread"
+    if mode == "off":
+        return mode
+    
+    with get_db_context() as db:
+        db.query(ScrapeRun).filter(ScrapeRun.id == run_id).update(
+            {"export_status": EXPORT_PENDING}, synchronize_session=False
+        )
+    
+    if mode == "celery":
+        # Imported here: the tasks module imports the runner
+        from src.scheduler.tasks import export_pending_runs
+        export_pending_runs.delay()
+    elif mode == "thread":
+        # Not a daemon: a CLI run exits only after its export is written
+        threading.Thread(target=export_pending, name="post-run-export").start()
+    else:
+        export_pending()
+    
+    return mode
+
+
+def export_pending() -> dict[str, Any]:
+    """Export once for all runs with a pending export.
+    
+    Returns immediately if another export holds the lock; that export checks
+    for pending runs again after releasing it, so no request is lost.
+    
+    Returns:
+        Dictionary with status, runs covered, export_seconds and paths
+    """
+    result = {"status": "idle", "runs": 0}
+    while True:
+        with engine.connect() as lock_conn:
+            locked = lock_conn.execute(select(func.pg_try_advisory_lock(EXPORT_LOCK_KEY))).scalar()
+            if not locked:
+                logger.info("Export already in progress; pending runs will be coalesced into it")
+                return {"status": "coalesced", "runs": 0}
+            try:
+                while True:
+                    run_ids = _pending_run_ids()
+                    if not run_ids:
+                        break
+                    result = _export_for_runs(run_ids)
+            finally:
+                lock_conn.execute(select(func.pg_advisory_unlock(EXPORT_LOCK_KEY)))
+                lock_conn.commit()
+        
+        # A run may have been marked pending after the last check but before
+        # the unlock, while its own worker found the lock taken
+        if not _pending_run_ids():
+            return result
+
+
+def _pending_run_ids() -> list[uuid.UUID]:
+    """IDs of runs waiting for an export."""
+    with get_db_context() as db:
+        return [
+            row.id
+            for row in db.query(ScrapeRun.id).filter(ScrapeRun.export_status == EXPORT_PENDING)
+        ]
+
+
+def _export_for_runs(run_ids: list[uuid.UUID]) -> dict[str, Any]:
+    """Run one export and record its outcome on the runs it covers."""
+    logger.info(f"📊 Exporting to Excel for {len(run_ids)} run(s)")
+    started = time.perf_counter()
+    status = EXPORT_SUCCESS
+    paths = (None, None)
+    try:
+        if get_settings().post_run_export_delta:
+            paths = (ExcelExporter().export_delta(), None)
+        else:
+            paths = ExcelExporter().export_all()
+    except Exception as e:
+        logger.error(f"Failed to export to Excel: {e}")
+        status = EXPORT_FAILED
+    seconds = time.perf_counter() - started
+    
+    with get_db_context() as db:
+        db.query(ScrapeRun).filter(ScrapeRun.id.in_(run_ids)).update(
+            {"export_status": status, "export_seconds": seconds}, synchronize_session=False
+        )
+    
+    if paths[0]:
+        logger.info(f"📊 Excel export saved to: {paths[0]} ({seconds:.1f}s)")
+    if paths[1]:
+        logger.info(f"📊 Category export saved to: {paths[1]}")
+    
+    return {
+        "status": status,
+        "runs": len(run_ids),
+        "export_seconds": seconds,
+        "jobs_path": paths[0],
+        "category_path": paths[1],
+    }
@@ -0,0 +1,125 @@
+"""raw_data retention policies and compaction."""
+
+from typing import Any
+
+from sqlalchemy import update
+
+from src.core.config import get_config_loader
+from src.core.database import get_db_context
+from src.core.models import Job
+from src.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+KEEP = "keep"
+PROJECT = "project"
+DROP = "drop"
+
+
+class RawDataRetention:
+    """Apply per-source projection policies to raw ATS payloads."""
+    
+    def __init__(self, config: dict[str, Any] | None = None):
+        """Initialize retention policies.
+        
+        Args:
+            config: Retention config (defaults to config/raw_data_retention.yaml)
+        """
+        if config is None:
+            config = get_config_loader().load_raw_data_retention()
+        
+        self.default = config.get("default") or {"mode": KEEP}
+        self.sources = config.get("sources") or {}
+    
+    def policy_for(self, source: str) -> dict[str, Any]:
+        """Get the policy for a source.
+        
+        Args:
+            source: Source/ATS name
+        
+        Returns:
+            Policy dictionary with 'mode' and optional 'fields'
+        """
+        return self.sources.get(source, self.default)
+    
+    def project(self, source: str, raw_data: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Reduce a raw payload according to the source policy.
+        
+        Args:
+            source: Source/ATS name
+            raw_data: Raw API response data
+        
+        Returns:
+            Projected payload, or None if nothing should be stored
+        """
+        if not raw_data:
+            return None
+        
+        policy = self.policy_for(source)
+        mode = policy.get("mode", KEEP)
+        
+        if mode == DROP:
+            return None
+        
+        if mode == PROJECT:
+            fields = policy.get("fields") or []
+            projected = {key: raw_data[key] for key in fields if key in raw_data}
+            return projected or None
+        
+        return raw_data
+
+
+class RawDataCompactor:
+    """Shrink raw_data on existing rows to match the current retention policy."""
+    
+    def __init__(self, retention: RawDataRetention | None = None, batch_size: int = 1000):
+        """Initialize compactor.
+        
+        Args:
+            retention: Retention policies (defaults to configured policies)
+            batch_size: Number of rows scanned per transaction
+        """
+        self.retention = retention or RawDataRetention()
+        self.batch_size = batch_size
+    
+    def compact(self, dry_run: bool = False) -> int:
+        """Rewrite raw_data for rows whose stored payload exceeds the policy.
+        
+        Rows are walked in id order with keyset pagination and each batch is
+        committed separately, so the compactor never holds long locks.
+        
+        Args:
+            dry_run: If True, only count rows that would shrink
+        
+        Returns:
+            Number of rows compacted (or that would be)
+        """
+        compacted = 0
+        last_id = None
+        
+        while True:
+            with get_db_context() as db:
+                query = db.query(Job.id, Job.source, Job.raw_data).filter(Job.raw_data.isnot(None))
+                if last_id is not None:
+                    query = query.filter(Job.id > last_id)
+                rows = query.order_by(Job.id).limit(self.batch_size).all()
+                
+                if not rows:
+                    break
+                
+                last_id = rows[-1].id
+                
+                updates = []
+                for row in rows:
+                    projected = self.retention.project(row.source, row.raw_data)
+                    if projected != row.raw_data:
+                        updates.append({"id": row.id, "raw_data": projected})
+                
+                if updates and not dry_run:
+                    db.execute(update(Job), updates)
+                
+                compacted += len(updates)
+        
+        action = "Would compact" if dry_run else "Compacted"
+        logger.info(f"{action} raw_data on {compacted} jobs")
+        return compacted
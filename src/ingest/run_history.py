@@ -0,0 +1,177 @@
+"""Persistent history of scrape runs and per-target timings."""
+
+import uuid
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from src.core.database import get_db_context
+from src.core.events import RUN_FINISHED, publish_event
+from src.core.generation import bump_generation
+from src.core.models import ScrapeRun, ScrapeRunTarget
+from src.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Run totals copied from runner stats onto the scrape_runs row
+RUN_COUNTERS = (
+    "companies_processed",
+    "jobs_fetched",
+    "jobs_filtered",
+    "jobs_new",
+    "jobs_updated",
+    "errors",
+    "bytes_fetched",
+    "notifications_sent",
+)
+
+# Per-target values copied from target stats onto scrape_run_targets rows
+TARGET_FIELDS = (
+    "fetch_seconds",
+    "normalize_seconds",
+    "persist_seconds",
+    "total_seconds",
+    "bytes_fetched",
+    "jobs_fetched",
+    "jobs_filtered",
+    "jobs_new",
+    "jobs_updated",
+)
+
+
+def start_run(country: str | None = None) -> uuid.UUID:
+    """Insert a scrape_runs row for a run that is starting.
+    
+    Args:
+        country: Default country of the run
+    
+    Returns:
+        New run ID
+    """
+    run_id = uuid.uuid4()
+    with get_db_context() as db:
+        db.add(ScrapeRun(id=run_id, started_at=datetime.utcnow(), status="running", country=country))
+    return run_id
+
+
+def target_record(
+    company: str,
+    ats_type: str | None,
+    stats: dict[str, Any] | None = None,
+    started_at: datetime | None = None,
+    error: str | None = None,
+) -> dict[str, Any]:
+    """Build a scrape_run_targets row from a target's stats.
+    
+    Args:
+        company: Company name
+        ats_type: ATS type of the target
+        stats: Target statistics from the runner (None if it failed early)
+        started_at: When the target started
+        error: Error message if the target failed
+    
+    Returns:
+        Dictionary of ScrapeRunTarget column values (run_id filled in later)
+    """
+    stats = stats or {}
+    record = {
+        "id": uuid.uuid4(),
+        "company": company,
+        "ats_type": ats_type,
+        "started_at": stats.get("started_at") or started_at or datetime.utcnow(),
+        "error_message": error,
+    }
+    for field in TARGET_FIELDS:
+        record[field] = stats.get(field)
+    return record
+
+
+def finish_run(
+    run_id: uuid.UUID,
+    stats: dict[str, Any],
+    targets: list[dict[str, Any]],
+    duration_seconds: float,
+    error: str | None = None,
+):
+    """Close a run: write totals and all target rows in one transaction.
+    
+    Args:
+        run_id: Run ID from start_run
+        stats: Aggregated run statistics
+        targets: Rows from target_record
+        duration_seconds: Wall-clock duration of the run
+        error: Error message if the run failed
+    """
+    with get_db_context() as db:
+        values = {counter: stats.get(counter, 0) for counter in RUN_COUNTERS}
+        db.query(ScrapeRun).filter(ScrapeRun.id == run_id).update(
+            {
+                **values,
+                "finished_at": datetime.utcnow(),
+                "duration_seconds": duration_seconds,
+                "status": "failed" if error else "success",
+                "error_message": error,
+            },
+            synchronize_session=False,
+        )
+        
+        if targets:
+            db.execute(insert(ScrapeRunTarget), [{**target, "run_id": run_id} for target in targets])
+        
+        # The run summary is visible through cached API responses
+        bump_generation(db)
+        
+        # Delivered to /events subscribers when this transaction commits
+        run = db.get(ScrapeRun, run_id)
+        publish_event(db, RUN_FINISHED, {
+            "run_id": str(run_id),
+            "status": "failed" if error else "success",
+            "country": run.country if run else None,
+            "jobs_new": stats.get("jobs_new", 0),
+            "jobs_updated": stats.get("jobs_updated", 0),
+            "duration_seconds": round(duration_seconds, 1),
+        })
+    
+    logger.info(f"Recorded scrape run {run_id} ({len(targets)} targets, {duration_seconds:.1f}s)")
+
+
+def get_latest_run(db: Session, finished: bool = True) -> ScrapeRun | None:
+    """Get the most recent run (an index seek on started_at/finished_at).
+    
+    Args:
+        db: Database session
+        finished: Only consider runs that have finished
+    
+    Returns:
+        Latest run or None
+    """
+    if finished:
+        return (
+            db.query(ScrapeRun)
+            .filter(ScrapeRun.finished_at.isnot(None))
+            .order_by(ScrapeRun.finished_at.desc())
+            .first()
+        )
+    return db.query(ScrapeRun).order_by(ScrapeRun.started_at.desc()).first()
+
+
+def get_target_history(db: Session, company: str, limit: int = 20) -> list[ScrapeRunTarget]:
+    """Get recent timings for one company, newest first.
+    
+    Args:
+        db: Database session
+        company: Company name
+        limit: Maximum number of runs
+    
+    Returns:
+        List of target rows
+    """
+    return (
+        db.query(ScrapeRunTarget)
+        .filter(ScrapeRunTarget.company == company)
+        .order_by(ScrapeRunTarget.started_at.desc())
+        .limit(limit)
+        .all()
+    )
@@ -2,21 +2,29 @@
 
 import argparse
 import time
+from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
+from src.core.changes import stamp_changes
 from src.core.config import get_config_loader
 from src.core.database import get_db_context
+from src.core.events import JOBS_NEW, publish_event
+from src.core.generation import bump_generation
 from src.core.models import Job
 from src.ingest.classifier import JobClassifier, JobFilter
 from src.ingest.deduper import JobDeduper
+from src.ingest.health_monitor import HealthMonitor
 from src.ingest.batch_processor import BatchJobProcessor
+from src.ingest.bulk_loader import BulkJobLoader
 from src.ingest.normalizer import JobNormalizer
+from src.ingest.notification_outbox import enqueue_alerts, request_delivery
+from src.ingest.post_run_export import request_export
 from src.ingest.registry import get_scraper
+from src.ingest.run_history import finish_run, start_run, target_record
 from src.ingest.schemas import WatchlistTarget
+from src.utils.http import get_byte_count, reset_byte_count
 from src.utils.logging_config import get_logger, setup_logging
-from src.utils.notifiers import NotificationManager
-from src.utils.excel_exporter import ExcelExporter
 
 logger = get_logger(__name__)
 
@@ -24,22 +32,33 @@ logger = get_logger(__name__)
 class JobTrackerRunner:
     """Main runner for the job tracking pipeline."""
     
-    def __init__(self, dry_run: bool = False, max_workers: int = 5, batch_size: int = 50):
+    def __init__(
+        self,
+        dry_run: bool = False,
+        max_workers: int = 5,
+        batch_size: int = 50,
+        bulk: bool = False,
+        export: bool = True,
+    ):
         """Initialize runner.
         
         Args:
             dry_run: If True, don't persist to database or send notifications
             max_workers: Maximum number of parallel scrapers
             batch_size: Number of jobs to insert per batch
+            bulk: If True, load jobs via COPY + merge (cold starts, backfills)
+            export: If False, skip the post-run Excel export for this run
         """
         self.dry_run = dry_run
         self.max_workers = max_workers
         self.batch_size = batch_size
+        self.bulk = bulk
+        self.export = export
         self.normalizer = JobNormalizer()
         self.classifier = JobClassifier()
         self.job_filter = JobFilter()
         
-        logger.info(f"Initialized JobTrackerRunner (dry_run={dry_run}, parallel={max_workers}, batch={batch_size})")
+        logger.info(f"Initialized JobTrackerRunner (dry_run={dry_run}, parallel={max_workers}, batch={batch_size}, bulk={bulk})")
     
     def run(self, company_filter: str | None = None, config_path: str | None = None, country: str = "us") -> dict[str, Any]:
         """Run the job tracking pipeline.
@@ -60,12 +79,15 @@ class JobTrackerRunner:
             "jobs_updated": 0,
             "notifications_sent": 0,
             "errors": 0,
+            "rows_loaded": 0,
+            "load_seconds": 0.0,
+            "bytes_fetched": 0,
+            "export": "skipped",
         }
         
         # Collect all new and updated job IDs for batch notification
         all_new_job_ids = []
         all_updated_job_ids = []
-        companies_scanned = []
         
         # Load watchlist from specified path or default
         config_loader = get_config_loader()
@@ -87,66 +109,95 @@ class JobTrackerRunner:
             targets = [t for t in targets if company_filter.lower() in t["company"].lower()]
             logger.info(f"Filtered to {len(targets)} targets matching '{company_filter}'")
         
-        # Process targets in parallel
-        logger.info(f"🚀 Starting parallel scrape of {len(targets)} companies (workers={self.max_workers})...")
-        logger.info("=" * 60)
+        # Record the run (and per-target timings) in scrape_runs
+        run_started = time.time()
+        run_id = start_run(country) if not self.dry_run else None
+        stats["run_id"] = str(run_id) if run_id else None
+        target_records = []
         
-        # Use ThreadPoolExecutor for parallel scraping
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all scraping tasks
-            future_to_target = {}
-            for idx, target_config in enumerate(targets, 1):
-                try:
-                    target = WatchlistTarget(**target_config)
-                    target_country = target.country if hasattr(target, 'country') and target.country else country
+        # From here on a failure (including Ctrl+C) still closes the run, so
+        # it never stays 'running' without a finished_at
+        error = None
+        try:
+            # Source health is buffered and written with one upsert per flush
+            health = HealthMonitor() if not self.dry_run else None
+            
+            # Process targets in parallel
+            logger.info(f"🚀 Starting parallel scrape of {len(targets)} companies (workers={self.max_workers})...")
+            logger.info("=" * 60)
+            
+            # Use ThreadPoolExecutor for parallel scraping
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # Submit all scraping tasks
+                future_to_target = {}
+                for idx, target_config in enumerate(targets, 1):
+                    try:
+                        target = WatchlistTarget(**target_config)
+                        target_country = target.country if hasattr(target, 'country') and target.country else country
+                        
+                        future = executor.submit(self._process_target_safe, target, target_country, idx, len(targets))
+                        future_to_target[future] = target
+                    except Exception as e:
+                        logger.error(f"Failed to submit target {target_config.get('company')}: {e}")
+                        stats["errors"] += 1
+                
+                # Process completed tasks as they finish
+                for future in as_completed(future_to_target):
+                    target = future_to_target[future]
+                    company = target.company
+                    try:
+                        target_stats, new_job_ids, updated_job_ids = future.result()
+                        target_records.append(target_record(company, target.ats_type, target_stats))
+                        
+                        if health and target_stats.get("fetch_error"):
+                            health.record_failure(company, target.ats_type, target.careers_url, target_stats["fetch_error"])
+                        elif health:
+                            health.record_success(company, target.ats_type, target.careers_url, target_stats["jobs_fetched"])
+                        
+                        # Collect new and updated job IDs
+                        all_new_job_ids.extend(new_job_ids)
+                        all_updated_job_ids.extend(updated_job_ids)
+                        
+                        # Aggregate stats
+                        for key in stats:
+                            if key in target_stats:
+                                stats[key] += target_stats[key]
+                        
+                        stats["companies_processed"] += 1
                     
-                    future = executor.submit(self._process_target_safe, target, target_country, idx, len(targets))
-                    future_to_target[future] = target.company
-                    companies_scanned.append(target.company)
-                except Exception as e:
-                    logger.error(f"Failed to submit target {target_config.get('company')}: {e}")
-                    stats["errors"] += 1
+                    except Exception as e:
+                        logger.error(f"Failed to process {company}: {e}")
+                        stats["errors"] += 1
+                        target_records.append(target_record(company, target.ats_type, error=str(e)))
+                        if health:
+                            health.record_failure(company, target.ats_type, target.careers_url, str(e))
             
-            # Process completed tasks as they finish
-            for future in as_completed(future_to_target):
-                company = future_to_target[future]
+            if health:
+                health.flush()
+            
+            # Queue alerts for all new and updated jobs; a worker delivers them
+            if (all_new_job_ids or all_updated_job_ids) and not self.dry_run:
+                logger.info(f"Queueing notifications for {len(all_new_job_ids)} new + {len(all_updated_job_ids)} updated jobs")
+                with get_db_context() as db:
+                    stats["notifications_sent"] = enqueue_alerts(
+                        db, all_new_job_ids, all_updated_job_ids, run_id=run_id
+                    )
+        except BaseException as e:
+            error = str(e) or type(e).__name__
+            raise
+        finally:
+            if run_id:
                 try:
-                    target_stats, new_job_ids, updated_job_ids = future.result()
-                    
-                    # Collect new and updated job IDs
-                    all_new_job_ids.extend(new_job_ids)
-                    all_updated_job_ids.extend(updated_job_ids)
-                    
-                    # Aggregate stats
-                    for key in stats:
-                        if key in target_stats:
-                            stats[key] += target_stats[key]
-                    
-                    stats["companies_processed"] += 1
-                
-                except Exception as e:
-                    logger.error(f"Failed to process {company}: {e}")
-                    stats["errors"] += 1
+                    finish_run(run_id, stats, target_records, time.time() - run_started, error=error)
+                except Exception as finish_error:
+                    # Don't hide the error that failed the run
+                    if error is None:
+                        raise
+                    logger.error(f"Failed to record failed run {run_id}: {finish_error}")
         
-        # Send consolidated notification for all new and updated jobs
-        if (all_new_job_ids or all_updated_job_ids) and not self.dry_run:
-            total_jobs = len(all_new_job_ids) + len(all_updated_job_ids)
-            logger.info(f"Sending consolidated notification for {len(all_new_job_ids)} new + {len(all_updated_job_ids)} updated jobs")
-            with get_db_context() as db:
-                # Fetch the jobs in this session
-                from src.core.models import Job
-                all_job_ids = all_new_job_ids + all_updated_job_ids
-                jobs = db.query(Job).filter(Job.id.in_(all_job_ids)).all()
-                
-                notification_manager = NotificationManager(db)
-                notification_manager.notify_batch(
-                    jobs, 
-                    companies_scanned=companies_scanned,
-                    new_count=len(all_new_job_ids),
-                    updated_count=len(all_updated_job_ids)
-                )
-                db.commit()  # Commit the alerts
-                stats["notifications_sent"] = 1  # One batch email
+        # Deliver after finish_run: the digest lists the run's scanned companies
+        if stats["notifications_sent"]:
+            request_delivery()
         
         # Print final summary
         logger.info("=" * 60)
@@ -157,12 +208,14 @@ class JobTrackerRunner:
         logger.info(f"   New jobs: {stats['jobs_new']}")
         logger.info(f"   Updated jobs: {stats['jobs_updated']}")
         logger.info(f"   Errors: {stats['errors']}")
-        logger.info(f"   Notifications: {stats['notifications_sent']}")
+        logger.info(f"   Notifications queued: {stats['notifications_sent']}")
+        if self.bulk and stats['load_seconds']:
+            logger.info(f"   Bulk load throughput: {stats['rows_loaded'] / stats['load_seconds']:.0f} rows/s")
         logger.info("=" * 60)
         
-        # Export to Excel if not dry run
-        if not self.dry_run and (stats['jobs_new'] > 0 or stats['jobs_updated'] > 0):
-            self._export_to_excel()
+        # Export to Excel after the run (queued; timing lands on the scrape_runs row)
+        if run_id and self.export and (stats['jobs_new'] > 0 or stats['jobs_updated'] > 0):
+            stats["export"] = request_export(run_id)
         
         return stats
     
@@ -179,11 +232,14 @@ class JobTrackerRunner:
             Tuple of (statistics, new job IDs, updated job IDs)
         """
         logger.info(f"[{idx}/{total}] 📍 {target.company} ({target.ats_type})")
+        started_at = datetime.utcnow()
         start_time = time.time()
         
         try:
             stats, new_ids, updated_ids = self._process_target(target, country)
             elapsed = time.time() - start_time
+            stats["started_at"] = started_at
+            stats["total_seconds"] = elapsed
             logger.info(f"   ✅ {target.company}: {stats['jobs_new']} new, {stats['jobs_updated']} updated ({elapsed:.1f}s)")
             return stats, new_ids, updated_ids
         except Exception as e:
@@ -207,6 +263,13 @@ class JobTrackerRunner:
             "jobs_new": 0,
             "jobs_updated": 0,
             "notifications_sent": 0,
+            "rows_loaded": 0,
+            "load_seconds": 0.0,
+            "fetch_seconds": 0.0,
+            "normalize_seconds": 0.0,
+            "persist_seconds": 0.0,
+            "bytes_fetched": 0,
+            "fetch_error": None,
         }
         
         new_job_ids = []
@@ -218,19 +281,27 @@ class JobTrackerRunner:
             logger.warning(f"⚠️  No scraper available for {target.ats_type}")
             return stats, new_job_ids, updated_job_ids
         
-        # Fetch raw jobs with retry mechanism
-        raw_jobs = self._fetch_with_retry(scraper, target.company, max_retries=2)
+        # Fetch raw jobs with retry mechanism (bytes are counted per thread)
+        reset_byte_count()
+        phase_start = time.perf_counter()
+        raw_jobs, stats["fetch_error"] = self._fetch_with_retry(scraper, target.company, max_retries=2)
+        stats["fetch_seconds"] = time.perf_counter() - phase_start
+        stats["bytes_fetched"] = get_byte_count()
         stats["jobs_fetched"] = len(raw_jobs)
         
         if not raw_jobs:
             logger.info(f"   ➜ 0 jobs found")
             return stats, new_job_ids, updated_job_ids
         
-        # Process jobs using batch processor for better performance
+        # Process jobs using batch processor (or COPY loader) for better performance
         with get_db_context() as db:
-            batch_processor = BatchJobProcessor(db, batch_size=self.batch_size)
+            if self.bulk:
+                batch_processor = BulkJobLoader(db)
+            else:
+                batch_processor = BatchJobProcessor(db, batch_size=self.batch_size)
             
             for raw_job in raw_jobs:
+                phase_start = time.perf_counter()
                 try:
                     # Normalize
                     normalized_job = self.normalizer.normalize(raw_job)
@@ -247,14 +318,18 @@ class JobTrackerRunner:
                     if not should_include:
                         logger.debug(f"Filtered out: {normalized_job.title} ({reason})")
                         stats["jobs_filtered"] += 1
+                        stats["normalize_seconds"] += time.perf_counter() - phase_start
                         continue
                     
                     # Add tags
                     tags = self.job_filter.add_tags(normalized_job)
+                    stats["normalize_seconds"] += time.perf_counter() - phase_start
                     
                     # Add to batch processor
                     if not self.dry_run:
+                        phase_start = time.perf_counter()
                         batch_processor.add_job(normalized_job, category, tags)
+                        stats["persist_seconds"] += time.perf_counter() - phase_start
                     else:
                         # Dry run - just log
                         logger.info(
@@ -269,15 +344,33 @@ class JobTrackerRunner:
             
             # Flush remaining jobs in batch
             if not self.dry_run:
+                phase_start = time.perf_counter()
                 batch_processor.flush()
-                db.commit()
                 
                 # Get stats from batch processor
                 new_ids, updated_ids = batch_processor.get_stats()
+                
+                # Number changed rows for /jobs/changes and invalidate cached
+                # API responses, both in the same transaction
+                stamped = stamp_changes(db)
+                if new_ids or updated_ids or stamped:
+                    bump_generation(db)
+                if new_ids:
+                    publish_event(
+                        db, JOBS_NEW,
+                        {"company": target.company, "country": country, "count": len(new_ids)},
+                    )
+                db.commit()
+                stats["persist_seconds"] += time.perf_counter() - phase_start
+                
                 new_job_ids.extend(new_ids)
                 updated_job_ids.extend(updated_ids)
                 stats["jobs_new"] = len(new_ids)
                 stats["jobs_updated"] = len(updated_ids)
+                
+                if self.bulk:
+                    stats["rows_loaded"] = batch_processor.rows_loaded
+                    stats["load_seconds"] = batch_processor.load_seconds
         
         logger.info(f"   ➜ Found {stats['jobs_fetched']} jobs, included {stats['jobs_new']} new, {stats['jobs_updated']} updated")
         return stats, new_job_ids, updated_job_ids
@@ -291,19 +384,20 @@ class JobTrackerRunner:
             max_retries: Maximum number of retry attempts
             
         Returns:
-            List of raw jobs
+            Tuple of (list of raw jobs, error message if every attempt failed)
         """
+        error_msg = None
         for attempt in range(max_retries + 1):
             try:
                 raw_jobs = scraper.fetch()
-                return raw_jobs
+                return raw_jobs, None
             except Exception as e:
                 error_msg = str(e)
                 
                 # Don't retry on certain errors
                 if any(x in error_msg for x in ["404", "Not Found", "DNS", "HTTP2 protocol error", "Blocked"]):
                     logger.error(f"   ❌ Non-retryable error for {company_name}: {error_msg[:100]}")
-                    return []
+                    return [], error_msg
                 
                 # Retry on timeout or transient errors
                 if attempt < max_retries:
@@ -312,28 +406,9 @@ class JobTrackerRunner:
                     time.sleep(wait_time)
                 else:
                     logger.error(f"   ❌ All {max_retries + 1} attempts failed for {company_name}")
-                    return []
+                    return [], error_msg
         
-        return []
-    
-    def _export_to_excel(self):
-        """Export scraped jobs to Excel file."""
-        try:
-            exporter = ExcelExporter()
-            
-            # Export all active jobs
-            filepath = exporter.export_jobs()
-            
-            if filepath:
-                logger.info(f"📊 Excel export saved to: {filepath}")
-                
-                # Also export by category
-                filepath_cat = exporter.export_by_category()
-                if filepath_cat:
-                    logger.info(f"📊 Category export saved to: {filepath_cat}")
-            
-        except Exception as e:
-            logger.error(f"Failed to export to Excel: {e}")
+        return [], error_msg
 
 
 def main():
@@ -375,13 +450,25 @@ def main():
         default=50,
         help="Number of jobs to process per database batch (default: 50)",
     )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Bulk-load jobs via Postgres COPY (for cold starts and re-imports)",
+    )
+    parser.add_argument(
+        "--no-export",
+        action="store_true",
+        help="Skip the post-run Excel export for this run",
+    )
     
     args = parser.parse_args()
     
     runner = JobTrackerRunner(
         dry_run=args.dry_run,
         max_workers=args.workers,
-        batch_size=args.batch_size
+        batch_size=args.batch_size,
+        bulk=args.bulk,
+        export=not args.no_export,
     )
     stats = runner.run(
         company_filter=args.company,
@@ -397,8 +484,11 @@ def main():
     print(f"Jobs filtered out:   {stats['jobs_filtered']}")
     print(f"Jobs new:            {stats['jobs_new']}")
     print(f"Jobs updated:        {stats['jobs_updated']}")
-    print(f"Notifications sent:  {stats['notifications_sent']}")
+    print(f"Alerts queued:       {stats['notifications_sent']}")
     print(f"Errors:              {stats['errors']}")
+    print(f"Excel export:        {stats['export']}")
+    if args.bulk and stats['load_seconds']:
+        print(f"Bulk throughput:     {stats['rows_loaded'] / stats['load_seconds']:.0f} rows/s")
     print("=" * 60)
 
 
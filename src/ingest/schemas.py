@@ -42,7 +42,7 @@ class NormalizedJob(BaseModel):
     category: str | None = None
     country: str = "us"
     tags: list[str] = Field(default_factory=list)
-    raw_data: dict[str, Any] = Field(default_factory=dict)
+    raw_data: dict[str, Any] | None = Field(default_factory=dict)
     
     class Config:
         arbitrary_types_allowed = True
@@ -0,0 +1,138 @@
+"""Compact field-level diffs for job version history."""
+
+import difflib
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+
+from src.ingest.schemas import NormalizedJob
+
+# Scalar fields tracked in version diffs
+VERSIONED_FIELDS = (
+    "title",
+    "location",
+    "employment_type",
+    "posted_at",
+    "url",
+    "category",
+)
+
+DESCRIPTION_FIELD = "description_md"
+
+
+def _json_value(value: Any) -> Any:
+    """Make a field value JSON-serializable.
+    
+    Datetimes are serialized in UTC (naive values are taken as UTC), so the
+    same instant read back from the database in the session time zone and
+    parsed from a feed with another offset compares equal.
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc).isoformat()
+    return value
+
+
+def description_delta(source: str | None, target: str | None) -> list[list]:
+    """Compute a line-based delta that turns source into target.
+    
+    Args:
+        source: Text the delta is applied to
+        target: Text the delta produces
+    
+    Returns:
+        List of [start, end, replacement_lines] operations on source lines
+    """
+    source_lines = (source or "").splitlines(keepends=True)
+    target_lines = (target or "").splitlines(keepends=True)
+    
+    matcher = difflib.SequenceMatcher(None, source_lines, target_lines, autojunk=False)
+    
+    return [
+        [i1, i2, target_lines[j1:j2]]
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
+
+
+def apply_description_delta(source: str | None, delta: list[list]) -> str:
+    """Apply a delta produced by description_delta.
+    
+    Args:
+        source: Text the delta was computed against
+        delta: Delta operations
+    
+    Returns:
+        Reconstructed text
+    """
+    lines = (source or "").splitlines(keepends=True)
+    
+    # Apply from the end so earlier line offsets stay valid
+    for start, end, replacement in reversed(delta):
+        lines[start:end] = replacement
+    
+    return "".join(lines)
+
+
+def compute_job_diff(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """Compute a compact diff between two versions of a job.
+    
+    Scalar fields are stored as {"old": ..., "new": ...}. The description is
+    stored as a reverse delta (new -> old) so history can be rebuilt by walking
+    back from the current row without keeping full copies.
+    
+    Args:
+        old: Previous field values
+        new: New field values
+    
+    Returns:
+        Diff dictionary (empty if nothing tracked changed)
+    """
+    diff = {}
+    
+    for field in VERSIONED_FIELDS:
+        old_value = _json_value(old.get(field))
+        new_value = _json_value(new.get(field))
+        if old_value != new_value:
+            diff[field] = {"old": old_value, "new": new_value}
+    
+    old_description = old.get(DESCRIPTION_FIELD) or ""
+    new_description = new.get(DESCRIPTION_FIELD) or ""
+    if old_description != new_description:
+        diff[DESCRIPTION_FIELD] = {"delta": description_delta(new_description, old_description)}
+    
+    return diff
+
+
+def build_version_row(
+    job_id: Any,
+    old: dict[str, Any],
+    new_job: NormalizedJob,
+    category: str | None,
+    captured_at: datetime | None = None,
+) -> dict[str, Any]:
+    """Build a job_versions row for a changed job.
+    
+    Args:
+        job_id: ID of the changed job
+        old: Previous field values (VERSIONED_FIELDS + description_md)
+        new_job: New normalized job data
+        category: New category
+        captured_at: Capture timestamp (defaults to now)
+    
+    Returns:
+        Dictionary of JobVersion column values
+    """
+    new = {field: getattr(new_job, field, None) for field in VERSIONED_FIELDS}
+    new["category"] = category
+    new[DESCRIPTION_FIELD] = new_job.description_md
+    
+    return {
+        "id": uuid.uuid4(),
+        "job_id": job_id,
+        "hash_full": new_job.hash_full,
+        "captured_at": captured_at or datetime.utcnow(),
+        "diff_json": compute_job_diff(old, new),
+        "snapshot": None,
+    }
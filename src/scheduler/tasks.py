@@ -60,3 +60,88 @@ def run_job_tracker_for_company(company: str) -> dict:
     
     logger.info(f"Run complete for {company}: {stats}")
     return stats
+
+
+@celery_app.task(name="tasks.export_pending_runs")
+def export_pending_runs() -> dict:
+    """Write the post-run Excel export for every run waiting on one.
+    
+    Queued by finished runs when post_run_export is "celery"; concurrent
+    requests coalesce into a single export.
+    
+    Returns:
+        Export result
+    """
+    from src.ingest.post_run_export import export_pending
+    
+    return export_pending()
+
+
+@celery_app.task(name="tasks.deliver_notifications")
+def deliver_notifications() -> dict:
+    """Deliver queued alerts that are due (new ones and retries).
+    
+    Queued by finished runs when notification_delivery is "celery", and run
+    by beat so backed-off retries go out even between scrapes.
+    
+    Returns:
+        Per-channel delivery counts
+    """
+    from src.ingest.notification_outbox import deliver_pending
+    
+    return deliver_pending()
+
+
+@celery_app.task(name="tasks.compact_raw_data")
+def compact_raw_data() -> int:
+    """Shrink stored raw_data to the configured retention policy.
+    
+    Returns:
+        Number of jobs compacted
+    """
+    from src.ingest.retention import RawDataCompactor
+    
+    logger.info("Starting raw_data compaction")
+    return RawDataCompactor().compact()
+
+
+@celery_app.task(name="tasks.write_parquet_snapshot")
+def write_parquet_snapshot(day: str | None = None) -> dict:
+    """Write yesterday's Parquet snapshot of jobs and job versions.
+    
+    Args:
+        day: ISO date to snapshot instead of yesterday (job_versions only
+            for earlier days)
+        
+    Returns:
+        Rows written per dataset (empty if pyarrow is not installed)
+    """
+    import importlib.util
+    from datetime import date
+    
+    if importlib.util.find_spec("pyarrow") is None:
+        logger.warning("pyarrow not installed; skipping Parquet snapshot")
+        return {}
+    
+    from src.utils.snapshot_store import write_snapshot
+    
+    return write_snapshot(date.fromisoformat(day) if day else None)
+
+
+@celery_app.task(name="tasks.reconcile_stats_rollup")
+def reconcile_stats_rollup() -> int:
+    """Repair drift between the stats rollup and the jobs table.
+    
+    Returns:
+        Number of drifted rollup buckets
+    """
+    from src.core.database import get_db_context
+    from src.core.generation import bump_generation
+    from src.core.rollup import reconcile_rollup
+    
+    logger.info("Reconciling stats rollup")
+    with get_db_context() as db:
+        drifted = reconcile_rollup(db)
+        if drifted:
+            bump_generation(db)
+        return drifted
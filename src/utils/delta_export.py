@@ -0,0 +1,283 @@
+"""Incremental exports: only jobs changed since the previous export.
+
+Each export has a named watermark in export_watermarks holding the last
+exported position in the jobs change sequence (see src/core/changes.py).
+A delta covers (watermark, head] and lists inserted, updated and closed
+jobs; CSV logs can later be compacted by merging their deltas into a
+snapshot file.
+"""
+
+import csv
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterator, Sequence
+
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.core.batch import BATCH_SIZE, stream_rows
+from src.core.changes import get_change_head
+from src.core.database import get_db_context
+from src.core.models import ExportWatermark, Job
+from src.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+CHANGE_INSERTED = "inserted"
+CHANGE_UPDATED = "updated"
+CHANGE_CLOSED = "closed"
+
+DELTA_BATCH_SIZE = BATCH_SIZE
+
+
+def begin_delta(name: str) -> dict[str, Any] | None:
+    """Open a delta window from the watermark to the current change head.
+    
+    Args:
+        name: Watermark name
+    
+    Returns:
+        Window dictionary (name, since, head, since_time, head_time), or None
+        if nothing changed since the last export
+    """
+    with get_db_context() as db:
+        mark = db.get(ExportWatermark, name)
+        head = get_change_head(db)
+        head_time = db.scalar(select(func.now()))
+    
+    since = mark.change_seq if mark else 0
+    if head <= since:
+        return None
+    
+    return {
+        "name": name,
+        "since": since,
+        "head": head,
+        "since_time": mark.exported_at if mark else None,
+        "head_time": head_time,
+    }
+
+
+def iter_changes(
+    window: dict[str, Any],
+    columns: Sequence[Any],
+    country: str | None = None,
+    batch_size: int = DELTA_BATCH_SIZE,
+) -> Iterator[Any]:
+    """Stream jobs changed inside a delta window, in change order.
+    
+    Args:
+        window: Window from begin_delta
+        columns: Job columns to select
+        country: Only jobs for this country
+        batch_size: Rows per fetch from the server-side cursor
+    
+    Yields:
+        Rows with a `change` attribute (inserted, updated or closed) plus the
+        requested columns
+    """
+    if window["since_time"] is None:
+        change = case((Job.is_active.isnot(True), CHANGE_CLOSED), else_=CHANGE_INSERTED)
+    else:
+        change = case(
+            (Job.is_active.isnot(True), CHANGE_CLOSED),
+            (Job.first_seen_at > window["since_time"], CHANGE_INSERTED),
+            else_=CHANGE_UPDATED,
+        )
+    
+    stmt = (
+        select(change.label("change"), *columns)
+        .where(Job.change_seq > window["since"], Job.change_seq <= window["head"])
+        .order_by(Job.change_seq)
+    )
+    if country:
+        stmt = stmt.where(Job.country == country)
+    
+    yield from stream_rows(stmt, batch_size)
+
+
+def commit_delta(window: dict[str, Any], rows: int):
+    """Advance the watermark once a delta has been written.
+    
+    Args:
+        window: Window from begin_delta
+        rows: Number of rows written
+    """
+    stmt = insert(ExportWatermark).values(
+        name=window["name"],
+        change_seq=window["head"],
+        exported_at=window["head_time"],
+        rows_exported=rows,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ExportWatermark.name],
+        set_={
+            "change_seq": stmt.excluded.change_seq,
+            "exported_at": stmt.excluded.exported_at,
+            "rows_exported": stmt.excluded.rows_exported,
+        },
+    )
+    with get_db_context() as db:
+        db.execute(stmt)
+
+
+def delta_filename(prefix: str, window: dict[str, Any], extension: str) -> str:
+    """Deterministic delta filename (re-running a failed export overwrites it)."""
+    return f"{prefix}_delta_{window['since']:012d}_{window['head']:012d}.{extension}"
+
+
+class CsvDeltaLog:
+    """CSV export kept as a snapshot file plus delta files.
+    
+    Delta rows start with a Change column; the first data column must be the
+    job ID, which compaction uses as the key.
+    
+    Only columns the change trigger watches belong in a delta log: a row is
+    exported again only when one of those changes, so any other column (such
+    as last_seen_at) would keep the value of the row's last tracked change.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        directory: str | Path,
+        header: Sequence[str],
+        columns: Sequence[Any],
+        format_row: Callable[[Any], list],
+        snapshot_path: str | Path | None = None,
+        keep_closed: bool = True,
+        country: str | None = None,
+    ):
+        """Initialize delta log.
+        
+        Args:
+            name: Watermark name (also the file prefix)
+            directory: Directory for delta files
+            header: Column titles (first must be the job ID)
+            columns: Job columns selected for format_row
+            format_row: Converts a selected row to CSV values
+            snapshot_path: Snapshot file (defaults to <directory>/<name>.csv)
+            keep_closed: Keep closed jobs in the snapshot (marked by their
+                values) instead of dropping them
+            country: Only export jobs for this country
+        """
+        self.name = name
+        self.directory = Path(directory)
+        self.directory.mkdir(exist_ok=True)
+        self.header = list(header)
+        self.columns = columns
+        self.format_row = format_row
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else self.directory / f"{name}.csv"
+        self.keep_closed = keep_closed
+        self.country = country
+        self._delta_re = re.compile(rf"^{re.escape(name)}_delta_(\d+)_(\d+)\.csv$")
+    
+    def export_delta(self) -> tuple[Path | None, int]:
+        """Write the jobs changed since the last export to a delta file.
+        
+        Returns:
+            Tuple of (delta path or None if nothing changed, rows written)
+        """
+        window = begin_delta(self.name)
+        if window is None:
+            logger.info(f"{self.name}: no changes since last export")
+            return None, 0
+        
+        path = self.directory / delta_filename(self.name, window, "csv")
+        rows = 0
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Change", *self.header])
+            for row in iter_changes(window, self.columns, country=self.country):
+                writer.writerow([row.change, *self.format_row(row)])
+                rows += 1
+        
+        commit_delta(window, rows)
+        logger.info(f"{self.name}: wrote {rows} changed jobs to {path}")
+        return path, rows
+    
+    def delta_files(self) -> list[tuple[int, int, Path]]:
+        """List pending delta files as (since, head, path), oldest first."""
+        found = []
+        for path in self.directory.glob(f"{self.name}_delta_*.csv"):
+            match = self._delta_re.match(path.name)
+            if match:
+                found.append((int(match.group(1)), int(match.group(2)), path))
+        return sorted(found)
+    
+    def _reshaper(self, header: list[str] | None) -> Callable[[list], list]:
+        """Map rows of a file written with another header onto the current one.
+        
+        Columns are matched by title; dropped columns are discarded and new
+        ones left empty until the job's next change.
+        """
+        if not header or header == self.header:
+            return lambda values: values
+        positions = [header.index(title) if title in header else None for title in self.header]
+        return lambda values: [
+            values[i] if i is not None and i < len(values) else "" for i in positions
+        ]
+    
+    def compact(self) -> Path:
+        """Merge pending deltas into the snapshot and delete them.
+        
+        Returns:
+            Snapshot path
+        """
+        with get_db_context() as db:
+            mark = db.get(ExportWatermark, self.name)
+            snapshot_seq = mark.snapshot_seq if mark else 0
+        
+        deltas = self.delta_files()
+        pending = [(since, head, path) for since, head, path in deltas if head > snapshot_seq]
+        
+        if pending or not self.snapshot_path.exists():
+            rows = {}
+            # A delta from position 0 lists every job, so it replaces the snapshot
+            full = bool(pending) and pending[0][0] == 0
+            if self.snapshot_path.exists() and not full:
+                with open(self.snapshot_path, newline="", encoding="utf-8") as f:
+                    reader = csv.reader(f)
+                    reshape = self._reshaper(next(reader, None))
+                    for values in reader:
+                        rows[values[0]] = reshape(values)
+            
+            for _, _, path in pending:
+                with open(path, newline="", encoding="utf-8") as f:
+                    reader = csv.reader(f)
+                    reshape = self._reshaper((next(reader, None) or [])[1:])
+                    for change, *values in reader:
+                        if change == CHANGE_CLOSED and not self.keep_closed:
+                            rows.pop(values[0], None)
+                        else:
+                            rows[values[0]] = reshape(values)
+            
+            # Write then rename, so readers never see a half-written snapshot
+            tmp_path = self.snapshot_path.with_suffix(".csv.tmp")
+            with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(self.header)
+                writer.writerows(rows.values())
+            os.replace(tmp_path, self.snapshot_path)
+            
+            if pending:
+                snapshot_seq = pending[-1][1]
+                with get_db_context() as db:
+                    db.query(ExportWatermark).filter(ExportWatermark.name == self.name).update(
+                        {"snapshot_seq": snapshot_seq}, synchronize_session=False
+                    )
+            logger.info(f"{self.name}: compacted {len(pending)} deltas into {self.snapshot_path} ({len(rows)} jobs)")
+        
+        # Deltas at or below the snapshot position are merged already
+        for _, head, path in deltas:
+            if head <= snapshot_seq:
+                path.unlink()
+        
+        return self.snapshot_path
+
+
+def format_timestamp(value: datetime | None, fmt: str = "%Y-%m-%d %H:%M") -> str:
+    """Format an optional timestamp for CSV output."""
+    return value.strftime(fmt) if value else ""
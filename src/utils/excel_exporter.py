@@ -1,19 +1,85 @@
 """Excel export utility for job data."""
 
-import pandas as pd
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Any, Iterable, List
 
-from src.core.database import get_db_context
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
+from sqlalchemy import select
+
+from src.core.batch import stream_rows
 from src.core.models import Job
+from src.utils.delta_export import begin_delta, commit_delta, delta_filename, iter_changes
 from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Rows fetched per round trip from the server-side cursor
+EXPORT_BATCH_SIZE = 2000
+
+# Columns loaded for export (the cold description columns are never read)
+EXPORT_COLUMNS = (
+    Job.company,
+    Job.title,
+    Job.location,
+    Job.category,
+    Job.employment_type,
+    Job.posted_at,
+    Job.first_seen_at,
+    Job.url,
+    Job.source,
+    Job.tags,
+    Job.visa_sponsorship,
+    Job.tech_stack,
+    Job.compensation_min,
+    Job.compensation_max,
+    Job.start_date,
+    Job.duration,
+    Job.application_status,
+    Job.notes,
+)
+
+# (header, column width) of every sheet; widths are fixed because write-only
+# sheets are sized before any row is written
+SHEET_COLUMNS = (
+    ("Company", 25),
+    ("Title", 50),
+    ("Location", 30),
+    ("Category", 18),
+    ("Employment Type", 17),
+    ("Posted Date", 13),
+    ("First Seen", 18),
+    ("URL", 50),
+    ("Source", 12),
+    ("Tags", 30),
+    ("Visa Sponsorship", 18),
+    ("Tech Stack (Languages)", 25),
+    ("Tech Stack (Frameworks)", 25),
+    ("Tech Stack (Tools)", 25),
+    ("Compensation Min", 18),
+    ("Compensation Max", 18),
+    ("Start Date", 13),
+    ("Duration", 12),
+    ("Application Status", 20),
+    ("Notes", 50),
+)
+
+ALL_JOBS_SHEET = "Jobs"
+CHANGES_SHEET = "Changes"
+
+# Watermark of incremental Excel exports
+EXCEL_WATERMARK = "excel"
+
 
 class ExcelExporter:
-    """Export jobs to Excel format."""
+    """Export jobs to Excel format.
+    
+    Rows are streamed from a server-side cursor into write-only workbooks,
+    so memory stays constant regardless of how many jobs are exported.
+    """
     
     def __init__(self, export_dir: str = "exports"):
         """Initialize exporter.
@@ -24,85 +90,68 @@ class ExcelExporter:
         self.export_dir = Path(export_dir)
         self.export_dir.mkdir(exist_ok=True)
     
+    def export_all(
+        self, jobs_filename: str = None, category_filename: str = None
+    ) -> tuple[str | None, str | None]:
+        """Write the all-jobs and by-category workbooks in a single pass.
+        
+        Args:
+            jobs_filename: Output filename for all jobs. If None, generates timestamped name.
+            category_filename: Output filename for the by-category workbook
+        
+        Returns:
+            Tuple of (all-jobs path, by-category path); both None if there were no jobs
+        """
+        jobs_path = self._output_path(jobs_filename, "jobs_export")
+        category_path = self._output_path(category_filename, "jobs_by_category")
+        
+        jobs_book = SheetWriter()
+        category_book = SheetWriter()
+        count = 0
+        
+        for row in self._stream_active_jobs():
+            values = self._row_values(row)
+            jobs_book.append(ALL_JOBS_SHEET, values)
+            category_book.append(self._category_sheet(row.category), values)
+            count += 1
+        
+        if not count:
+            logger.warning("No jobs to export")
+            return None, None
+        
+        jobs_book.save(jobs_path)
+        category_book.save(category_path)
+        
+        logger.info(
+            f"✅ Exported {count} jobs to {jobs_path} and across "
+            f"{category_book.sheet_count} categories to {category_path}"
+        )
+        return str(jobs_path), str(category_path)
+    
     def export_jobs(self, jobs: List[Job] = None, filename: str = None) -> str:
         """Export jobs to Excel file.
         
         Args:
-            jobs: List of Job objects. If None, exports all active jobs.
+            jobs: List of Job objects. If None, streams all active jobs.
             filename: Output filename. If None, generates timestamped name.
-            
+        
         Returns:
             Path to exported file
         """
-        # Query jobs if not provided
-        if jobs is None:
-            with get_db_context() as db:
-                jobs = db.query(Job).filter(Job.is_active == True).all()
+        filepath = self._output_path(filename, "jobs_export")
+        book = SheetWriter()
+        count = 0
         
-        if not jobs:
+        for row in (jobs if jobs is not None else self._stream_active_jobs()):
+            book.append(ALL_JOBS_SHEET, self._row_values(row))
+            count += 1
+        
+        if not count:
             logger.warning("No jobs to export")
             return None
         
-        # Convert jobs to DataFrame
-        job_data = []
-        for job in jobs:
-            job_data.append({
-                "Company": job.company,
-                "Title": job.title,
-                "Location": job.location or "Not specified",
-                "Category": job.category or "Uncategorized",
-                "Employment Type": job.employment_type or "Not specified",
-                "Posted Date": job.posted_at.strftime("%Y-%m-%d") if job.posted_at else "Unknown",
-                "First Seen": job.first_seen_at.strftime("%Y-%m-%d %H:%M") if job.first_seen_at else "",
-                "URL": job.url,
-                "Source": job.source,
-                "Tags": ", ".join(job.tags) if job.tags else "",
-                "Visa Sponsorship": self._format_bool(job.visa_sponsorship),
-                "Tech Stack (Languages)": ", ".join(job.tech_stack.get("languages", [])) if job.tech_stack else "",
-                "Tech Stack (Frameworks)": ", ".join(job.tech_stack.get("frameworks", [])) if job.tech_stack else "",
-                "Tech Stack (Tools)": ", ".join(job.tech_stack.get("tools", [])) if job.tech_stack else "",
-                "Compensation Min": job.compensation_min,
-                "Compensation Max": job.compensation_max,
-                "Start Date": job.start_date or "",
-                "Duration": job.duration or "",
-                "Application Status": job.application_status or "Not Applied",
-                "Notes": job.notes or "",
-            })
-        
-        df = pd.DataFrame(job_data)
-        
-        # Generate filename if not provided
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"jobs_export_{timestamp}.xlsx"
-        
-        # Ensure .xlsx extension
-        if not filename.endswith(".xlsx"):
-            filename = f"{filename}.xlsx"
-        
-        filepath = self.export_dir / filename
-        
-        # Export to Excel with formatting
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Jobs', index=False)
-            
-            # Get the worksheet
-            worksheet = writer.sheets['Jobs']
-            
-            # Auto-adjust column widths
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)  # Max width of 50
-                worksheet.column_dimensions[column_letter].width = adjusted_width
-        
-        logger.info(f"✅ Exported {len(jobs)} jobs to {filepath}")
+        book.save(filepath)
+        logger.info(f"✅ Exported {count} jobs to {filepath}")
         return str(filepath)
     
     def export_by_category(self, filename: str = None) -> str:
@@ -110,106 +159,167 @@ class ExcelExporter:
         
         Args:
             filename: Output filename
-            
+        
         Returns:
             Path to exported file
         """
-        with get_db_context() as db:
-            jobs = db.query(Job).filter(Job.is_active == True).all()
+        filepath = self._output_path(filename, "jobs_by_category")
+        book = SheetWriter()
+        count = 0
         
-        if not jobs:
+        for row in self._stream_active_jobs():
+            book.append(self._category_sheet(row.category), self._row_values(row))
+            count += 1
+        
+        if not count:
             logger.warning("No jobs to export")
             return None
         
-        # Group by category
-        jobs_by_category = {}
-        for job in jobs:
-            category = job.category or "Uncategorized"
-            if category not in jobs_by_category:
-                jobs_by_category[category] = []
-            jobs_by_category[category].append(job)
+        book.save(filepath)
+        logger.info(f"✅ Exported {count} jobs across {book.sheet_count} categories to {filepath}")
+        return str(filepath)
+    
+    def export_delta(self, filename: str = None) -> str | None:
+        """Export only jobs inserted, updated or closed since the last delta.
+        
+        The first delta (no watermark yet) contains every job.
+        
+        Args:
+            filename: Output filename. If None, named after the change range.
+            
+        Returns:
+            Path to exported file, or None if nothing changed
+        """
+        window = begin_delta(EXCEL_WATERMARK)
+        if window is None:
+            logger.info("No job changes since the last Excel delta")
+            return None
+        
+        filepath = self._output_path(filename or delta_filename("jobs", window, "xlsx"), "jobs_delta")
+        book = SheetWriter(columns=(("Change", 10),) + SHEET_COLUMNS)
+        book.sheet(CHANGES_SHEET)
+        count = 0
+        
+        for row in iter_changes(window, EXPORT_COLUMNS):
+            book.append(CHANGES_SHEET, [row.change, *self._row_values(row)])
+            count += 1
         
-        # Generate filename
+        book.save(filepath)
+        commit_delta(window, count)
+        
+        logger.info(f"✅ Exported {count} changed jobs to {filepath}")
+        return str(filepath)
+    
+    def _stream_active_jobs(self) -> Iterable[Any]:
+        """Yield active jobs from a server-side cursor, a batch at a time."""
+        stmt = (
+            select(*EXPORT_COLUMNS)
+            .where(Job.is_active == True)
+            .order_by(Job.company, Job.title)
+        )
+        yield from stream_rows(stmt, EXPORT_BATCH_SIZE)
+    
+    def _output_path(self, filename: str | None, prefix: str) -> Path:
+        """Resolve an output filename (timestamped if None, .xlsx enforced)."""
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"jobs_by_category_{timestamp}.xlsx"
+            filename = f"{prefix}_{timestamp}.xlsx"
         
         if not filename.endswith(".xlsx"):
             filename = f"{filename}.xlsx"
         
-        filepath = self.export_dir / filename
-        
-        # Export each category to separate sheet
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            for category, category_jobs in jobs_by_category.items():
-                job_data = self._jobs_to_dict_list(category_jobs)
-                df = pd.DataFrame(job_data)
-                
-                # Truncate sheet name if too long (Excel limit is 31 chars)
-                sheet_name = category[:31]
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
-                
-                # Auto-adjust columns
-                worksheet = writer.sheets[sheet_name]
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-        
-        logger.info(f"✅ Exported {len(jobs)} jobs across {len(jobs_by_category)} categories to {filepath}")
-        return str(filepath)
+        return self.export_dir / filename
+    
+    def _category_sheet(self, category: str | None) -> str:
+        """Sheet name for a category (Excel limits names to 31 chars)."""
+        return (category or "Uncategorized")[:31]
     
-    def _jobs_to_dict_list(self, jobs: List[Job]) -> List[dict]:
-        """Convert list of Job objects to list of dictionaries.
+    def _row_values(self, job: Any) -> list:
+        """Convert a job (ORM object or result row) to sheet values.
         
         Args:
-            jobs: List of Job objects
-            
+            job: Object with the EXPORT_COLUMNS attributes
+        
         Returns:
-            List of dictionaries
+            Values in SHEET_COLUMNS order
         """
-        job_data = []
-        for job in jobs:
-            job_data.append({
-                "Company": job.company,
-                "Title": job.title,
-                "Location": job.location or "Not specified",
-                "Category": job.category or "Uncategorized",
-                "Employment Type": job.employment_type or "Not specified",
-                "Posted Date": job.posted_at.strftime("%Y-%m-%d") if job.posted_at else "Unknown",
-                "First Seen": job.first_seen_at.strftime("%Y-%m-%d %H:%M") if job.first_seen_at else "",
-                "URL": job.url,
-                "Source": job.source,
-                "Tags": ", ".join(job.tags) if job.tags else "",
-                "Visa Sponsorship": self._format_bool(job.visa_sponsorship),
-                "Tech Stack (Languages)": ", ".join(job.tech_stack.get("languages", [])) if job.tech_stack else "",
-                "Tech Stack (Frameworks)": ", ".join(job.tech_stack.get("frameworks", [])) if job.tech_stack else "",
-                "Tech Stack (Tools)": ", ".join(job.tech_stack.get("tools", [])) if job.tech_stack else "",
-                "Compensation Min": job.compensation_min,
-                "Compensation Max": job.compensation_max,
-                "Start Date": job.start_date or "",
-                "Duration": job.duration or "",
-                "Application Status": job.application_status or "Not Applied",
-                "Notes": job.notes or "",
-            })
-        return job_data
+        tech_stack = job.tech_stack or {}
+        return [
+            job.company,
+            job.title,
+            job.location or "Not specified",
+            job.category or "Uncategorized",
+            job.employment_type or "Not specified",
+            job.posted_at.strftime("%Y-%m-%d") if job.posted_at else "Unknown",
+            job.first_seen_at.strftime("%Y-%m-%d %H:%M") if job.first_seen_at else "",
+            job.url,
+            job.source,
+            ", ".join(job.tags) if job.tags else "",
+            self._format_bool(job.visa_sponsorship),
+            ", ".join(tech_stack.get("languages", [])),
+            ", ".join(tech_stack.get("frameworks", [])),
+            ", ".join(tech_stack.get("tools", [])),
+            job.compensation_min,
+            job.compensation_max,
+            job.start_date or "",
+            job.duration or "",
+            job.application_status or "Not Applied",
+            job.notes or "",
+        ]
     
     def _format_bool(self, value) -> str:
         """Format boolean value for Excel.
         
         Args:
             value: Boolean or None
-            
+        
         Returns:
             Formatted string
         """
         if value is None:
             return "Unknown"
         return "Yes" if value else "No"
+
+
+class SheetWriter:
+    """Write-only workbook that creates a sheet (with header) on first use."""
+    
+    def __init__(self, columns: tuple = SHEET_COLUMNS):
+        """Initialize empty write-only workbook.
+        
+        Args:
+            columns: (header, width) pairs of every sheet
+        """
+        self.workbook = Workbook(write_only=True)
+        self.columns = columns
+        self._sheets = {}
+    
+    @property
+    def sheet_count(self) -> int:
+        """Number of sheets created."""
+        return len(self._sheets)
+    
+    def sheet(self, sheet_name: str):
+        """Get a sheet, creating it (sized, with a bold frozen header) if needed."""
+        sheet = self._sheets.get(sheet_name)
+        if sheet is None:
+            sheet = self.workbook.create_sheet(title=sheet_name)
+            for index, (_, width) in enumerate(self.columns, 1):
+                sheet.column_dimensions[get_column_letter(index)].width = width
+            sheet.freeze_panes = "A2"
+            header = []
+            for title, _ in self.columns:
+                cell = WriteOnlyCell(sheet, value=title)
+                cell.font = Font(bold=True)
+                header.append(cell)
+            sheet.append(header)
+            self._sheets[sheet_name] = sheet
+        return sheet
+    
+    def append(self, sheet_name: str, values: list):
+        """Append a row to a sheet, creating it if needed."""
+        self.sheet(sheet_name).append(values)
+    
+    def save(self, path: Path):
+        """Write the workbook to disk."""
+        self.workbook.save(path)
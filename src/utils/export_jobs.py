@@ -1,22 +1,89 @@
 """Export jobs to txt and xlsx files."""
 
-import os
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-import pandas as pd
+from sqlalchemy import func, select
 
+from src.core.batch import batch_session, stream_rows
 from src.core.models import Job
-from src.core.config import get_settings
+from src.utils.delta_export import CsvDeltaLog, format_timestamp
+from src.utils.excel_exporter import SheetWriter
 
-settings = get_settings()
+# (header, column width) of the XLSX export
+XLSX_COLUMNS = (
+    ('Company', 25),
+    ('Title', 50),
+    ('Location', 30),
+    ('Category', 20),
+    ('URL', 50),
+    ('First Seen', 12),
+    ('Last Updated', 14),
+)
+
+# Columns of the incremental CSV log (job ID first: it keys compaction).
+# No last seen date: the change trigger ignores it, so it would go stale
+DELTA_HEADER = ['ID', 'Company', 'Title', 'Location', 'Category', 'URL', 'First Seen']
+DELTA_COLUMNS = (
+    Job.id,
+    Job.company,
+    Job.title,
+    Job.location,
+    Job.category,
+    Job.url,
+    Job.first_seen_at,
+)
+
+
+def _delta_row(job) -> list:
+    """Format a changed job for the incremental CSV log."""
+    return [
+        str(job.id),
+        job.company,
+        job.title,
+        job.location or 'Not specified',
+        job.category or 'Uncategorized',
+        job.url,
+        format_timestamp(job.first_seen_at, '%Y-%m-%d'),
+    ]
+
+
+def export_job_changes(country: str = "us", compact: bool = False):
+    """Export only jobs inserted, updated or closed since the last run.
+    
+    Deltas go to exports/jobs_<country>_delta_<from>_<to>.csv; compaction
+    merges them into exports/jobs_<country>.csv (active jobs only).
+    
+    Args:
+        country: Country filter (us or india)
+        compact: Also merge pending deltas into the snapshot
+    """
+    log = CsvDeltaLog(
+        f"jobs_{country}",
+        "exports",
+        header=DELTA_HEADER,
+        columns=DELTA_COLUMNS,
+        format_row=_delta_row,
+        keep_closed=False,
+        country=country,
+    )
+    
+    path, rows = log.export_delta()
+    if path:
+        print(f"✅ Exported {rows} changed jobs to: {path}")
+    else:
+        print(f"No changes for {country} since the last export")
+    
+    if compact:
+        print(f"✅ Snapshot saved to: {log.compact()}")
 
 
 def export_jobs_to_files(country: str = "us"):
     """Export jobs to .txt and .xlsx files.
     
+    Jobs are streamed once from a server-side cursor into both files.
+    
     Args:
         country: Country filter (us or india)
     """
@@ -24,141 +91,124 @@ def export_jobs_to_files(country: str = "us"):
     export_dir = Path("exports")
     export_dir.mkdir(exist_ok=True)
     
-    # Connect to database
-    engine = create_engine(settings.database_url)
-    Session = sessionmaker(bind=engine)
-    session = Session()
-    
-    try:
-        # Query active jobs for the country
-        jobs = session.query(Job).filter(
-            Job.is_active == True,
-            Job.country == country
-        ).order_by(Job.company, Job.title).all()
-        
-        if not jobs:
-            print(f"No jobs found for {country}")
-            return
-        
-        # Generate timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        country_label = country.upper()
-        
-        # Export to TXT
-        txt_file = export_dir / f"jobs_{country}_{timestamp}.txt"
-        with open(txt_file, 'w', encoding='utf-8') as f:
-            f.write(f"{'='*80}\n")
-            f.write(f"  {country_label} INTERNSHIPS - Summer 2026\n")
-            f.write(f"  Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"  Total Jobs: {len(jobs)}\n")
-            f.write(f"{'='*80}\n\n")
-            
-            current_company = None
-            for job in jobs:
-                # Company header
-                if job.company != current_company:
-                    if current_company:
-                        f.write("\n")
-                    f.write(f"\n{'─'*80}\n")
-                    f.write(f"🏢 {job.company}\n")
-                    f.write(f"{'─'*80}\n\n")
-                    current_company = job.company
-                
-                # Job details
-                f.write(f"📋 {job.title}\n")
-                if job.location:
-                    f.write(f"📍 Location: {job.location}\n")
-                if job.category:
-                    f.write(f"🏷️  Category: {job.category}\n")
-                if job.remote:
-                    f.write(f"🏠 Remote: Yes\n")
-                f.write(f"🔗 URL: {job.url}\n")
-                f.write(f"📅 First Seen: {job.first_seen_at.strftime('%Y-%m-%d')}\n")
-                f.write(f"\n")
-        
-        print(f"✅ Exported to: {txt_file}")
-        
-        # Export to XLSX
-        xlsx_file = export_dir / f"jobs_{country}_{timestamp}.xlsx"
-        
-        # Prepare data for DataFrame
-        data = []
-        for job in jobs:
-            data.append({
-                'Company': job.company,
-                'Title': job.title,
-                'Location': job.location or 'Not specified',
-                'Category': job.category or 'Uncategorized',
-                'Remote': 'Yes' if job.remote else 'No',
-                'URL': job.url,
-                'First Seen': job.first_seen_at.strftime('%Y-%m-%d'),
-                'Last Updated': job.last_seen_at.strftime('%Y-%m-%d'),
-            })
-        
-        # Create DataFrame and export
-        df = pd.DataFrame(data)
-        
-        # Create Excel writer with formatting
-        with pd.ExcelWriter(xlsx_file, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='Internships')
-            
-            # Get workbook and worksheet
-            workbook = writer.book
-            worksheet = writer.sheets['Internships']
-            
-            # Adjust column widths
-            for idx, col in enumerate(df.columns, 1):
-                max_length = max(
-                    df[col].astype(str).apply(len).max(),
-                    len(col)
-                ) + 2
-                worksheet.column_dimensions[chr(64 + idx)].width = min(max_length, 50)
-            
-            # Format header row
-            for cell in worksheet[1]:
-                cell.font = cell.font.copy(bold=True)
-        
-        print(f"✅ Exported to: {xlsx_file}")
+    # Query active jobs for the country
+    where = (Job.is_active == True, Job.country == country)
+    with batch_session() as db:
+        total = db.scalar(select(func.count(Job.id)).where(*where))
+    
+    if not total:
+        print(f"No jobs found for {country}")
+        return
+    
+    # Generate timestamp
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    country_label = country.upper()
+    
+    txt_file = export_dir / f"jobs_{country}_{timestamp}.txt"
+    xlsx_file = export_dir / f"jobs_{country}_{timestamp}.xlsx"
+    book = SheetWriter(columns=XLSX_COLUMNS)
+    company_counts = Counter()
+    category_counts = Counter()
+    
+    stmt = (
+        select(
+            Job.company,
+            Job.title,
+            Job.location,
+            Job.category,
+            Job.url,
+            Job.first_seen_at,
+            Job.last_seen_at,
+        )
+        .where(*where)
+        .order_by(Job.company, Job.title)
+    )
+    
+    # Export to TXT (and collect the XLSX rows on the way)
+    with open(txt_file, 'w', encoding='utf-8') as f:
+        f.write(f"{'='*80}\n")
+        f.write(f"  {country_label} INTERNSHIPS - Summer 2026\n")
+        f.write(f"  Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"  Total Jobs: {total}\n")
+        f.write(f"{'='*80}\n\n")
         
-        # Also create a summary file
-        summary_file = export_dir / f"summary_{country}_{timestamp}.txt"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            f.write(f"{country_label} Internships Summary\n")
-            f.write(f"{'='*60}\n\n")
-            f.write(f"Total Jobs: {len(jobs)}\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            
-            # Jobs by company
-            f.write(f"Jobs by Company:\n")
-            f.write(f"{'-'*60}\n")
-            company_counts = {}
-            for job in jobs:
-                company_counts[job.company] = company_counts.get(job.company, 0) + 1
-            
-            for company, count in sorted(company_counts.items(), key=lambda x: x[1], reverse=True):
-                f.write(f"  {company:.<40} {count:>3} jobs\n")
+        current_company = None
+        for job in stream_rows(stmt):
+            # Company header
+            if job.company != current_company:
+                if current_company:
+                    f.write("\n")
+                f.write(f"\n{'─'*80}\n")
+                f.write(f"🏢 {job.company}\n")
+                f.write(f"{'─'*80}\n\n")
+                current_company = job.company
             
+            # Job details
+            f.write(f"📋 {job.title}\n")
+            if job.location:
+                f.write(f"📍 Location: {job.location}\n")
+            if job.category:
+                f.write(f"🏷️  Category: {job.category}\n")
+            f.write(f"🔗 URL: {job.url}\n")
+            f.write(f"📅 First Seen: {job.first_seen_at.strftime('%Y-%m-%d')}\n")
             f.write(f"\n")
             
-            # Jobs by category
-            f.write(f"Jobs by Category:\n")
-            f.write(f"{'-'*60}\n")
-            category_counts = {}
-            for job in jobs:
-                cat = job.category or 'Uncategorized'
-                category_counts[cat] = category_counts.get(cat, 0) + 1
-            
-            for category, count in sorted(category_counts.items(), key=lambda x: x[1], reverse=True):
-                f.write(f"  {category:.<40} {count:>3} jobs\n")
+            book.append('Internships', [
+                job.company,
+                job.title,
+                job.location or 'Not specified',
+                job.category or 'Uncategorized',
+                job.url,
+                job.first_seen_at.strftime('%Y-%m-%d'),
+                job.last_seen_at.strftime('%Y-%m-%d'),
+            ])
+            company_counts[job.company] += 1
+            category_counts[job.category or 'Uncategorized'] += 1
+    
+    print(f"✅ Exported to: {txt_file}")
+    
+    # Export to XLSX
+    book.save(xlsx_file)
+    print(f"✅ Exported to: {xlsx_file}")
+    
+    exported = sum(company_counts.values())
+    
+    # Also create a summary file
+    summary_file = export_dir / f"summary_{country}_{timestamp}.txt"
+    with open(summary_file, 'w', encoding='utf-8') as f:
+        f.write(f"{country_label} Internships Summary\n")
+        f.write(f"{'='*60}\n\n")
+        f.write(f"Total Jobs: {exported}\n")
+        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        
+        # Jobs by company
+        f.write(f"Jobs by Company:\n")
+        f.write(f"{'-'*60}\n")
+        for company, count in company_counts.most_common():
+            f.write(f"  {company:.<40} {count:>3} jobs\n")
         
-        print(f"✅ Summary saved to: {summary_file}")
-        print(f"\n📊 Exported {len(jobs)} jobs to exports/ folder")
+        f.write(f"\n")
         
-    finally:
-        session.close()
+        # Jobs by category
+        f.write(f"Jobs by Category:\n")
+        f.write(f"{'-'*60}\n")
+        for category, count in category_counts.most_common():
+            f.write(f"  {category:.<40} {count:>3} jobs\n")
+    
+    print(f"✅ Summary saved to: {summary_file}")
+    print(f"\n📊 Exported {exported} jobs to exports/ folder")
 
 
 if __name__ == "__main__":
-    import sys
-    country = sys.argv[1] if len(sys.argv) > 1 else "us"
-    export_jobs_to_files(country)
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Export jobs to files")
+    parser.add_argument("country", nargs="?", default="us", help="Country filter (us or india)")
+    parser.add_argument("--delta", action="store_true", help="Only export jobs changed since the last export")
+    parser.add_argument("--compact", action="store_true", help="With --delta, merge deltas into the snapshot")
+    args = parser.parse_args()
+    
+    if args.delta:
+        export_job_changes(args.country, compact=args.compact)
+    else:
+        export_jobs_to_files(args.country)
@@ -1,5 +1,6 @@
 """HTTP utilities and rate limiting."""
 
+import threading
 import time
 from typing import Any
 
@@ -42,6 +43,28 @@ class RateLimiter:
 # Global rate limiter
 _rate_limiter = RateLimiter(max_rps=settings.http_max_rps)
 
+# Per-thread byte counter (each target is scraped on a single worker thread)
+_byte_counter = threading.local()
+
+
+def reset_byte_count() -> None:
+    """Start counting response bytes for the current thread."""
+    _byte_counter.total = 0
+
+
+def get_byte_count() -> int:
+    """Get response bytes received by the current thread since the last reset."""
+    return getattr(_byte_counter, "total", 0)
+
+
+def record_response_bytes(response: requests.Response) -> None:
+    """Add a response body size to the current thread's byte count.
+    
+    Args:
+        response: Completed response
+    """
+    _byte_counter.total = get_byte_count() + len(response.content or b"")
+
 
 @retry(
     stop=stop_after_attempt(3),
@@ -80,6 +103,7 @@ def get_with_retry(url: str, **kwargs: Any) -> requests.Response:
     
     logger.debug(f"GET {url}")
     response = requests.get(url, **kwargs)
+    record_response_bytes(response)
     
     # Check for rate limiting
     if response.status_code == 429:
@@ -129,6 +153,7 @@ def post_with_retry(url: str, **kwargs: Any) -> requests.Response:
     
     logger.debug(f"POST {url}")
     response = requests.post(url, **kwargs)
+    record_response_bytes(response)
     
     # Check for rate limiting
     if response.status_code == 429:
@@ -1,22 +1,40 @@
 """Notification handlers for Slack, Email, etc."""
 
-import smtplib
+import csv
+import io
+import uuid
 from abc import ABC, abstractmethod
+from collections import Counter
 from datetime import datetime, timedelta
+from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from html import escape
+from string import Template
 from typing import Any
 
 import requests
+from sqlalchemy import and_, insert, or_, select
 from sqlalchemy.orm import Session
 
 from src.core.config import get_settings
 from src.core.models import Alert, Job
 from src.utils.logging_config import get_logger
+from src.utils.slack_sender import get_slack_sender
+from src.utils.smtp_sender import SmtpSession, get_smtp_session
 
 settings = get_settings()
 logger = get_logger(__name__)
 
+# No second alert for the same job and channel within this period
+ALERT_COOLDOWN_HOURS = 24
+
+# Slack block-kit limits: 50 blocks per message (2 used by the digest header),
+# 3000 characters per section, and a conservative cap on the whole message
+SLACK_JOBS_PER_MESSAGE = 48
+SLACK_SECTION_CHARS = 3000
+SLACK_MESSAGE_CHARS = 30000
+
 
 class BaseNotifier(ABC):
     """Base class for notifiers."""
@@ -30,7 +48,7 @@ class BaseNotifier(ABC):
         Args:
             job: Job to notify about
             alert_type: Type of alert ('new' or 'updated')
-            
+        
         Returns:
             True if sent successfully
         """
@@ -42,7 +60,7 @@ class BaseNotifier(ABC):
         Args:
             job: Job to format
             alert_type: Type of alert
-            
+        
         Returns:
             Dictionary with 'title' and 'body'
         """
@@ -62,9 +80,6 @@ class BaseNotifier(ABC):
         if job.location:
             body_parts.append(f"**Location:** {job.location}")
         
-        if job.remote:
-            body_parts.append("**Remote:** Yes")
-        
         if job.posted_at:
             body_parts.append(f"**Posted:** {job.posted_at.strftime('%Y-%m-%d %H:%M UTC')}")
         
@@ -80,7 +95,11 @@ class BaseNotifier(ABC):
 
 
 class SlackNotifier(BaseNotifier):
-    """Slack webhook notifier."""
+    """Slack webhook notifier.
+    
+    Messages go through the process-wide paced sender for the webhook (see
+    src/utils/slack_sender.py), which keeps under Slack's rate limit.
+    """
     
     channel = "slack"
     
@@ -91,13 +110,38 @@ class SlackNotifier(BaseNotifier):
         if not self.webhook_url:
             logger.warning("Slack webhook URL not configured")
     
+    def send_batch(self, jobs: list[Job], companies_scanned: list[str] = None, new_count: int = 0, updated_count: int = 0) -> bool:
+        """Send a block-kit digest of many jobs (as few messages as Slack's limits allow).
+        
+        Args:
+            jobs: List of jobs to notify about
+            companies_scanned: List of companies that were scanned
+            new_count: Number of new jobs
+            updated_count: Number of updated jobs
+        
+        Returns:
+            True if every digest message was posted
+        """
+        if not jobs:
+            return True
+        
+        if not self.webhook_url:
+            logger.error("Cannot send Slack digest: webhook URL not configured")
+            return False
+        
+        messages = build_slack_digest(jobs, companies_scanned, new_count, updated_count)
+        sent = get_slack_sender(self.webhook_url).send_all(messages)
+        if sent:
+            logger.info(f"Sent Slack digest with {len(jobs)} jobs in {len(messages)} messages")
+        return sent
+    
     def send(self, job: Job, alert_type: str = "new") -> bool:
         """Send notification to Slack.
         
         Args:
             job: Job to notify about
             alert_type: Type of alert
-            
+        
         Returns:
             True if sent successfully
         """
@@ -122,36 +166,169 @@ class SlackNotifier(BaseNotifier):
             ],
         }
         
-        try:
-            response = requests.post(
-                self.webhook_url,
-                json=payload,
-                timeout=10,
-            )
-            response.raise_for_status()
+        if get_slack_sender(self.webhook_url).send_all([payload]):
             logger.info(f"Sent Slack notification for {job.company} - {job.title}")
             return True
         
-        except Exception as e:
-            logger.error(f"Failed to send Slack notification: {e}")
-            return False
+        logger.error(f"Failed to send Slack notification for {job.company} - {job.title}")
+        return False
+
+
+def _slack_escape(text: str) -> str:
+    """Escape the characters Slack mrkdwn treats as control characters."""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def build_slack_digest(
+    jobs: list[Job],
+    companies_scanned: list[str] | None = None,
+    new_count: int = 0,
+    updated_count: int = 0,
+) -> list[dict[str, Any]]:
+    """Pack jobs into block-kit messages within Slack's per-message limits.
+    
+    Args:
+        jobs: Jobs to list (one section block each)
+        companies_scanned: Companies the run scanned
+        new_count: Number of new jobs
+        updated_count: Number of updated jobs
+    
+    Returns:
+        Webhook payloads, in order
+    """
+    title = f"🎯 {new_count} New + {updated_count} Updated Jobs ({len(jobs)} total)"
+    
+    chunks: list[list[dict[str, Any]]] = [[]]
+    chunk_chars = 0
+    for job in jobs:
+        details = " · ".join(
+            _slack_escape(part) for part in (job.company, job.location, job.category) if part
+        )
+        text = f"*<{job.url}|{_slack_escape(job.title)}>*\n{details}"[:SLACK_SECTION_CHARS]
+        
+        if len(chunks[-1]) >= SLACK_JOBS_PER_MESSAGE or chunk_chars + len(text) > SLACK_MESSAGE_CHARS:
+            chunks.append([])
+            chunk_chars = 0
+        chunks[-1].append({"type": "section", "text": {"type": "mrkdwn", "text": text}})
+        chunk_chars += len(text)
+    
+    summary = f"📊 *{new_count}* new + *{updated_count}* updated"
+    if companies_scanned:
+        summary += f" · ✅ Scanned {len(companies_scanned)} companies"
+    
+    messages = []
+    for index, sections in enumerate(chunks, 1):
+        part = f" ({index}/{len(chunks)})" if len(chunks) > 1 else ""
+        messages.append({
+            "text": title + part,
+            "blocks": [
+                {"type": "header", "text": {"type": "plain_text", "text": (title + part)[:150]}},
+                {"type": "context", "elements": [{"type": "mrkdwn", "text": summary}]},
+                *sections,
+            ],
+        })
+    return messages
+
+
+# Gmail clips HTML bodies past ~102KB; larger digests list the jobs that fit
+# and attach the full list as CSV
+EMAIL_HTML_MAX_BYTES = 100_000
+EMAIL_CSV_COLUMNS = ("company", "title", "location", "category", "source", "posted_at", "url")
+
+# Email templates, parsed once at import; values are escaped before substitution
+_EMAIL_DIGEST_HTML = Template("""\
+<html><body style='font-family: Arial, sans-serif;'>
+<h1 style='color: #2c3e50;'>$subject</h1>
+<p style='color: #7f8c8d;'>📊 <strong>$new_count</strong> new jobs + <strong>$updated_count</strong> updated jobs</p>
+$scanned$truncated<hr style='border: 1px solid #ecf0f1;'/>
+<table style='width: 100%; border-collapse: collapse; margin-top: 20px;'>
+<thead>
+<tr style='background: #3498db; color: white;'>
+<th style='padding: 12px; text-align: left; border: 1px solid #ddd;'>Company</th>
+<th style='padding: 12px; text-align: left; border: 1px solid #ddd;'>Title</th>
+<th style='padding: 12px; text-align: left; border: 1px solid #ddd;'>Location</th>
+<th style='padding: 12px; text-align: left; border: 1px solid #ddd;'>Category</th>
+<th style='padding: 12px; text-align: center; border: 1px solid #ddd;'>Action</th>
+</tr>
+</thead>
+<tbody>
+$rows</tbody>
+</table>
+<hr style='border: 1px solid #ecf0f1; margin-top: 30px;'/>
+$companies<p style='color: #95a5a6; font-size: 12px; margin-top: 20px;'>Automated notification from Job Tracker</p>
+</body></html>
+""")
+
+_EMAIL_ROW_HTML = Template("""\
+<tr style='background: $background;'>
+<td style='padding: 10px; border: 1px solid #ddd;'><strong>$company</strong></td>
+<td style='padding: 10px; border: 1px solid #ddd;'>$title</td>
+<td style='padding: 10px; border: 1px solid #ddd;'>$location</td>
+<td style='padding: 10px; border: 1px solid #ddd;'>$category</td>
+<td style='padding: 10px; border: 1px solid #ddd; text-align: center;'><a href='$url' style='background: #3498db; color: white; padding: 6px 12px; text-decoration: none; border-radius: 4px; font-size: 12px;'>Apply</a></td>
+</tr>
+""")
+
+_EMAIL_SCANNED_HTML = Template(
+    "<p style='color: #95a5a6; font-size: 14px;'>✅ Scanned $count companies total</p>\n"
+)
+
+_EMAIL_TRUNCATED_HTML = Template(
+    "<p style='color: #e67e22;'>Showing the first $shown of $total jobs; "
+    "the full list is attached as $filename.</p>\n"
+)
+
+_EMAIL_COMPANIES_HTML = Template("""\
+<details style='margin-top: 20px;'>
+<summary style='cursor: pointer; color: #7f8c8d; font-size: 14px;'>📊 View All Companies Scanned ($count total)</summary>
+<div style='margin-top: 10px; padding: 10px; background: #f8f9fa; border-radius: 4px;'>$items</div>
+</details>
+""")
+
+_EMAIL_COMPANY_HIT_HTML = Template("<span style='color: #27ae60; margin-right: 15px;'>✓ $company ($count jobs)</span>")
+_EMAIL_COMPANY_MISS_HTML = Template("<span style='color: #95a5a6; margin-right: 15px;'>○ $company</span>")
+
+_EMAIL_ROW_TEXT = Template("$company $title $location\n  🔗 $url\n")
+
+_EMAIL_JOB_HTML = Template("""\
+<html>
+<body>
+<h2>$title</h2>
+<div style="font-family: Arial, sans-serif;">$body</div>
+<hr/>
+<p style="color: #666; font-size: 12px;">Automated notification from Job Tracker</p>
+</body>
+</html>
+""")
+
+EMAIL_CSV_FILENAME = "jobs.csv"
 
 
 class EmailNotifier(BaseNotifier):
-    """Email notifier via SMTP."""
+    """Email notifier via SMTP.
+    
+    Messages go through a persistent SMTP session (the process-wide one for
+    the configured server by default, see src/utils/smtp_sender.py), so
+    consecutive sends reuse one connection.
+    """
     
     channel = "email"
     
-    def __init__(self):
-        """Initialize Email notifier."""
+    def __init__(self, session: SmtpSession | None = None):
+        """Initialize Email notifier.
+        
+        Args:
+            session: SMTP session to send through (defaults to the shared one)
+        """
         self.smtp_server = settings.smtp_server
-        self.smtp_port = settings.smtp_port
-        self.smtp_user = settings.smtp_user
-        self.smtp_pass = settings.smtp_pass
-        self.smtp_from = settings.smtp_from
-        self.smtp_to = settings.smtp_to
+        self.smtp_from = settings.smtp_from or settings.smtp_user
+        self.smtp_to = settings.smtp_to or settings.smtp_user
+        self.session = session
+        
+        if self.session is None and self.smtp_server:
+            self.session = get_smtp_session()
         
-        if not all([self.smtp_server, self.smtp_user, self.smtp_pass]):
+        if self.session is None or not self.smtp_to:
             logger.warning("Email SMTP settings not fully configured")
     
     def send_batch(self, jobs: list[Job], companies_scanned: list[str] = None, new_count: int = 0, updated_count: int = 0) -> bool:
@@ -162,152 +339,15 @@ class EmailNotifier(BaseNotifier):
             companies_scanned: List of companies that were scanned
             new_count: Number of new jobs
             updated_count: Number of updated jobs
-            
+        
         Returns:
             True if sent successfully
         """
         if not jobs:
             return True
-            
-        if not all([self.smtp_server, self.smtp_user, self.smtp_pass]):
-            logger.error("Cannot send email: SMTP settings not configured")
-            return False
-        
-        # Create email subject
-        total = len(jobs)
-        subject = f"🎯 {new_count} New + {updated_count} Updated Jobs ({total} total)"
-        
-        # Build HTML body with table
-        html_parts = [
-            "<html><body style='font-family: Arial, sans-serif;'>",
-            f"<h1 style='color: #2c3e50;'>{subject}</h1>",
-            f"<p style='color: #7f8c8d;'>📊 <strong>{new_count}</strong> new jobs + <strong>{updated_count}</strong> updated jobs</p>",
-        ]
         
-        # Add scan summary if provided
-        if companies_scanned:
-            html_parts.append(f"<p style='color: #95a5a6; font-size: 14px;'>✅ Scanned {len(companies_scanned)} companies total</p>")
-        
-        html_parts.append("<hr style='border: 1px solid #ecf0f1;'/>")
-        
-        # Create table
-        html_parts.append("""
-        <table style='width: 100%; border-collapse: collapse; margin-top: 20px;'>
-            <thead>
-                <tr style='background: #3498db; color: white;'>
-                    <th style='padding: 12px; text-align: left; border: 1px solid #ddd;'>Company</th>
-                    <th style='padding: 12px; text-align: left; border: 1px solid #ddd;'>Title</th>
-                    <th style='padding: 12px; text-align: left; border: 1px solid #ddd;'>Location</th>
-                    <th style='padding: 12px; text-align: left; border: 1px solid #ddd;'>Category</th>
-                    <th style='padding: 12px; text-align: center; border: 1px solid #ddd;'>Remote</th>
-                    <th style='padding: 12px; text-align: center; border: 1px solid #ddd;'>Action</th>
-                </tr>
-            </thead>
-            <tbody>
-        """)
-        
-        # Add each job as a table row
-        for idx, job in enumerate(jobs, 1):
-            row_color = "#f8f9fa" if idx % 2 == 0 else "#ffffff"
-            remote_icon = "✅" if job.remote else "❌"
-            category = (job.category or "Other").replace("_", " ").title()
-            
-            html_parts.append(f"""
-                <tr style='background: {row_color};'>
-                    <td style='padding: 10px; border: 1px solid #ddd;'><strong>{job.company}</strong></td>
-                    <td style='padding: 10px; border: 1px solid #ddd;'>{job.title}</td>
-                    <td style='padding: 10px; border: 1px solid #ddd;'>{job.location or 'N/A'}</td>
-                    <td style='padding: 10px; border: 1px solid #ddd;'>{category}</td>
-                    <td style='padding: 10px; border: 1px solid #ddd; text-align: center;'>{remote_icon}</td>
-                    <td style='padding: 10px; border: 1px solid #ddd; text-align: center;'>
-                        <a href='{job.url}' style='background: #3498db; color: white; padding: 6px 12px; text-decoration: none; border-radius: 4px; font-size: 12px;'>Apply</a>
-                    </td>
-                </tr>
-            """)
-        
-        # Close table
-        html_parts.append("""
-            </tbody>
-        </table>
-        """)
-        
-        # Add text version (simple table)
-        text_parts = [
-            f"{subject}\n",
-            f"📊 {new_count} new + {updated_count} updated jobs\n",
-        ]
-        
-        if companies_scanned:
-            text_parts.append(f"✅ Scanned {len(companies_scanned)} companies total\n")
-        
-        text_parts.append("="*100 + "\n")
-        text_parts.append(f"{'Company':<25} {'Title':<35} {'Location':<20} {'Remote':<8}\n")
-        text_parts.append("="*100 + "\n")
-        
-        for job in jobs:
-            remote_text = "Yes" if job.remote else "No"
-            text_parts.append(f"{job.company:<25} {job.title[:33]:<35} {(job.location or 'N/A')[:18]:<20} {remote_text:<8}\n")
-            text_parts.append(f"  🔗 {job.url}\n")
-        
-        # Group jobs by company for summary
-        jobs_by_company = {}
-        for job in jobs:
-            if job.company not in jobs_by_company:
-                jobs_by_company[job.company] = []
-            jobs_by_company[job.company].append(job)
-        
-        # Add scan summary footer
-        html_parts.append("<hr style='border: 1px solid #ecf0f1; margin-top: 30px;'/>")
-        
-        if companies_scanned:
-            html_parts.append("<details style='margin-top: 20px;'>")
-            html_parts.append("<summary style='cursor: pointer; color: #7f8c8d; font-size: 14px;'>📊 View All Companies Scanned ({} total)</summary>".format(len(companies_scanned)))
-            html_parts.append("<div style='margin-top: 10px; padding: 10px; background: #f8f9fa; border-radius: 4px;'>")
-            
-            # Group companies by whether they had jobs
-            companies_with_jobs = set(jobs_by_company.keys())
-            companies_scanned_sorted = sorted(companies_scanned)
-            
-            for company in companies_scanned_sorted:
-                if company in companies_with_jobs:
-                    html_parts.append(f"<span style='color: #27ae60; margin-right: 15px;'>✓ {company} ({len(jobs_by_company[company])} jobs)</span>")
-                else:
-                    html_parts.append(f"<span style='color: #95a5a6; margin-right: 15px;'>○ {company}</span>")
-            
-            html_parts.append("</div></details>")
-            
-            text_parts.append("\n" + "="*80 + "\n")
-            text_parts.append(f"Companies Scanned ({len(companies_scanned)} total):\n")
-            for company in companies_scanned_sorted:
-                if company in companies_with_jobs:
-                    text_parts.append(f"  ✓ {company} ({len(jobs_by_company[company])} jobs)\n")
-                else:
-                    text_parts.append(f"  ○ {company}\n")
-        
-        html_parts.append("<p style='color: #95a5a6; font-size: 12px; margin-top: 20px;'>Automated notification from Job Tracker</p>")
-        html_parts.append("</body></html>")
-        
-        # Create message
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = subject
-        msg["From"] = self.smtp_from or self.smtp_user
-        msg["To"] = self.smtp_to or self.smtp_user
-        
-        msg.attach(MIMEText("\n".join(text_parts), "plain"))
-        msg.attach(MIMEText("".join(html_parts), "html"))
-        
-        try:
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_user, self.smtp_pass)
-                server.send_message(msg)
-            
-            logger.info(f"Sent consolidated email with {total} jobs")
-            return True
-        
-        except Exception as e:
-            logger.error(f"Failed to send consolidated email: {e}")
-            return False
+        msg = build_email_digest(jobs, companies_scanned, new_count, updated_count)
+        return self._deliver(msg, f"consolidated email with {len(jobs)} jobs")
     
     def send(self, job: Job, alert_type: str = "new") -> bool:
         """Send notification via email.
@@ -315,60 +355,183 @@ class EmailNotifier(BaseNotifier):
         Args:
             job: Job to notify about
             alert_type: Type of alert
-            
+        
         Returns:
             True if sent successfully
         """
-        if not all([self.smtp_server, self.smtp_user, self.smtp_pass]):
-            logger.error("Cannot send email: SMTP settings not configured")
-            return False
-        
         message = self._format_message(job, alert_type)
         
-        # Create email
+        # HTML body: **bold** markers of the plain text become <b>...</b>
+        lines = []
+        for line in escape(message["body"]).split("\n"):
+            if line.startswith("**"):
+                label, _, value = line[2:].partition("**")
+                line = f"<b>{label}</b>{value}"
+            lines.append(line)
+        html_body = _EMAIL_JOB_HTML.substitute(title=escape(message["title"]), body="<br/>".join(lines))
+        
         msg = MIMEMultipart("alternative")
         msg["Subject"] = message["title"]
-        msg["From"] = self.smtp_from or self.smtp_user
-        msg["To"] = self.smtp_to or self.smtp_user
-        
-        # Plain text body
-        text_body = message["body"]
-        
-        # HTML body - format the message body first
-        formatted_body = message["body"].replace("**", "<b>").replace("\n", "<br/>")
-        
-        html_body = f"""
-        <html>
-        <body>
-            <h2>{message["title"]}</h2>
-            <div style="font-family: Arial, sans-serif;">
-                {formatted_body}
-            </div>
-            <hr/>
-            <p style="color: #666; font-size: 12px;">
-                Automated notification from Job Tracker
-            </p>
-        </body>
-        </html>
-        """
-        
-        msg.attach(MIMEText(text_body, "plain"))
+        msg.attach(MIMEText(message["body"], "plain"))
         msg.attach(MIMEText(html_body, "html"))
         
+        return self._deliver(msg, f"email notification for {job.company} - {job.title}")
+    
+    def _deliver(self, msg: MIMEBase, description: str) -> bool:
+        """Address and send a message through the session."""
+        if self.session is None or not self.smtp_to:
+            logger.error("Cannot send email: SMTP settings not configured")
+            return False
+        
+        msg["From"] = self.smtp_from or self.smtp_to
+        msg["To"] = self.smtp_to
+        
         try:
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_user, self.smtp_pass)
-                server.send_message(msg)
-            
-            logger.info(f"Sent email notification for {job.company} - {job.title}")
+            self.session.send(msg)
+            logger.info(f"Sent {description}")
             return True
         
         except Exception as e:
-            logger.error(f"Failed to send email notification: {e}")
+            logger.error(f"Failed to send {description}: {e}")
             return False
 
 
+def build_email_digest(
+    jobs: list[Any],
+    companies_scanned: list[str] | None = None,
+    new_count: int = 0,
+    updated_count: int = 0,
+    max_html_bytes: int = EMAIL_HTML_MAX_BYTES,
+) -> MIMEBase:
+    """Render the digest email of a batch of jobs (without From/To).
+    
+    The HTML table lists jobs until it would pass max_html_bytes; the text
+    part lists the same jobs. If some did not fit, the message also carries
+    every job as a CSV attachment.
+    
+    Args:
+        jobs: Jobs (ORM objects or result rows)
+        companies_scanned: Companies the run scanned
+        new_count: Number of new jobs
+        updated_count: Number of updated jobs
+        max_html_bytes: Size budget of the HTML part
+    
+    Returns:
+        multipart/alternative message, or multipart/mixed with the CSV
+    """
+    total = len(jobs)
+    subject = f"🎯 {new_count} New + {updated_count} Updated Jobs ({total} total)"
+    companies_scanned = sorted(companies_scanned or [])
+    
+    jobs_by_company = Counter(job.company for job in jobs)
+    companies_html = ""
+    if companies_scanned:
+        items = "".join(
+            _EMAIL_COMPANY_HIT_HTML.substitute(company=escape(company), count=jobs_by_company[company])
+            if company in jobs_by_company
+            else _EMAIL_COMPANY_MISS_HTML.substitute(company=escape(company))
+            for company in companies_scanned
+        )
+        companies_html = _EMAIL_COMPANIES_HTML.substitute(count=len(companies_scanned), items=items)
+    
+    frame = {
+        "subject": escape(subject),
+        "new_count": new_count,
+        "updated_count": updated_count,
+        "scanned": _EMAIL_SCANNED_HTML.substitute(count=len(companies_scanned)) if companies_scanned else "",
+        "companies": companies_html,
+    }
+    truncated_html = _EMAIL_TRUNCATED_HTML.substitute(shown=total, total=total, filename=EMAIL_CSV_FILENAME)
+    budget = max_html_bytes - len(
+        _EMAIL_DIGEST_HTML.substitute(frame, rows="", truncated=truncated_html).encode()
+    )
+    
+    rows = []
+    for idx, job in enumerate(jobs, 1):
+        row = _EMAIL_ROW_HTML.substitute(
+            background="#f8f9fa" if idx % 2 == 0 else "#ffffff",
+            company=escape(job.company),
+            title=escape(job.title),
+            location=escape(job.location or "N/A"),
+            category=escape((job.category or "Other").replace("_", " ").title()),
+            url=escape(job.url or ""),
+        )
+        budget -= len(row.encode())
+        if budget < 0:
+            break
+        rows.append(row)
+    
+    shown = len(rows)
+    truncated = shown < total
+    html_body = _EMAIL_DIGEST_HTML.substitute(
+        frame,
+        rows="".join(rows),
+        truncated=_EMAIL_TRUNCATED_HTML.substitute(shown=shown, total=total, filename=EMAIL_CSV_FILENAME)
+        if truncated else "",
+    )
+    
+    text_parts = [
+        f"{subject}\n",
+        f"📊 {new_count} new + {updated_count} updated jobs\n",
+    ]
+    if companies_scanned:
+        text_parts.append(f"✅ Scanned {len(companies_scanned)} companies total\n")
+    if truncated:
+        text_parts.append(f"Showing the first {shown} of {total} jobs; the full list is attached as {EMAIL_CSV_FILENAME}.\n")
+    text_parts.append("=" * 100 + "\n")
+    text_parts.append(f"{'Company':<25} {'Title':<35} {'Location':<20}\n")
+    text_parts.append("=" * 100 + "\n")
+    for job in jobs[:shown]:
+        text_parts.append(_EMAIL_ROW_TEXT.substitute(
+            company=f"{job.company:<25}",
+            title=f"{job.title[:33]:<35}",
+            location=f"{(job.location or 'N/A')[:18]:<20}",
+            url=job.url,
+        ))
+    if companies_scanned:
+        text_parts.append("\n" + "=" * 80 + "\n")
+        text_parts.append(f"Companies Scanned ({len(companies_scanned)} total):\n")
+        for company in companies_scanned:
+            if company in jobs_by_company:
+                text_parts.append(f"  ✓ {company} ({jobs_by_company[company]} jobs)\n")
+            else:
+                text_parts.append(f"  ○ {company}\n")
+    
+    body = MIMEMultipart("alternative")
+    body.attach(MIMEText("\n".join(text_parts), "plain"))
+    body.attach(MIMEText(html_body, "html"))
+    
+    if truncated:
+        msg = MIMEMultipart("mixed")
+        msg.attach(body)
+        attachment = MIMEText(_jobs_csv(jobs), "csv", "utf-8")
+        attachment.add_header("Content-Disposition", "attachment", filename=EMAIL_CSV_FILENAME)
+        msg.attach(attachment)
+    else:
+        msg = body
+    
+    msg["Subject"] = subject
+    return msg
+
+
+def _jobs_csv(jobs: list[Any]) -> str:
+    """Render jobs as CSV (EMAIL_CSV_COLUMNS)."""
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(EMAIL_CSV_COLUMNS)
+    for job in jobs:
+        writer.writerow([
+            job.company,
+            job.title,
+            job.location or "",
+            job.category or "",
+            job.source or "",
+            job.posted_at.strftime("%Y-%m-%d") if job.posted_at else "",
+            job.url,
+        ])
+    return out.getvalue()
+
+
 class NotificationManager:
     """Manage notifications across multiple channels."""
     
@@ -390,37 +553,6 @@ class NotificationManager:
         
         logger.info(f"Initialized notifiers: {list(self.notifiers.keys())}")
     
-    def notify_batch(self, jobs: list[Job], companies_scanned: list[str] = None, new_count: int = 0, updated_count: int = 0) -> None:
-        """Send consolidated notification for multiple jobs.
-        
-        Args:
-            jobs: List of jobs to notify about
-            companies_scanned: List of all companies that were scanned
-            new_count: Number of new jobs
-            updated_count: Number of updated jobs
-        """
-        if not jobs:
-            return
-        
-        # Send batch email if email notifier is configured
-        email_notifier = self.notifiers.get("email")
-        if email_notifier and hasattr(email_notifier, 'send_batch'):
-            success = email_notifier.send_batch(jobs, companies_scanned=companies_scanned, new_count=new_count, updated_count=updated_count)
-            
-            # Record alerts for all jobs (safely handle session issues)
-            try:
-                for job in jobs:
-                    self._record_alert(
-                        job_id=job.id,
-                        alert_type="new",
-                        channel="email",
-                        status="sent" if success else "failed",
-                    )
-            except Exception as e:
-                logger.warning(f"Failed to record alerts (non-critical): {e}")
-        
-        logger.info(f"Sent batch notification for {len(jobs)} jobs")
-    
     def notify(self, job: Job, alert_type: str = "new", channels: list[str] | None = None) -> None:
         """Send notifications for a job.
         
@@ -429,80 +561,101 @@ class NotificationManager:
             alert_type: Type of alert ('new' or 'updated')
             channels: Specific channels to use (None = all)
         """
-        # Check cooldown to avoid duplicate notifications
-        if not self._check_cooldown(job, channels or list(self.notifiers.keys())):
-            logger.debug(f"Skipping notification for {job.id} due to cooldown")
-            return
-        
-        # Determine which channels to use
-        target_channels = channels or list(self.notifiers.keys())
+        self.notify_many([job], alert_type=alert_type, channels=channels)
+    
+    def notify_many(self, jobs: list[Job], alert_type: str = "new", channels: list[str] | None = None) -> int:
+        """Send notifications for many jobs with constant-round-trip bookkeeping.
         
-        for channel in target_channels:
-            notifier = self.notifiers.get(channel)
-            
-            if not notifier:
-                logger.warning(f"Notifier not configured: {channel}")
-                continue
-            
-            # Send notification
-            success = notifier.send(job, alert_type)
-            
-            # Record alert
-            self._record_alert(
-                job_id=job.id,
-                alert_type=alert_type,
-                channel=channel,
-                status="sent" if success else "failed",
-            )
-    
-    def _check_cooldown(self, job: Job, channels: list[str], cooldown_hours: int = 24) -> bool:
-        """Check if notification cooldown has passed.
+        Cooldowns for the whole job set are resolved with one query and every
+        alert row is recorded with one INSERT (the caller commits).
         
         Args:
-            job: Job to check
-            channels: Channels to check
-            cooldown_hours: Cooldown period in hours
-            
+            jobs: Jobs to notify about
+            alert_type: Type of alert ('new' or 'updated')
+            channels: Specific channels to use (None = all)
+        
         Returns:
-            True if cooldown has passed
+            Number of notifications attempted
         """
-        cutoff = datetime.utcnow() - timedelta(hours=cooldown_hours)
+        # Determine which channels to use
+        target_channels = []
+        for channel in channels or list(self.notifiers.keys()):
+            if channel in self.notifiers:
+                target_channels.append(channel)
+            else:
+                logger.warning(f"Notifier not configured: {channel}")
         
-        # Check if any alert was sent recently
-        recent_alert = self.db.query(Alert).filter(
-            Alert.job_id == job.id,
-            Alert.sent_via.in_(channels),
-            Alert.sent_at >= cutoff,
-            Alert.status == "sent",
-        ).first()
-        
-        return recent_alert is None
-    
-    def _record_alert(
-        self,
-        job_id: str,
-        alert_type: str,
-        channel: str,
-        status: str,
-        error_message: str | None = None,
-    ) -> None:
-        """Record an alert in the database.
+        if not jobs or not target_channels:
+            return 0
+        
+        # Check cooldown to avoid duplicate notifications
+        blocked = recently_alerted(self.db, [job.id for job in jobs], target_channels)
+        
+        records = []
+        for job in jobs:
+            for channel in target_channels:
+                if (job.id, channel) in blocked:
+                    logger.debug(f"Skipping {channel} notification for {job.id} due to cooldown")
+                    continue
+                
+                # Send notification
+                success = self.notifiers[channel].send(job, alert_type)
+                records.append({
+                    "job_id": job.id,
+                    "alert_type": alert_type,
+                    "sent_via": channel,
+                    "status": "sent" if success else "failed",
+                })
+        
+        self._record_alerts(records)
+        return len(records)
+    
+    def _record_alerts(self, records: list[dict[str, Any]]) -> None:
+        """Record alerts in the database with a single INSERT.
+        
+        Don't commit here - let the caller handle it.
         
         Args:
-            job_id: Job ID
-            alert_type: Alert type
-            channel: Notification channel
-            status: Alert status
-            error_message: Error message if failed
+            records: Alert column values (job_id, alert_type, sent_via, status, ...)
         """
-        alert = Alert(
-            job_id=job_id,
-            alert_type=alert_type,
-            sent_via=channel,
-            status=status,
-            error_message=error_message,
+        if records:
+            self.db.execute(insert(Alert), [{"id": uuid.uuid4(), **record} for record in records])
+
+
+def recently_alerted(
+    db: Session,
+    job_ids: list,
+    channels: list[str],
+    cooldown_hours: int = ALERT_COOLDOWN_HOURS,
+) -> set[tuple[Any, str]]:
+    """Find which (job, channel) pairs are still in cooldown, in one query.
+    
+    A pair is in cooldown if an alert was sent within the cooldown period or
+    one is still pending delivery.
+    
+    Args:
+        db: Database session
+        job_ids: Jobs to check
+        channels: Channels to check
+        cooldown_hours: Cooldown period in hours
+    
+    Returns:
+        Set of (job_id, channel) pairs to skip
+    """
+    if not job_ids or not channels:
+        return set()
+    
+    cutoff = datetime.utcnow() - timedelta(hours=cooldown_hours)
+    rows = db.execute(
+        select(Alert.job_id, Alert.sent_via)
+        .where(
+            Alert.job_id.in_(job_ids),
+            Alert.sent_via.in_(channels),
+            or_(
+                Alert.status == "pending",
+                and_(Alert.status == "sent", Alert.sent_at >= cutoff),
+            ),
         )
-        
-        self.db.add(alert)
-        # Don't commit here - let the caller handle it
-        # self.db.commit()
+        .distinct()
+    )
+    return {(row.job_id, row.sent_via) for row in rows}
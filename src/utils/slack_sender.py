@@ -0,0 +1,159 @@
+"""Paced Slack webhook sender.
+
+Slack throttles incoming webhooks to about one message per second and
+answers 429 with a Retry-After header when a client goes faster. Messages
+are queued and posted by one worker thread per webhook, which keeps the
+pace and pauses the whole queue on Retry-After, so callers never sleep and
+the delivery time of a batch is predictable (messages x interval).
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable
+
+import requests
+
+from src.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Slack allows roughly one webhook message per second
+SLACK_MIN_INTERVAL = 1.0
+
+# Delay before retrying a network error or 5xx (doubles per attempt)
+SLACK_RETRY_BASE = 2.0
+
+
+class PacedWebhookSender:
+    """Queue of webhook posts delivered at a steady pace by one worker thread."""
+    
+    def __init__(
+        self,
+        url: str,
+        min_interval: float = SLACK_MIN_INTERVAL,
+        max_attempts: int = 5,
+        timeout: float = 10,
+        post: Callable[..., requests.Response] = requests.post,
+    ):
+        """Initialize sender.
+        
+        Args:
+            url: Webhook URL
+            min_interval: Minimum seconds between posts
+            max_attempts: Attempts per message (429s and 5xx are retried)
+            timeout: HTTP timeout in seconds
+            post: HTTP POST function (requests.post)
+        """
+        self.url = url
+        self.min_interval = min_interval
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+        self._post = post
+        self._queue: queue.Queue = queue.Queue()
+        self._next_send = 0.0
+        self._worker: threading.Thread | None = None
+        self._lock = threading.Lock()
+    
+    def submit(self, payload: dict[str, Any]) -> Future:
+        """Queue a message.
+        
+        Args:
+            payload: Webhook JSON payload
+        
+        Returns:
+            Future resolving to True once posted, False if it gave up
+        """
+        future = Future()
+        self._queue.put((payload, future))
+        self._ensure_worker()
+        return future
+    
+    def send_all(self, payloads: list[dict[str, Any]]) -> bool:
+        """Queue messages and wait until all of them are delivered or given up.
+        
+        Returns:
+            True if every message was posted
+        """
+        futures = [self.submit(payload) for payload in payloads]
+        return all(future.result() for future in futures)
+    
+    @property
+    def pending(self) -> int:
+        """Messages waiting in the queue."""
+        return self._queue.qsize()
+    
+    def _ensure_worker(self):
+        """Start the worker thread if it is not running."""
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="slack-sender", daemon=True)
+                self._worker.start()
+    
+    def _run(self):
+        """Post queued messages forever."""
+        while True:
+            payload, future = self._queue.get()
+            try:
+                future.set_result(self._deliver(payload))
+            except Exception as e:
+                logger.error(f"Slack sender failed: {e}")
+                future.set_result(False)
+    
+    def _deliver(self, payload: dict[str, Any]) -> bool:
+        """Post one message, pacing and retrying on this worker thread."""
+        for attempt in range(1, self.max_attempts + 1):
+            wait = self._next_send - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            
+            try:
+                response = self._post(self.url, json=payload, timeout=self.timeout)
+            except requests.RequestException as e:
+                logger.warning(f"Slack webhook error (attempt {attempt}): {e}")
+                self._next_send = time.monotonic() + SLACK_RETRY_BASE * 2 ** (attempt - 1)
+                continue
+            
+            self._next_send = time.monotonic() + self.min_interval
+            
+            if response.status_code == 429:
+                # Pause the whole queue, not just this message
+                retry_after = _retry_after(response)
+                logger.warning(f"Slack rate limited; pausing {retry_after:.0f}s")
+                self._next_send = time.monotonic() + retry_after
+                continue
+            
+            if response.status_code >= 500:
+                logger.warning(f"Slack webhook returned {response.status_code} (attempt {attempt})")
+                self._next_send = time.monotonic() + SLACK_RETRY_BASE * 2 ** (attempt - 1)
+                continue
+            
+            if response.status_code >= 400:
+                logger.error(f"Slack webhook rejected message: {response.status_code} {response.text[:200]}")
+                return False
+            
+            return True
+        
+        logger.error(f"Giving up on Slack message after {self.max_attempts} attempts")
+        return False
+
+
+def _retry_after(response: requests.Response) -> float:
+    """Seconds to wait from a 429's Retry-After header (default: one interval)."""
+    try:
+        return max(float(response.headers.get("Retry-After", SLACK_MIN_INTERVAL)), 0.0)
+    except ValueError:
+        return SLACK_MIN_INTERVAL
+
+
+_senders: dict[str, PacedWebhookSender] = {}
+_senders_lock = threading.Lock()
+
+
+def get_slack_sender(url: str) -> PacedWebhookSender:
+    """Process-wide sender for a webhook, so every caller shares its pace."""
+    with _senders_lock:
+        if url not in _senders:
+            _senders[url] = PacedWebhookSender(url)
+        return _senders[url]
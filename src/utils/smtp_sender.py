@@ -0,0 +1,139 @@
+"""Persistent SMTP session shared by email sends.
+
+Opening an SMTP connection costs a TCP connect, the STARTTLS handshake and
+a login, often longer than sending the message itself. A session keeps one
+connection open across messages and transparently reconnects when the
+server drops it (idle timeouts, restarts), so a delivery worker sending
+many digests pays the handshake once.
+"""
+
+import smtplib
+import threading
+from email.message import Message
+from typing import Callable
+
+from src.core.config import get_settings
+from src.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Errors after which the connection is reopened and the message sent again.
+# Refused recipients or data are not retried: the server answered.
+RECONNECT_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)
+
+
+class SmtpSession:
+    """One reusable SMTP connection, opened on first send."""
+    
+    def __init__(
+        self,
+        host: str,
+        port: int = 587,
+        user: str | None = None,
+        password: str | None = None,
+        starttls: bool = True,
+        timeout: float = 30,
+        smtp_factory: Callable[..., smtplib.SMTP] = smtplib.SMTP,
+    ):
+        """Initialize session.
+        
+        Args:
+            host: SMTP server
+            port: SMTP port
+            user: Login user (no login if None)
+            password: Login password
+            starttls: Upgrade the connection with STARTTLS before login
+            timeout: Socket timeout in seconds
+            smtp_factory: SMTP client class (smtplib.SMTP)
+        """
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self._smtp_factory = smtp_factory
+        self._smtp: smtplib.SMTP | None = None
+        self._lock = threading.Lock()
+        self.connects = 0
+    
+    def __enter__(self) -> "SmtpSession":
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def send(self, msg: Message):
+        """Send a message, reconnecting once if the connection was dropped.
+        
+        Args:
+            msg: Message with From and To headers
+        
+        Raises:
+            smtplib.SMTPException: If the server rejects the message
+        """
+        with self._lock:
+            for attempt in (1, 2):
+                try:
+                    self._connection().send_message(msg)
+                    return
+                except RECONNECT_ERRORS as e:
+                    self._discard()
+                    if attempt == 2:
+                        raise
+                    logger.info(f"SMTP connection lost ({e}), reconnecting")
+    
+    def close(self):
+        """Close the connection (the next send opens a new one)."""
+        with self._lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except (smtplib.SMTPException, OSError):
+                    pass
+                self._smtp = None
+    
+    def _connection(self) -> smtplib.SMTP:
+        """Open the connection if needed."""
+        if self._smtp is None:
+            smtp = self._smtp_factory(self.host, self.port, timeout=self.timeout)
+            try:
+                if self.starttls:
+                    smtp.starttls()
+                if self.user:
+                    smtp.login(self.user, self.password or "")
+            except Exception:
+                smtp.close()
+                raise
+            self._smtp = smtp
+            self.connects += 1
+        return self._smtp
+    
+    def _discard(self):
+        """Forget a broken connection without talking to the server."""
+        if self._smtp is not None:
+            try:
+                self._smtp.close()
+            except OSError:
+                pass
+            self._smtp = None
+
+
+_sessions: dict[tuple, SmtpSession] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_smtp_session() -> SmtpSession:
+    """Process-wide session for the configured SMTP server."""
+    settings = get_settings()
+    key = (settings.smtp_server, settings.smtp_port, settings.smtp_user, settings.smtp_starttls)
+    with _sessions_lock:
+        if key not in _sessions:
+            _sessions[key] = SmtpSession(
+                settings.smtp_server,
+                settings.smtp_port,
+                user=settings.smtp_user,
+                password=settings.smtp_pass,
+                starttls=settings.smtp_starttls,
+            )
+        return _sessions[key]
@@ -0,0 +1,172 @@
+"""Local debugging SMTP server that keeps messages instead of delivering them.
+
+Useful to preview digests, in tests and to benchmark sending without a
+real mail server. It speaks just enough SMTP for smtplib (EHLO, AUTH PLAIN
+and LOGIN accepting any credentials, MAIL, RCPT, DATA) and has no TLS, so
+point the settings at it with smtp_starttls off:
+
+    python -m src.utils.smtp_sink --port 1025
+    SMTP_SERVER=localhost SMTP_PORT=1025 SMTP_STARTTLS=false python job_tracker_cli.py
+"""
+
+import socketserver
+import threading
+from email import message_from_bytes, policy
+from email.message import EmailMessage
+from typing import Callable
+
+
+class SmtpSink:
+    """SMTP server on a background thread collecting received messages."""
+    
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        on_message: Callable[[EmailMessage], None] | None = None,
+    ):
+        """Initialize sink (call start() or use it as a context manager).
+        
+        Args:
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port, see self.port)
+            on_message: Called with every received message
+        """
+        self.messages: list[EmailMessage] = []
+        self.connections = 0
+        self.on_message = on_message
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), _SmtpHandler)
+        self._server.sink = self
+        self._thread: threading.Thread | None = None
+    
+    @property
+    def host(self) -> str:
+        return self._server.server_address[0]
+    
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+    
+    def __enter__(self) -> "SmtpSink":
+        self.start()
+        return self
+    
+    def __exit__(self, *exc):
+        self.stop()
+    
+    def start(self):
+        """Serve on a daemon thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="smtp-sink", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop serving and close the listening socket."""
+        self._server.shutdown()
+        self._server.server_close()
+    
+    def _connected(self):
+        with self._lock:
+            self.connections += 1
+    
+    def _received(self, data: bytes):
+        message = message_from_bytes(data, policy=policy.default)
+        with self._lock:
+            self.messages.append(message)
+        if self.on_message:
+            self.on_message(message)
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+    sink: SmtpSink
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    """One SMTP conversation."""
+    
+    def handle(self):
+        sink = self.server.sink
+        sink._connected()
+        self._reply("220 smtp-sink ready")
+        
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command, _, argument = line.decode("utf-8", "replace").strip().partition(" ")
+            command = command.upper()
+            
+            if command == "EHLO":
+                self._reply("250-smtp-sink", "250-8BITMIME", "250-AUTH PLAIN LOGIN", "250 SMTPUTF8")
+            elif command == "HELO":
+                self._reply("250 smtp-sink")
+            elif command == "AUTH":
+                self._authenticate(argument)
+            elif command in ("MAIL", "RCPT", "RSET", "NOOP"):
+                self._reply("250 OK")
+            elif command == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                sink._received(self._read_data())
+                self._reply("250 OK: queued")
+            elif command == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+    
+    def _authenticate(self, argument: str):
+        """Accept any credentials."""
+        mechanism, _, initial = argument.partition(" ")
+        if mechanism.upper() == "LOGIN":
+            # Username and password prompts (base64 "Username:" / "Password:")
+            for prompt in ("VXNlcm5hbWU6", "UGFzc3dvcmQ6"):
+                if initial and prompt == "VXNlcm5hbWU6":
+                    continue
+                self._reply(f"334 {prompt}")
+                self.rfile.readline()
+        elif not initial:
+            self._reply("334 ")
+            self.rfile.readline()
+        self._reply("235 Authentication successful")
+    
+    def _read_data(self) -> bytes:
+        """Read a DATA body up to the lone dot, undoing dot-stuffing."""
+        lines = []
+        while True:
+            line = self.rfile.readline()
+            if not line or line in (b".\r\n", b".\n"):
+                return b"".join(lines)
+            if line.startswith(b".."):
+                line = line[1:]
+            lines.append(line)
+    
+    def _reply(self, *lines: str):
+        self.wfile.write("".join(f"{line}\r\n" for line in lines).encode())
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Run a local SMTP sink that prints received emails")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=1025, help="Port to listen on")
+    parser.add_argument("--body", action="store_true", help="Also print the plain text body")
+    args = parser.parse_args()
+    
+    def show(message: EmailMessage):
+        attachments = [part.get_filename() for part in message.iter_attachments()]
+        print(f"📨 {message['To']}: {message['Subject']} ({len(message.as_bytes())} bytes, attachments: {attachments or 'none'})")
+        if args.body:
+            body = message.get_body(preferencelist=("plain",))
+            print(body.get_content() if body else "(no plain text body)")
+    
+    sink = SmtpSink(args.host, args.port, on_message=show)
+    print(f"SMTP sink listening on {sink.host}:{sink.port} (Ctrl+C to stop)")
+    try:
+        sink._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sink._server.server_close()
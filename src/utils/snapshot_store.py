@@ -0,0 +1,337 @@
+"""Columnar Parquet snapshots of jobs and job versions for offline analysis.
+
+Snapshots are hive-partitioned by country and date:
+
+    <snapshot_dir>/jobs/country=us/date=2026-10-18/part-0.parquet
+    <snapshot_dir>/job_versions/country=us/date=2026-10-18/part-0.parquet
+
+Each day's jobs partition lists every job seen by the end of that day, in
+the state it had when the snapshot was taken (the nightly task runs just
+after midnight); job_versions holds the versions captured during the day.
+Historical analysis reads these files (see read_snapshot) instead of the
+live tables. Requires the optional pyarrow dependency.
+
+The jobs partition is built from the current rows, so it is only accurate
+for the day that just ended. Older days can be backfilled for job_versions
+only (write_snapshot and python -m src.utils.snapshot_store --days N
+skip their jobs partitions); a missed jobs snapshot cannot be recreated
+later.
+"""
+
+import itertools
+import json
+import shutil
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+from sqlalchemy import func, select
+
+from src.core.batch import stream_batches
+from src.core.config import get_settings
+from src.core.models import Job, JobVersion
+from src.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Rows fetched per round trip from the server-side cursor (and per row group)
+SNAPSHOT_BATCH_SIZE = 10000
+
+JOBS_DATASET = "jobs"
+VERSIONS_DATASET = "job_versions"
+
+# Partition value for jobs without a country
+UNKNOWN_COUNTRY = "unknown"
+
+# (field, arrow type name) of each dataset; the country partition is not stored in the files
+JOB_FIELDS = (
+    ("id", "string"),
+    ("company", "string"),
+    ("title", "string"),
+    ("location", "string"),
+    ("category", "string"),
+    ("employment_type", "string"),
+    ("tags", "list<string>"),
+    ("source", "string"),
+    ("visa_sponsorship", "bool"),
+    ("compensation_min", "int32"),
+    ("compensation_max", "int32"),
+    ("posted_at", "timestamp"),
+    ("first_seen_at", "timestamp"),
+    ("last_seen_at", "timestamp"),
+    ("is_active", "bool"),
+)
+
+VERSION_FIELDS = (
+    ("id", "string"),
+    ("job_id", "string"),
+    ("company", "string"),
+    ("title", "string"),
+    ("hash_full", "string"),
+    ("captured_at", "timestamp"),
+    ("diff_json", "string"),
+)
+
+
+def write_snapshot(
+    day: date | None = None,
+    root: str | Path | None = None,
+    datasets: tuple[str, ...] | None = None,
+) -> dict[str, int]:
+    """Write the jobs and job_versions snapshots for a day.
+    
+    Re-running for the same day replaces that day's partitions.
+    
+    Args:
+        day: Day to snapshot (defaults to yesterday, UTC)
+        root: Snapshot directory (defaults to settings.snapshot_dir)
+        datasets: Datasets to write (None for both, or job_versions only
+            for days before yesterday)
+    
+    Returns:
+        Rows written per dataset
+    
+    Raises:
+        ValueError: If the jobs dataset is requested for a day before
+            yesterday (see jobs_snapshot_available)
+    """
+    day = day or datetime.now(timezone.utc).date() - timedelta(days=1)
+    if datasets is None:
+        datasets = (JOBS_DATASET, VERSIONS_DATASET) if jobs_snapshot_available(day) else (VERSIONS_DATASET,)
+        if JOBS_DATASET not in datasets:
+            logger.warning(f"Skipping the {JOBS_DATASET} snapshot for {day}: current rows do not show past days")
+    elif JOBS_DATASET in datasets and not jobs_snapshot_available(day):
+        raise ValueError(
+            f"Cannot snapshot jobs for {day}: rows only hold their current state, "
+            f"backfill {VERSIONS_DATASET} only"
+        )
+    root = Path(root or get_settings().snapshot_dir)
+    start = datetime.combine(day, datetime.min.time(), tzinfo=timezone.utc)
+    end = start + timedelta(days=1)
+    
+    country = func.coalesce(Job.country, UNKNOWN_COUNTRY).label("country")
+    
+    # Jobs first seen by the end of the day; the row is their current state
+    jobs_stmt = (
+        select(country, *(getattr(Job, name) for name, _ in JOB_FIELDS))
+        .where(Job.first_seen_at < end)
+        .order_by(country, Job.id)
+    )
+    versions_stmt = (
+        select(
+            country,
+            JobVersion.id,
+            JobVersion.job_id,
+            Job.company,
+            Job.title,
+            JobVersion.hash_full,
+            JobVersion.captured_at,
+            JobVersion.diff_json,
+        )
+        .join(Job, Job.id == JobVersion.job_id)
+        .where(JobVersion.captured_at >= start, JobVersion.captured_at < end)
+        .order_by(country, JobVersion.captured_at)
+    )
+    
+    counts = {}
+    if JOBS_DATASET in datasets:
+        counts[JOBS_DATASET] = write_partitions(
+            root, JOBS_DATASET, day, JOB_FIELDS, stream_batches(jobs_stmt, SNAPSHOT_BATCH_SIZE)
+        )
+    if VERSIONS_DATASET in datasets:
+        counts[VERSIONS_DATASET] = write_partitions(
+            root, VERSIONS_DATASET, day, VERSION_FIELDS, stream_batches(versions_stmt, SNAPSHOT_BATCH_SIZE)
+        )
+    logger.info(f"✅ Parquet snapshot for {day}: {counts}")
+    return counts
+
+
+def jobs_snapshot_available(day: date) -> bool:
+    """Check whether the current job rows still describe the end of a day.
+    
+    Only true for yesterday (UTC) or later: the snapshot of an older day
+    would carry changes made since.
+    """
+    return day >= datetime.now(timezone.utc).date() - timedelta(days=1)
+
+
+def write_partitions(
+    root: Path,
+    dataset: str,
+    day: date,
+    fields: tuple,
+    batches: Iterable[list[Any]],
+) -> int:
+    """Write rows (country first, ordered by country) as one partition per country.
+    
+    Files are written next to their final name and renamed into place, so
+    readers never see a half-written partition.
+    
+    Args:
+        root: Snapshot directory
+        dataset: Dataset name
+        day: Date partition value
+        fields: (field, type) pairs of the remaining row values
+        batches: Lists of result rows
+    
+    Returns:
+        Rows written
+    """
+    import pyarrow.parquet as pq
+    
+    schema = _arrow_schema(fields)
+    stale = set((root / dataset).glob(f"country=*/date={day.isoformat()}"))
+    rows = 0
+    writer = None
+    current = None
+    
+    def finish():
+        writer.close()
+        tmp_path.replace(tmp_path.with_name("part-0.parquet"))
+    
+    try:
+        for batch in batches:
+            for country, group in itertools.groupby(batch, key=lambda row: row[0]):
+                if country != current:
+                    if writer:
+                        finish()
+                    directory = root / dataset / f"country={country}" / f"date={day.isoformat()}"
+                    directory.mkdir(parents=True, exist_ok=True)
+                    stale.discard(directory)
+                    # Leading underscore: dataset readers skip the file until it is renamed
+                    tmp_path = directory / "_part-0.parquet.tmp"
+                    writer = pq.ParquetWriter(tmp_path, schema, compression="zstd")
+                    current = country
+                
+                group = [row[1:] for row in group]
+                writer.write_table(_to_table(group, fields, schema))
+                rows += len(group)
+        
+        if writer:
+            finish()
+            writer = None
+    finally:
+        if writer:
+            writer.close()
+            tmp_path.unlink(missing_ok=True)
+    
+    # Countries with no rows this time (e.g. re-run after a cleanup)
+    for directory in stale:
+        shutil.rmtree(directory)
+    
+    return rows
+
+
+def read_snapshot(
+    dataset: str = JOBS_DATASET,
+    columns: list[str] | None = None,
+    country: str | None = None,
+    start: date | None = None,
+    end: date | None = None,
+    root: str | Path | None = None,
+):
+    """Read snapshot rows into a pyarrow Table.
+    
+    Partition pruning means only the matching country/date files are opened.
+    The jobs dataset holds one row per job per day, so pass start == end for
+    a point-in-time view.
+    
+    Example:
+        lifetimes = read_snapshot(start=day, end=day, columns=["company", "first_seen_at", "last_seen_at"])
+        df = lifetimes.to_pandas()
+    
+    Args:
+        dataset: jobs or job_versions
+        columns: Columns to read (None for all, including country and date)
+        country: Only this country
+        start: First date (inclusive)
+        end: Last date (inclusive)
+        root: Snapshot directory (defaults to settings.snapshot_dir)
+    
+    Returns:
+        pyarrow.Table
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    
+    path = Path(root or get_settings().snapshot_dir) / dataset
+    fields = JOB_FIELDS if dataset == JOBS_DATASET else VERSION_FIELDS
+    partitioning = ds.partitioning(
+        pa.schema([("country", pa.string()), ("date", pa.date32())]), flavor="hive"
+    )
+    schema = pa.unify_schemas([_arrow_schema(fields), partitioning.schema])
+    
+    if not path.exists():
+        table = schema.empty_table()
+        return table.select(columns) if columns else table
+    
+    data = ds.dataset(path, format="parquet", partitioning=partitioning, schema=schema)
+    
+    conditions = []
+    if country:
+        conditions.append(ds.field("country") == country)
+    if start:
+        conditions.append(ds.field("date") >= start)
+    if end:
+        conditions.append(ds.field("date") <= end)
+    
+    condition = None
+    for clause in conditions:
+        condition = clause if condition is None else condition & clause
+    
+    return data.to_table(columns=columns, filter=condition)
+
+
+def snapshot_dates(dataset: str = JOBS_DATASET, root: str | Path | None = None) -> list[date]:
+    """List the dates with a snapshot, oldest first."""
+    path = Path(root or get_settings().snapshot_dir) / dataset
+    dates = {
+        date.fromisoformat(directory.name.split("=", 1)[1])
+        for directory in path.glob("country=*/date=*")
+    }
+    return sorted(dates)
+
+
+def _arrow_schema(fields: tuple):
+    """Build the pyarrow schema for (field, type) pairs."""
+    import pyarrow as pa
+    
+    types = {
+        "string": pa.string(),
+        "list<string>": pa.list_(pa.string()),
+        "bool": pa.bool_(),
+        "int32": pa.int32(),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in fields])
+
+
+def _to_table(rows: list[tuple], fields: tuple, schema):
+    """Convert result rows to a pyarrow Table (UUIDs and JSON as strings)."""
+    import pyarrow as pa
+    
+    columns = list(zip(*rows))
+    arrays = []
+    for values, (name, kind) in zip(columns, fields):
+        if name == "diff_json":
+            values = [json.dumps(value) if value is not None else None for value in values]
+        elif kind == "string":
+            values = [str(value) if value is not None else None for value in values]
+        arrays.append(pa.array(values, type=schema.field(name).type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Write Parquet snapshots of jobs and job versions")
+    parser.add_argument("--date", type=date.fromisoformat, help="Day to snapshot (default: yesterday, UTC)")
+    parser.add_argument(
+        "--days", type=int, default=1,
+        help="Number of days to write, ending at --date (days before yesterday get job_versions only)",
+    )
+    args = parser.parse_args()
+    
+    last = args.date or datetime.now(timezone.utc).date() - timedelta(days=1)
+    for offset in reversed(range(args.days)):
+        print(write_snapshot(last - timedelta(days=offset)))
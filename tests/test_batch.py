@@ -0,0 +1,28 @@
+"""Tests for the batch data-access helpers."""
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+from sqlalchemy import select
+
+from src.core import batch
+from src.core.models import Job
+
+
+def test_stream_rows_uses_server_side_cursor(monkeypatch):
+    """Test scans run with yield_per under the batch statement timeout."""
+    db = MagicMock()
+    db.execute.side_effect = [None, iter([("Stripe",), ("Datadog",)])]
+    
+    @contextmanager
+    def fake_db_context():
+        yield db
+    
+    monkeypatch.setattr(batch, "get_db_context", fake_db_context)
+    
+    rows = list(batch.stream_rows(select(Job.company), batch_size=500))
+    
+    timeout_call, scan_call = db.execute.call_args_list
+    assert timeout_call.args[1] == {"timeout": str(batch.BATCH_STATEMENT_TIMEOUT_MS)}
+    assert scan_call.args[0].get_execution_options()["yield_per"] == 500
+    assert rows == [("Stripe",), ("Datadog",)]
@@ -0,0 +1,144 @@
+"""Tests for the COPY-based bulk loader."""
+
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from psycopg.types.json import Jsonb
+
+from src.ingest import bulk_loader
+from src.ingest.bulk_loader import COPY_COLUMNS, BulkJobLoader
+from src.ingest.schemas import NormalizedJob
+from src.ingest.versioning import DESCRIPTION_FIELD, VERSIONED_FIELDS
+
+
+def _job(source_id: str, **overrides) -> NormalizedJob:
+    values = {
+        "source": "greenhouse",
+        "source_id": source_id,
+        "company": "Stripe",
+        "title": "Software Engineering Intern",
+        "location": "Seattle, WA",
+        "employment_type": "internship",
+        "posted_at": datetime(2026, 10, 1, tzinfo=timezone.utc),
+        "url": f"https://jobs.example/{source_id}",
+        "description_md": "About the role",
+        "hash_stable": "s" * 64,
+        "hash_full": "f" * 64,
+        **overrides,
+    }
+    return NormalizedJob(**values)
+
+
+def _merge_row(job_id, source_id: str, inserted: bool, changed: bool, **previous) -> dict:
+    row = {
+        "id": job_id,
+        "source": "greenhouse",
+        "source_id": source_id,
+        "inserted": inserted,
+        "changed": changed,
+        "country": "us",
+        "company": "Stripe",
+        "category": "software_engineering",
+        "first_seen_at": datetime(2026, 10, 1),
+        "old_country": None if inserted else "us",
+        "old_company": None if inserted else "Stripe",
+        "old_category": None if inserted else "software_engineering",
+        "old_is_active": None if inserted else True,
+    }
+    for col in VERSIONED_FIELDS + (DESCRIPTION_FIELD,):
+        row[f"previous_{col}"] = previous.get(col)
+    return row
+
+
+def test_copy_row_formatting():
+    """Test rows follow COPY_COLUMNS and text is passed through raw (psycopg escapes it)."""
+    now = datetime(2026, 10, 19, tzinfo=timezone.utc)
+    job = _job("1", description_md="Line one\twith tab\nLine two \\ backslash", raw_data={"k": "v"})
+    
+    row = BulkJobLoader(MagicMock())._to_row(job, "software_engineering", ["python"], now)
+    
+    assert len(row) == len(COPY_COLUMNS)
+    values = dict(zip(COPY_COLUMNS, row))
+    assert values["description_md"] == job.description_md
+    assert values["first_seen_at"] == values["last_seen_at"] == now
+    assert isinstance(values["raw_data"], Jsonb)
+    assert BulkJobLoader(MagicMock())._to_row(_job("2", raw_data={}), None, [], now)[-2] is None
+
+
+def _fake_connection(merge_rows: list[dict], statements: list) -> MagicMock:
+    """Connection whose merge returns merge_rows, recording executed statements."""
+    connection = MagicMock()
+    
+    def execute(stmt, *args):
+        statements.append((str(stmt), args))
+        result = MagicMock()
+        result.mappings.return_value = merge_rows if "WITH incoming" in str(stmt) else []
+        return result
+    
+    connection.execute.side_effect = execute
+    return connection
+
+
+def test_flush_maps_flags_to_ids_versions_and_rollup(monkeypatch):
+    """Test inserted rows are new, changed rows get a version from previous values, others are untouched."""
+    new_id, changed_id, same_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    merge_rows = [
+        _merge_row(new_id, "1", inserted=True, changed=False),
+        _merge_row(changed_id, "2", inserted=False, changed=True, title="Old Title", description_md="About"),
+        _merge_row(same_id, "3", inserted=False, changed=False),
+    ]
+    statements = []
+    connection = _fake_connection(merge_rows, statements)
+    db = MagicMock()
+    db.connection.return_value = connection
+    deltas = []
+    monkeypatch.setattr(bulk_loader, "apply_rollup_deltas", lambda conn, counter: deltas.append(dict(counter)))
+    
+    loader = BulkJobLoader(db)
+    for source_id in ("1", "2", "3"):
+        loader.add_job(_job(source_id), "software_engineering", [])
+    loader.flush()
+    
+    assert loader.get_stats() == ([new_id], [changed_id])
+    copied = connection.connection.driver_connection.cursor.return_value.__enter__.return_value
+    copy = copied.copy.return_value.__enter__.return_value
+    assert copy.write_row.call_count == 3
+    
+    version_inserts = [args for sql, args in statements if sql.startswith("INSERT INTO job_versions")]
+    assert len(version_inserts) == 1
+    (version,) = version_inserts[0][0]
+    assert version["job_id"] == changed_id
+    assert version["diff_json"]["title"] == {"old": "Old Title", "new": "Software Engineering Intern"}
+    
+    # Only the insert moves a bucket; updates stay in theirs
+    assert list(deltas[0].values()) == [1]
+    assert statements[-1][0] == "TRUNCATE jobs_staging"
+    assert loader.job_buffer == []
+
+
+
+def test_duplicates_staged_in_order_and_last_one_versioned(monkeypatch):
+    """Test duplicates get increasing seq and the version uses the last one, which the merge keeps."""
+    job_id = uuid.uuid4()
+    statements = []
+    connection = _fake_connection(
+        [_merge_row(job_id, "1", inserted=False, changed=True, title="Old Title")], statements
+    )
+    db = MagicMock()
+    db.connection.return_value = connection
+    monkeypatch.setattr(bulk_loader, "apply_rollup_deltas", lambda conn, counter: None)
+    
+    loader = BulkJobLoader(db)
+    for title in ("First Title", "Middle Title", "Last Title"):
+        loader.add_job(_job("1", title=title), "software_engineering", [])
+    loader.flush()
+    
+    copy = connection.connection.driver_connection.cursor.return_value.__enter__.return_value
+    assert copy.copy.call_args.args[0].endswith(", seq) FROM STDIN")
+    staged = [call.args[0] for call in copy.copy.return_value.__enter__.return_value.write_row.call_args_list]
+    assert [row[-1] for row in staged] == [0, 1, 2]
+    assert [row[COPY_COLUMNS.index("title")] for row in staged] == ["First Title", "Middle Title", "Last Title"]
+    
+    (version,) = next(args for sql, args in statements if sql.startswith("INSERT INTO job_versions"))[0]
+    assert version["diff_json"]["title"] == {"old": "Old Title", "new": "Last Title"}
@@ -0,0 +1,114 @@
+"""Tests for the API response cache."""
+
+import asyncio
+import threading
+
+from starlette.requests import Request
+
+from src.app import cache
+from src.app.cache import MemoryCacheBackend, etag_matches, make_etag
+
+
+def test_lru_evicts_least_recently_used():
+    """Test the in-process cache keeps the most recently used entries."""
+    cache = MemoryCacheBackend(max_entries=2)
+    cache.set("a", ('"1"', b"a"))
+    cache.set("b", ('"2"', b"b"))
+    cache.get("a")
+    cache.set("c", ('"3"', b"c"))
+    
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_etag_matching():
+    """Test If-None-Match handling."""
+    etag = make_etag(b'{"total":1}')
+    
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches(make_etag(b'{"total":2}'), etag)
+
+
+def test_async_endpoint_served_from_cache(monkeypatch):
+    """Test async endpoints run once per generation and answer 304 on a matching ETag."""
+    monkeypatch.setattr(cache, "response_cache", MemoryCacheBackend())
+    calls = []
+    
+    class FakeAsyncSession:
+        async def run_sync(self, fn, *args, **kwargs):
+            return 7  # data generation
+    
+    @cache.cached_endpoint()
+    async def endpoint(request, db):
+        calls.append(1)
+        return {"total": 1}
+    
+    def request(headers=()):
+        scope = {"type": "http", "method": "GET", "path": "/jobs", "query_string": b"", "headers": list(headers)}
+        return Request(scope)
+    
+    first = asyncio.run(endpoint(request=request(), db=FakeAsyncSession()))
+    etag = first.headers["etag"]
+    second = asyncio.run(endpoint(request=request([(b"if-none-match", etag.encode())]), db=FakeAsyncSession()))
+    
+    assert first.body == b'{"total":1}'
+    assert second.status_code == 304
+    assert len(calls) == 1
+
+
+def test_regions_do_not_share_entries(monkeypatch):
+    """Test API instances for different regions never serve each other's responses."""
+    monkeypatch.setattr(cache, "response_cache", MemoryCacheBackend())  # stands in for shared Redis
+    
+    class FakeAsyncSession:
+        async def run_sync(self, fn, *args, **kwargs):
+            return 7  # same database, same generation
+    
+    @cache.cached_endpoint()
+    async def endpoint(request, db):
+        return {"region": cache.CACHE_REGION}
+    
+    def call(region):
+        monkeypatch.setattr(cache, "CACHE_REGION", region)
+        scope = {"type": "http", "method": "GET", "path": "/stats", "query_string": b"", "headers": []}
+        return asyncio.run(endpoint(request=Request(scope), db=FakeAsyncSession())).body
+    
+    assert call("us") == b'{"region":"us"}'
+    assert call("india") == b'{"region":"india"}'
+    assert call("us") == b'{"region":"us"}'
+
+
+def test_blocking_backend_called_off_the_event_loop(monkeypatch):
+    """Test async endpoints run network-backed cache calls in the threadpool."""
+    threads = []
+    
+    class FakeRedisBackend(MemoryCacheBackend):
+        blocking = True
+        
+        def get(self, key):
+            threads.append(threading.current_thread())
+            return super().get(key)
+        
+        def set(self, key, entry):
+            threads.append(threading.current_thread())
+            super().set(key, entry)
+    
+    monkeypatch.setattr(cache, "response_cache", FakeRedisBackend())
+    
+    class FakeAsyncSession:
+        async def run_sync(self, fn, *args, **kwargs):
+            return 7
+    
+    @cache.cached_endpoint()
+    async def endpoint(request, db):
+        return {"total": 1}
+    
+    scope = {"type": "http", "method": "GET", "path": "/stats", "query_string": b"", "headers": []}
+    asyncio.run(endpoint(request=Request(scope), db=FakeAsyncSession()))
+    
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
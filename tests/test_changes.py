@@ -0,0 +1,53 @@
+"""Tests for delta-sync change cursors."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.changes import decode_change_cursor, encode_change_cursor, get_changes
+
+
+def test_change_cursor_roundtrip():
+    """Test cursors decode back to the sequence value; empty means start."""
+    assert decode_change_cursor(encode_change_cursor(42)) == 42
+    assert decode_change_cursor(None) == 0
+    assert decode_change_cursor("") == 0
+
+
+@pytest.mark.parametrize("cursor", ["abc", "-1", "1.5"])
+def test_invalid_change_cursor(cursor):
+    """Test malformed cursors are rejected."""
+    with pytest.raises(ValueError):
+        decode_change_cursor(cursor)
+
+
+def _changes_db(rows):
+    """Build a fake session returning rows from the change query."""
+    db = MagicMock()
+    query = db.query.return_value.filter.return_value.filter.return_value
+    query.order_by.return_value.limit.return_value.all.return_value = rows
+    return db
+
+
+def test_changes_split_upserts_and_closed():
+    """Test active rows are upserts, inactive rows are closed IDs."""
+    rows = [
+        SimpleNamespace(id="a", is_active=True, change_seq=5),
+        SimpleNamespace(id="b", is_active=False, change_seq=6),
+        SimpleNamespace(id="c", is_active=True, change_seq=7),
+    ]
+    
+    changes = get_changes(_changes_db(rows), since=4, country="us", limit=2)
+    
+    assert changes["has_more"] is True
+    assert changes["cursor"] == 6
+    assert [row.id for row in changes["upserts"]] == ["a"]
+    assert changes["closed"] == ["b"]
+
+
+def test_no_changes_keeps_cursor():
+    """Test an empty result leaves the client's cursor where it was."""
+    changes = get_changes(_changes_db([]), since=9, country="us")
+    
+    assert changes == {"cursor": 9, "has_more": False, "upserts": [], "closed": []}
@@ -0,0 +1,74 @@
+"""Tests for incremental delta exports."""
+
+import csv
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+from src.utils import delta_export
+from src.utils.delta_export import CsvDeltaLog
+
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerows(rows)
+
+
+def _read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def test_compact_merges_deltas_in_order(tmp_path, monkeypatch):
+    """Test compaction applies deltas oldest first and drops closed jobs."""
+    db = MagicMock()
+    db.get.return_value = None  # no snapshot merged yet
+    
+    @contextmanager
+    def fake_db_context():
+        yield db
+    
+    monkeypatch.setattr(delta_export, "get_db_context", fake_db_context)
+    
+    _write_csv(tmp_path / "jobs_delta_000000000000_000000000005.csv", [
+        ["Change", "ID", "Title"],
+        ["inserted", "1", "Intern"],
+        ["inserted", "2", "Co-op"],
+    ])
+    _write_csv(tmp_path / "jobs_delta_000000000005_000000000009.csv", [
+        ["Change", "ID", "Title"],
+        ["updated", "1", "SWE Intern"],
+        ["closed", "2", "Co-op"],
+        ["inserted", "3", "ML Intern"],
+    ])
+    
+    log = CsvDeltaLog("jobs", tmp_path, header=["ID", "Title"], columns=(), format_row=list, keep_closed=False)
+    snapshot = log.compact()
+    
+    assert _read_csv(snapshot) == [["ID", "Title"], ["1", "SWE Intern"], ["3", "ML Intern"]]
+    assert log.delta_files() == []
+
+
+def test_compact_reshapes_files_written_with_an_older_header(tmp_path, monkeypatch):
+    """Test a dropped column disappears from snapshot and delta rows written before."""
+    db = MagicMock()
+    db.get.return_value = MagicMock(snapshot_seq=5)
+    
+    @contextmanager
+    def fake_db_context():
+        yield db
+    
+    monkeypatch.setattr(delta_export, "get_db_context", fake_db_context)
+    
+    _write_csv(tmp_path / "jobs.csv", [
+        ["ID", "Title", "Last Seen"],
+        ["1", "Intern", "2026-10-01"],
+    ])
+    _write_csv(tmp_path / "jobs_delta_000000000005_000000000009.csv", [
+        ["Change", "ID", "Title", "Last Seen"],
+        ["inserted", "2", "Co-op", "2026-10-02"],
+    ])
+    
+    log = CsvDeltaLog("jobs", tmp_path, header=["ID", "Title"], columns=(), format_row=list)
+    snapshot = log.compact()
+    
+    assert _read_csv(snapshot) == [["ID", "Title"], ["1", "Intern"], ["2", "Co-op"]]
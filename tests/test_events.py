@@ -0,0 +1,48 @@
+"""Tests for server-sent event fan-out."""
+
+import asyncio
+import json
+
+from src.app.events import EventBroker, event_stream, format_sse
+
+
+class _Client:
+    """Stand-in request that disconnects after a number of checks."""
+    
+    def __init__(self, checks: int):
+        self.checks = checks
+    
+    async def is_disconnected(self) -> bool:
+        self.checks -= 1
+        return self.checks < 0
+
+
+def test_format_sse():
+    """Test events are framed as event/data lines ending in a blank line."""
+    chunk = format_sse("jobs_new", {"count": 3})
+    
+    assert chunk.startswith("event: jobs_new\n")
+    assert chunk.endswith("\n\n")
+    assert json.loads(chunk.split("data: ", 1)[1]) == {"count": 3}
+
+
+def test_broker_fans_out_to_stream(monkeypatch):
+    """Test a published event reaches a subscribed stream, which then unsubscribes."""
+    broker = EventBroker("postgresql://unused")
+    monkeypatch.setattr(broker, "_listen", lambda: None)
+    
+    async def consume():
+        stream = event_stream(_Client(checks=1), broker)
+        assert await stream.__anext__() == "retry: 5000\n\n"
+        
+        pending = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0)
+        broker.publish_local("run_finished", {"jobs_new": 2})
+        chunk = await pending
+        await stream.aclose()
+        return chunk
+    
+    chunk = asyncio.run(consume())
+    
+    assert chunk == format_sse("run_finished", {"jobs_new": 2})
+    assert not broker._subscribers
@@ -0,0 +1,52 @@
+"""Tests for the streaming Excel exporter."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+from openpyxl import load_workbook
+
+from src.utils.excel_exporter import ExcelExporter
+
+
+def _job(company: str, category: str | None) -> SimpleNamespace:
+    """Build a fake export row."""
+    return SimpleNamespace(
+        company=company, title="Software Engineer Intern", location=None, category=category,
+        employment_type="internship", posted_at=None, first_seen_at=datetime(2025, 9, 1, 9, 30),
+        url="https://example.com", source="greenhouse", tags=["python"], visa_sponsorship=True,
+        tech_stack={"languages": ["Python", "Go"]}, compensation_min=None, compensation_max=None,
+        start_date=None, duration=None, application_status=None, notes=None,
+    )
+
+
+def test_export_all_writes_both_workbooks_in_one_pass(tmp_path, monkeypatch):
+    """Test one scan produces the all-jobs sheet and per-category sheets."""
+    rows = [_job("Acme", "swe"), _job("Globex", None), _job("Initech", "swe")]
+    scans = []
+    
+    def stream(self):
+        scans.append(1)
+        return iter(rows)
+    
+    monkeypatch.setattr(ExcelExporter, "_stream_active_jobs", stream)
+    
+    jobs_path, category_path = ExcelExporter(str(tmp_path)).export_all("all", "by_category")
+    
+    assert len(scans) == 1
+    
+    jobs_sheet = load_workbook(jobs_path)["Jobs"]
+    assert jobs_sheet["A1"].value == "Company"
+    assert [cell.value for cell in jobs_sheet["A"][1:]] == ["Acme", "Globex", "Initech"]
+    assert jobs_sheet["L2"].value == "Python, Go"
+    
+    by_category = load_workbook(category_path)
+    assert by_category.sheetnames == ["swe", "Uncategorized"]
+    assert by_category["swe"].max_row == 3
+
+
+def test_export_all_without_jobs(tmp_path, monkeypatch):
+    """Test nothing is written when there are no active jobs."""
+    monkeypatch.setattr(ExcelExporter, "_stream_active_jobs", lambda self: iter([]))
+    
+    assert ExcelExporter(str(tmp_path)).export_all() == (None, None)
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,105 @@
+"""Tests for streaming job exports."""
+
+import csv
+import io
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+
+import src.app.export as export
+from src.app.export import EXPORT_FIELDS, stream_csv, stream_ndjson, stream_parquet
+from src.core.database import API_SYNC_CONNECTIONS, MAX_OVERFLOW, POOL_SIZE
+
+
+def _row(company: str, tags: list[str]) -> tuple:
+    """Build a fake export row in EXPORT_FIELDS order."""
+    seen = datetime(2025, 9, 1, 12, 0)
+    return (
+        uuid.uuid4(), company, "Software Engineer Intern", "New York, NY", "swe", "us",
+        "internship", tags, "https://example.com/job", "greenhouse", None, seen, seen, True,
+    )
+
+
+BATCHES = [[_row("Acme", ["python", "ml"]), _row("Globex", [])], [_row("Initech", ["go"])]]
+
+
+def test_csv_streams_header_then_one_chunk_per_batch():
+    """Test CSV output has a header and every row, with tags joined."""
+    chunks = list(stream_csv(iter(BATCHES)))
+    
+    assert len(chunks) == 1 + len(BATCHES)
+    rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+    assert [row["company"] for row in rows] == ["Acme", "Globex", "Initech"]
+    assert rows[0]["tags"] == "python, ml"
+    assert rows[0]["first_seen_at"] == "2025-09-01T12:00:00"
+
+
+def test_ndjson_one_object_per_line():
+    """Test NDJSON output is one JSON object per job."""
+    lines = b"".join(stream_ndjson(iter(BATCHES))).decode().splitlines()
+    
+    records = [json.loads(line) for line in lines]
+    assert [record["company"] for record in records] == ["Acme", "Globex", "Initech"]
+    assert set(records[0]) == set(EXPORT_FIELDS)
+    assert records[0]["tags"] == ["python", "ml"]
+    assert records[0]["posted_at"] is None
+
+
+def test_parquet_roundtrip():
+    """Test streamed Parquet chunks form a readable file."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    
+    data = b"".join(stream_parquet(iter(BATCHES)))
+    table = pq.read_table(io.BytesIO(data))
+    
+    assert table.num_rows == 3
+    assert table.column("company").to_pylist() == ["Acme", "Globex", "Initech"]
+
+
+def test_api_engines_share_one_connection_budget():
+    """Test the async pool plus the API's other connections fit one process budget."""
+    from src.core.async_database import API_RESERVED_CONNECTIONS, async_engine
+    
+    pool = async_engine.pool
+    assert pool.size() + pool._max_overflow + API_RESERVED_CONNECTIONS == POOL_SIZE + MAX_OVERFLOW
+
+
+def test_export_slots_are_taken_up_front_and_released(monkeypatch):
+    """Test exports over the cap get no slot, and slots come back when streams end."""
+    monkeypatch.setattr(export, "stream_batches", lambda stmt, batch_size: iter(BATCHES))
+    
+    slots = [export.acquire_export_slot() for _ in range(API_SYNC_CONNECTIONS)]
+    assert None not in slots
+    assert export.acquire_export_slot() is None
+    
+    # Finished stream, stream closed mid-way, and a response that never started
+    assert list(export.iter_export_batches(None, slots[0])) == BATCHES
+    started = export.iter_export_batches(None, slots[1])
+    next(started)
+    export.close_export(started, slots[1])
+    export.close_export(export.iter_export_batches(None, slots[2]), slots[2])
+    slots[2].release()
+    for slot in slots[3:]:
+        slot.release()
+    
+    again = [export.acquire_export_slot() for _ in range(API_SYNC_CONNECTIONS)]
+    assert None not in again
+    assert export.acquire_export_slot() is None
+    for slot in again:
+        slot.release()
+
+
+def test_export_endpoint_answers_503_when_busy(monkeypatch):
+    """Test a busy server refuses the export before any bytes are sent."""
+    from fastapi import HTTPException
+    
+    from src.app.main import export_jobs
+    
+    monkeypatch.setattr("src.app.main.acquire_export_slot", lambda: None)
+    with pytest.raises(HTTPException) as error:
+        export_jobs(fmt="csv", company=None, category=None, is_active=True)
+    
+    assert error.value.status_code == 503
+    assert error.value.headers["Retry-After"] == str(export.EXPORT_RETRY_AFTER)
@@ -0,0 +1,43 @@
+"""Tests for buffered source health recording."""
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from src.ingest import health_monitor
+from src.ingest.health_monitor import HealthMonitor, health_upsert
+
+
+def test_observations_are_flushed_in_one_upsert(monkeypatch):
+    """Test buffered observations merge per source and go out in one statement."""
+    db = MagicMock()
+    
+    @contextmanager
+    def fake_db_context():
+        yield db
+    
+    monkeypatch.setattr(health_monitor, "get_db_context", fake_db_context)
+    monitor = HealthMonitor(flush_interval=None)
+    
+    monitor.record_failure("Stripe", "greenhouse", "https://stripe.example", "timeout")
+    monitor.record_success("Stripe", "greenhouse", "https://stripe.example", jobs_found=4)
+    monitor.record_failure("Stripe", "greenhouse", "https://stripe.example", "HTTP 503")
+    monitor.record_success("Airbnb", "greenhouse", "https://airbnb.example", jobs_found=0)
+    assert not db.execute.called
+    
+    assert monitor.flush() == 2
+    assert db.execute.call_count == 1
+    airbnb, stripe = db.execute.call_args.args[1]
+    assert airbnb["status"] == "healthy_no_jobs"
+    assert (stripe["success_count"], stripe["failure_count"], stripe["status"]) == (1, 1, "unstable")
+    assert stripe["last_error"] == "HTTP 503" and stripe["last_success"] is not None
+    assert monitor.flush() == 0
+
+
+def test_upsert_continues_failure_streak_on_conflict():
+    """Test the upsert targets (company, ats_type) and adds failures to the stored streak."""
+    sql = str(health_upsert().compile(dialect=postgresql.dialect()))
+    
+    assert "ON CONFLICT (company, ats_type) DO UPDATE" in sql
+    assert "coalesce(url_health.failure_count" in sql
@@ -0,0 +1,50 @@
+"""Tests for the notification outbox."""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from src.ingest import notification_outbox
+from src.ingest.notification_outbox import enqueue_alerts
+
+
+def test_enqueue_alerts_one_insert_per_run():
+    """Test alerts for every job and channel go out in a single INSERT."""
+    db = MagicMock()
+    new_ids, updated_ids = [uuid.uuid4(), uuid.uuid4()], [uuid.uuid4()]
+    
+    queued = enqueue_alerts(db, new_ids, updated_ids, run_id=uuid.uuid4(), channels=["email", "slack"])
+    
+    inserts = [c for c in db.execute.call_args_list if len(c.args) == 2]
+    assert queued == 6
+    assert len(inserts) == 1
+    rows = inserts[0].args[1]
+    assert {row["status"] for row in rows} == {"pending"}
+    assert sorted(row["alert_type"] for row in rows if row["sent_via"] == "email") == ["new", "new", "updated"]
+
+
+def test_failed_delivery_backs_off_and_stops(monkeypatch):
+    """Test a failing channel schedules a retry and does not claim more alerts."""
+    alerts = [SimpleNamespace(id=uuid.uuid4(), job_id=uuid.uuid4(), alert_type="new", alert_metadata=None)]
+    claims = iter([alerts, alerts])
+    retried = []
+    
+    monkeypatch.setitem(notification_outbox.CHANNELS, "email", (lambda *args: False, 10, 1))
+    monkeypatch.setattr(notification_outbox, "_claim", lambda channel, limit: next(claims))
+    monkeypatch.setattr(notification_outbox, "_load_context", lambda alerts: ([], []))
+    monkeypatch.setattr(notification_outbox, "_schedule_retry", lambda alerts, error: retried.append(alerts) or 0)
+    
+    assert notification_outbox.deliver_pending(["email"]) == {"email": {"failed": 0, "retried": 1}}
+    assert retried == [alerts]
+
+
+def test_enqueue_skips_jobs_in_cooldown():
+    """Test cooldowns are resolved with one query for the whole job set."""
+    blocked_id, fresh_id = uuid.uuid4(), uuid.uuid4()
+    db = MagicMock()
+    db.execute.side_effect = [iter([SimpleNamespace(job_id=blocked_id, sent_via="email")]), None, MagicMock()]
+    
+    queued = enqueue_alerts(db, [blocked_id, fresh_id], [], channels=["email"])
+    
+    assert queued == 1
+    assert db.execute.call_args_list[1].args[1][0]["job_id"] == fresh_id
@@ -0,0 +1,40 @@
+"""Tests for keyset pagination cursors."""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from src.app.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_roundtrip():
+    """Test a cursor decodes to the values it was built from."""
+    posted_at = datetime(2025, 11, 1, 12, 30, tzinfo=timezone.utc)
+    job_id = uuid.uuid4()
+    
+    assert decode_cursor(encode_cursor(posted_at, job_id)) == (posted_at, job_id)
+
+
+def test_cursor_without_posted_at():
+    """Test jobs without a posted date still produce a usable cursor."""
+    job_id = uuid.uuid4()
+    
+    assert decode_cursor(encode_cursor(None, job_id)) == (None, job_id)
+
+
+def test_invalid_cursor():
+    """Test malformed cursors are rejected."""
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_list_jobs_defaults_keep_exact_total_and_limit_cap():
+    """Test /jobs keeps exact totals by default and the 100 row page cap."""
+    import inspect
+    
+    from src.app.main import list_jobs
+    
+    params = inspect.signature(list_jobs).parameters
+    assert params["count"].default.default == "exact"
+    assert any(getattr(meta, "le", None) == 100 for meta in params["limit"].default.metadata)
@@ -0,0 +1,42 @@
+"""Tests for raw_data retention policies."""
+
+from src.ingest.retention import RawDataRetention
+
+CONFIG = {
+    "default": {"mode": "keep"},
+    "sources": {
+        "greenhouse": {"mode": "project", "fields": ["id", "updated_at"]},
+        "lever": {"mode": "drop"},
+    },
+}
+
+
+def test_project_keeps_whitelisted_fields():
+    """Test projection drops fields outside the whitelist."""
+    retention = RawDataRetention(CONFIG)
+    raw = {"id": 1, "updated_at": "2025-01-01", "content": "<p>Long HTML</p>"}
+    
+    assert retention.project("greenhouse", raw) == {"id": 1, "updated_at": "2025-01-01"}
+
+
+def test_drop_mode():
+    """Test drop mode stores nothing."""
+    retention = RawDataRetention(CONFIG)
+    
+    assert retention.project("lever", {"id": "abc", "lists": []}) is None
+
+
+def test_default_keeps_payload():
+    """Test unknown sources fall back to the default policy."""
+    retention = RawDataRetention(CONFIG)
+    raw = {"job_id": "x"}
+    
+    assert retention.project("workday", raw) == raw
+
+
+def test_empty_payload():
+    """Test empty payloads are not stored."""
+    retention = RawDataRetention(CONFIG)
+    
+    assert retention.project("workday", {}) is None
+    assert retention.project("greenhouse", {"content": "<p/>"}) is None
@@ -0,0 +1,44 @@
+"""Tests for stats rollup bucket bookkeeping."""
+
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from src.core.rollup import NO_VALUE, bucket_for, move_bucket, reconcile_rollup
+
+
+def test_bucket_uses_utc_day_and_sentinels():
+    """Test NULL values and timezones are normalized in bucket keys."""
+    seen = datetime(2025, 11, 2, 1, 0, tzinfo=timezone(timedelta(hours=5)))
+    
+    country, company, category, day, active = bucket_for(None, "Acme", None, seen, None)
+    
+    assert (country, category) == (NO_VALUE, NO_VALUE)
+    assert day.isoformat() == "2025-11-01"
+    assert active is False
+
+
+def test_move_bucket():
+    """Test inserts add, moves transfer and no-op moves are ignored."""
+    seen = datetime(2025, 11, 1)
+    ml = bucket_for("us", "Acme", "ml_ai", seen, True)
+    swe = bucket_for("us", "Acme", "swe", seen, True)
+    deltas = Counter()
+    
+    move_bucket(deltas, None, ml)
+    move_bucket(deltas, None, ml)
+    move_bucket(deltas, ml, swe)
+    move_bucket(deltas, swe, swe)
+    
+    assert deltas == Counter({ml: 1, swe: 1})
+
+
+def test_reconcile_locks_rollup_before_reading():
+    """Test reconciliation blocks rollup writers before it counts jobs and reads the rollup."""
+    db = MagicMock()
+    
+    assert reconcile_rollup(db) == 0
+    
+    name, args, _ = db.mock_calls[0]
+    assert name == "execute"
+    assert str(args[0]) == "LOCK TABLE job_stats_rollup IN SHARE ROW EXCLUSIVE MODE"
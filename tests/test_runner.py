@@ -0,0 +1,63 @@
+"""Tests for run bookkeeping in the pipeline runner."""
+
+import uuid
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.ingest import runner
+from src.ingest.runner import JobTrackerRunner
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """Runner with one target and the database calls replaced by recorders."""
+    finished = []
+    watchlist = {"targets": [{"company": "Stripe", "ats_type": "greenhouse"}]}
+    
+    @contextmanager
+    def fake_db_context():
+        yield MagicMock()
+    
+    monkeypatch.setattr(runner, "get_config_loader", lambda: SimpleNamespace(load_watchlist=lambda: watchlist))
+    monkeypatch.setattr(runner, "start_run", lambda country: uuid.uuid4())
+    monkeypatch.setattr(runner, "finish_run", lambda *args, **kwargs: finished.append((args, kwargs)))
+    monkeypatch.setattr(runner, "HealthMonitor", MagicMock())
+    monkeypatch.setattr(runner, "get_db_context", fake_db_context)
+    monkeypatch.setattr(runner, "request_delivery", lambda: "off")
+    
+    tracker = JobTrackerRunner(max_workers=1, export=False)
+    target_stats = {"jobs_fetched": 1, "jobs_new": 1, "jobs_updated": 0, "fetch_error": None}
+    monkeypatch.setattr(tracker, "_process_target_safe", lambda *args: (dict(target_stats), [uuid.uuid4()], []))
+    return tracker, finished
+
+
+def test_run_failure_closes_run_with_error(pipeline, monkeypatch):
+    """Test an error after start_run still finishes the run, marked failed."""
+    tracker, finished = pipeline
+    
+    def broken_enqueue(*args, **kwargs):
+        raise RuntimeError("database unavailable")
+    
+    monkeypatch.setattr(runner, "enqueue_alerts", broken_enqueue)
+    
+    with pytest.raises(RuntimeError):
+        tracker.run()
+    
+    (args, kwargs), = finished
+    assert kwargs["error"] == "database unavailable"
+    assert len(args[2]) == 1  # the target that completed is still recorded
+
+
+def test_run_success_closes_run_without_error(pipeline, monkeypatch):
+    """Test a normal run is finished once, without an error."""
+    tracker, finished = pipeline
+    monkeypatch.setattr(runner, "enqueue_alerts", lambda *args, **kwargs: 1)
+    
+    stats = tracker.run()
+    
+    assert stats["notifications_sent"] == 1
+    (args, kwargs), = finished
+    assert kwargs["error"] is None
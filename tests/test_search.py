@@ -0,0 +1,44 @@
+"""Tests for full-text search query building."""
+
+from src.core.search import build_tsquery, escape_like
+
+
+def test_words_are_anded_with_prefix_matching():
+    """Test every word is required and prefix-matched."""
+    assert build_tsquery("Machine Learn") == "machine:* & learn:*"
+
+
+def test_operators_are_stripped():
+    """Test tsquery syntax in user input cannot break the query."""
+    assert build_tsquery("c++ & (ml | !ai):*") == "c:* & ml:* & ai:*"
+    assert build_tsquery("data_eng", prefix=False) == "data & eng"
+
+
+def test_empty_query():
+    """Test text without words yields no query."""
+    assert build_tsquery("  &| ") is None
+
+
+def test_like_wildcards_are_escaped():
+    """Test substring filters match % and _ literally."""
+    assert escape_like("100%_remote") == "100\\%\\_remote"
+
+
+def test_search_defaults_to_the_api_region(monkeypatch):
+    """Test /search stays in this API's region unless all countries are asked for."""
+    import asyncio
+    
+    from src.app import cache, main
+    
+    monkeypatch.setattr(cache, "response_cache", None)
+    searched = []
+    
+    class FakeAsyncSession:
+        async def run_sync(self, fn, *args, **kwargs):
+            searched.append(kwargs["country"])
+            return {"total": 0, "facets": {}, "results": []}
+    
+    asyncio.run(main.search(request=None, q="intern", db=FakeAsyncSession()))
+    asyncio.run(main.search(request=None, q="intern", country=main.ALL_COUNTRIES, db=FakeAsyncSession()))
+    
+    assert searched == [main.REGION, None]
@@ -0,0 +1,40 @@
+"""Tests for the paced Slack sender and digest packing."""
+
+from types import SimpleNamespace
+
+from src.utils.notifiers import SLACK_JOBS_PER_MESSAGE, build_slack_digest
+from src.utils.slack_sender import PacedWebhookSender
+
+
+def test_rate_limited_message_is_retried_after_retry_after():
+    """Test a 429 pauses the queue and the message is posted on the next attempt."""
+    responses = iter([
+        SimpleNamespace(status_code=429, headers={"Retry-After": "0"}, text=""),
+        SimpleNamespace(status_code=200, headers={}, text="ok"),
+        SimpleNamespace(status_code=200, headers={}, text="ok"),
+    ])
+    posted = []
+    
+    def fake_post(url, json, timeout):
+        posted.append(json["text"])
+        return next(responses)
+    
+    sender = PacedWebhookSender("https://hooks.example/x", min_interval=0, post=fake_post)
+    
+    assert sender.send_all([{"text": "a"}, {"text": "b"}])
+    assert posted == ["a", "a", "b"]
+
+
+def test_digest_respects_block_limit():
+    """Test large job sets are split into messages of at most 50 blocks."""
+    jobs = [
+        SimpleNamespace(company="Stripe", title=f"Intern <{i}>", location=None, category="swe", url=f"https://x/{i}")
+        for i in range(SLACK_JOBS_PER_MESSAGE + 5)
+    ]
+    
+    messages = build_slack_digest(jobs, ["Stripe"], new_count=len(jobs))
+    
+    assert len(messages) == 2
+    assert all(len(message["blocks"]) <= 50 for message in messages)
+    assert messages[1]["text"].endswith("(2/2)")
+    assert "&lt;0&gt;" in messages[0]["blocks"][2]["text"]["text"]
@@ -0,0 +1,68 @@
+"""Tests for SMTP session reuse and digest size capping, against the local sink."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+from src.utils.notifiers import EMAIL_CSV_FILENAME, EmailNotifier
+from src.utils.smtp_sender import SmtpSession
+from src.utils.smtp_sink import SmtpSink
+
+
+def _jobs(count: int) -> list:
+    return [
+        SimpleNamespace(
+            company=f"Company {i % 3}",
+            title=f"Software Intern <{i}>",
+            location="Remote",
+            category="software_engineering",
+            url=f"https://jobs.example/{i}",
+            source="greenhouse",
+            posted_at=datetime(2026, 10, 1),
+            tags=None,
+        )
+        for i in range(count)
+    ]
+
+
+def _notifier(sink: SmtpSink) -> tuple[EmailNotifier, SmtpSession]:
+    session = SmtpSession(sink.host, sink.port, user="user", password="pass", starttls=False)
+    notifier = EmailNotifier(session=session)
+    notifier.smtp_from = "tracker@example.com"
+    notifier.smtp_to = "me@example.com"
+    return notifier, session
+
+
+def test_messages_share_one_connection_and_survive_disconnect():
+    """Test consecutive sends reuse the connection and a dropped one is reopened."""
+    with SmtpSink() as sink:
+        notifier, session = _notifier(sink)
+        
+        assert notifier.send_batch(_jobs(3), ["Company 0"], new_count=3)
+        assert notifier.send(_jobs(1)[0])
+        assert sink.connections == 1
+        
+        session._smtp.close()
+        assert notifier.send(_jobs(1)[0])
+        session.close()
+    
+    assert sink.connections == 2
+    assert len(sink.messages) == 3
+    html = sink.messages[0].get_body(preferencelist=("html",)).get_content()
+    assert "Software Intern &lt;0&gt;" in html
+
+
+def test_large_digest_is_capped_with_csv_attachment():
+    """Test a digest over the HTML budget lists what fits and attaches every job."""
+    with SmtpSink() as sink:
+        notifier, session = _notifier(sink)
+        assert notifier.send_batch(_jobs(1000), new_count=1000)
+        session.close()
+    
+    message = sink.messages[0]
+    attachments = list(message.iter_attachments())
+    assert [part.get_filename() for part in attachments] == [EMAIL_CSV_FILENAME]
+    assert len(attachments[0].get_content().splitlines()) == 1001
+    
+    html = message.get_body(preferencelist=("html",)).get_content()
+    assert len(html.encode()) <= 100_000
+    assert "Showing the first" in html
@@ -0,0 +1,52 @@
+"""Tests for the Parquet snapshot store."""
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from src.utils.snapshot_store import JOB_FIELDS, read_snapshot, snapshot_dates, write_partitions
+
+
+def _job_row(country, company):
+    """Result row in snapshot column order (country first)."""
+    seen = datetime(2026, 10, 18, 12, tzinfo=timezone.utc)
+    return (country, uuid.uuid4(), company, "SWE Intern", None, "Software Engineering", None,
+            ["intern"], "greenhouse", None, None, None, None, seen, seen, True)
+
+
+def test_partitions_written_per_country_and_pruned_on_read(tmp_path):
+    """Test rows land in country/date partitions and filters prune them."""
+    day = date(2026, 10, 18)
+    batches = [
+        [_job_row("india", "Flipkart"), _job_row("us", "Stripe")],
+        [_job_row("us", "Datadog")],
+    ]
+    
+    assert write_partitions(tmp_path, "jobs", day, JOB_FIELDS, batches) == 3
+    assert (tmp_path / "jobs" / "country=us" / "date=2026-10-18" / "part-0.parquet").exists()
+    assert snapshot_dates(root=tmp_path) == [day]
+    
+    us = read_snapshot(country="us", start=day, end=day, columns=["company", "country"], root=tmp_path)
+    assert sorted(us.column("company").to_pylist()) == ["Datadog", "Stripe"]
+    assert set(us.column("country").to_pylist()) == {"us"}
+    
+    # Re-writing the day replaces its partitions, dropping countries with no rows
+    write_partitions(tmp_path, "jobs", day, JOB_FIELDS, [[_job_row("us", "Stripe")]])
+    assert read_snapshot(root=tmp_path).num_rows == 1
+
+
+def test_backfill_of_past_days_skips_jobs(tmp_path, monkeypatch):
+    """Test days before yesterday get job_versions only, never current job rows."""
+    from src.utils import snapshot_store
+    
+    monkeypatch.setattr(snapshot_store, "stream_batches", lambda stmt, batch_size: [])
+    old_day = datetime.now(timezone.utc).date() - timedelta(days=3)
+    yesterday = datetime.now(timezone.utc).date() - timedelta(days=1)
+    
+    assert snapshot_store.write_snapshot(old_day, root=tmp_path) == {"job_versions": 0}
+    assert snapshot_store.write_snapshot(yesterday, root=tmp_path) == {"jobs": 0, "job_versions": 0}
+    with pytest.raises(ValueError):
+        snapshot_store.write_snapshot(old_day, root=tmp_path, datasets=("jobs",))
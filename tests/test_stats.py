@@ -0,0 +1,40 @@
+"""Tests for the shared stats service."""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from src.core.stats import get_job_stats
+
+
+def _row(by_company, by_category, company=None, category=None, total=0, active=0, **extra):
+    """Build a fake grouping-sets result row."""
+    values = dict(new_day=0, new_week=0, applied=0, interviewing=0, first_seen=None, last_seen=None)
+    values.update(extra)
+    return SimpleNamespace(
+        by_company=by_company, by_category=by_category, company=company, category=category,
+        total=total, active=active, **values,
+    )
+
+
+def test_grouping_sets_are_split_into_breakdowns():
+    """Test grand total, company and category rows land in the right fields."""
+    first = datetime(2025, 9, 1)
+    rows = [
+        _row(1, 1, total=5, active=3, new_day=1, applied=2, first_seen=first),
+        _row(0, 1, company="Acme", total=3, active=1),
+        _row(0, 1, company="Globex", total=2, active=2),
+        _row(0, 1, company="Initech", total=1, active=0),
+        _row(1, 0, category="ml_ai", total=4, active=3),
+    ]
+    db = MagicMock()
+    db.query.return_value.group_by.return_value.all.return_value = rows
+    
+    stats = get_job_stats(db)
+    
+    assert stats["total_jobs"] == 5
+    assert stats["inactive_jobs"] == 2
+    assert stats["companies"] == 3
+    assert list(stats["jobs_by_company"].items()) == [("Globex", 2), ("Acme", 1)]
+    assert stats["jobs_by_category"] == {"ml_ai": 3}
+    assert stats["first_seen_at"] == first
@@ -0,0 +1,94 @@
+"""Tests for job version diffs."""
+
+from datetime import datetime, timedelta, timezone
+
+from src.ingest.schemas import NormalizedJob
+from src.ingest.versioning import (
+    apply_description_delta,
+    build_version_row,
+    compute_job_diff,
+    description_delta,
+)
+
+
+def test_description_delta_roundtrip():
+    """Test that a delta reproduces the target text."""
+    old = "About us\nWe build things.\nRequirements:\n- Python\n- SQL\n"
+    new = "About us\nWe build great things.\nRequirements:\n- Python\n- SQL\n- Go\n"
+    
+    delta = description_delta(old, new)
+    
+    assert apply_description_delta(old, delta) == new
+    # Only changed lines are stored
+    assert sum(len(lines) for _, _, lines in delta) == 2
+
+
+def test_description_delta_identical():
+    """Test that identical text produces an empty delta."""
+    text = "Line one\nLine two\n"
+    
+    assert description_delta(text, text) == []
+    assert apply_description_delta(text, []) == text
+
+
+def test_compute_job_diff_fields():
+    """Test field-level diff contents."""
+    old = {"title": "SWE Intern", "location": "NYC", "posted_at": datetime(2025, 1, 1)}
+    new = {"title": "SWE Intern", "location": "Boston", "posted_at": datetime(2025, 1, 2)}
+    
+    diff = compute_job_diff(old, new)
+    
+    assert "title" not in diff
+    assert diff["location"] == {"old": "NYC", "new": "Boston"}
+    assert diff["posted_at"]["new"] == "2025-01-02T00:00:00+00:00"
+
+
+def test_compute_job_diff_same_instant_across_time_zones():
+    """Test a naive UTC timestamp and an aware one for the same instant are not a change."""
+    pacific = timezone(timedelta(hours=-7))
+    old = {"posted_at": datetime(2025, 1, 1, 17, 0, tzinfo=pacific)}
+    new = {"posted_at": datetime(2025, 1, 2, 0, 0)}
+    
+    assert "posted_at" not in compute_job_diff(old, new)
+    
+    new["posted_at"] = datetime(2025, 1, 2, 1, 0, tzinfo=timezone.utc)
+    assert compute_job_diff(old, new)["posted_at"] == {
+        "old": "2025-01-02T00:00:00+00:00",
+        "new": "2025-01-02T01:00:00+00:00",
+    }
+
+
+def test_compute_job_diff_description_is_reverse_delta():
+    """Test that the description delta rebuilds the old text from the new one."""
+    old = {"description_md": "Old requirements\n"}
+    new = {"description_md": "New requirements\nMore text\n"}
+    
+    diff = compute_job_diff(old, new)
+    
+    restored = apply_description_delta(new["description_md"], diff["description_md"]["delta"])
+    assert restored == old["description_md"]
+
+
+def test_build_version_row():
+    """Test version row construction."""
+    job = NormalizedJob(
+        source="greenhouse",
+        source_id="123",
+        company="Test Company",
+        title="ML Intern",
+        location="New York, NY",
+        employment_type="internship",
+        posted_at=None,
+        url="https://example.com/job/123",
+        description_md="Same text\n",
+        hash_stable="abc",
+        hash_full="def",
+    )
+    previous = {"title": "Data Intern", "location": "New York, NY", "description_md": "Same text\n"}
+    
+    row = build_version_row("job-1", previous, job, "ml_ai")
+    
+    assert row["job_id"] == "job-1"
+    assert row["hash_full"] == "def"
+    assert row["snapshot"] is None
+    assert set(row["diff_json"]) == {"title", "employment_type", "url", "category"}
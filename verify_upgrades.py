@@ -177,11 +177,12 @@ except Exception as e:
 # Test 7: Check enhanced database models
 print("\n✅ Test 7: Checking enhanced database models...")
 try:
-    from src.core.models import Job
+    from src.core.batch import batch_session
     from sqlalchemy import inspect
     
-    inspector = inspect(Job)
-    columns = [c.name for c in inspector.columns]
+    # Inspect the live table (the ORM model always has the columns)
+    with batch_session() as db:
+        columns = [c["name"] for c in inspect(db.connection()).get_columns("jobs")]
     
     new_columns = [
         'tech_stack', 'required_skills', 'compensation_min', 'compensation_max',